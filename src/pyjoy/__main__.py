@@ -428,7 +428,7 @@ def execute_expression(expr: str) -> int:
     try:
         evaluator.run(expr)
         if not evaluator.stack.is_empty():
-            for item in evaluator.stack.items():
+            for item in evaluator.stack.iter_items():
                 print(repr(item))
         return 0
     except JoyError as e:
@@ -7,11 +7,11 @@ concat, reverse, at, of, drop, take, in, has, enconcat, swoncat
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Tuple, Union
 
 from pyjoy.errors import JoyEmptyAggregate, JoyTypeError
 from pyjoy.stack import ExecutionContext
-from pyjoy.types import JoyQuotation, JoyType, JoyValue
+from pyjoy.types import EMPTY_QUOTATION, FALSE, TRUE, JoyQuotation, JoyType, JoyValue
 
 from .core import is_joy_value, joy_word
 
@@ -57,9 +57,52 @@ def _get_value_type(v: Any) -> str:
     return "OBJECT"
 
 
-def _get_aggregate(v: Any, op: str) -> tuple:
+class _StringView:
+    """
+    Lazy tuple-like view of a string's characters.
+
+    Stands in for the tuple of CHAR JoyValues that a STRING unpacks to:
+    indexing creates a CHAR only for the element accessed, slicing and
+    concatenating two views stay views, and _make_aggregate turns a view
+    back into a string without rebuilding it char by char. Concatenating
+    with a tuple produces a plain tuple.
+    """
+
+    __slots__ = ("s",)
+
+    def __init__(self, s: str) -> None:
+        self.s = s
+
+    def __len__(self) -> int:
+        return len(self.s)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return _StringView(self.s[index])
+        return JoyValue.char(self.s[index])
+
+    def __iter__(self) -> Any:
+        return map(JoyValue.char, self.s)
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, _StringView):
+            return _StringView(self.s + other.s)
+        return tuple(self) + tuple(other)
+
+    def __radd__(self, other: Any) -> tuple:
+        return tuple(other) + tuple(self)
+
+
+# Aggregate contents as returned by _get_aggregate
+_Items = Union[Tuple[Any, ...], _StringView]
+
+
+def _get_aggregate(v: Any, op: str) -> _Items:
     """Extract aggregate contents as tuple (raw terms for quotations).
 
+    A STRING JoyValue gives a _StringView, which behaves like the tuple of
+    its CHAR values.
+
     Mode-aware: handles both JoyValue and raw Python values.
     """
     if is_joy_value(v):
@@ -68,7 +111,7 @@ def _get_aggregate(v: Any, op: str) -> tuple:
         elif v.type == JoyType.QUOTATION:
             return v.value.terms
         elif v.type == JoyType.STRING:
-            return tuple(JoyValue.char(c) for c in v.value)
+            return _StringView(v.value)
         elif v.type == JoyType.SET:
             return tuple(JoyValue.integer(x) for x in sorted(v.value))
         else:
@@ -87,6 +130,18 @@ def _get_aggregate(v: Any, op: str) -> tuple:
             raise JoyTypeError(op, "aggregate", type(v).__name__)
 
 
+def _aggregate_size(v: Any, op: str) -> int:
+    """Get the number of elements of an aggregate without unpacking it."""
+    if is_joy_value(v):
+        if v.type in (JoyType.LIST, JoyType.STRING, JoyType.SET):
+            return len(v.value)
+        elif v.type == JoyType.QUOTATION:
+            return len(v.value.terms)
+        else:
+            raise JoyTypeError(op, "aggregate", v.type.name)
+    return len(_get_aggregate(v, op))
+
+
 def _get_original_type(v: Any) -> JoyType | str:
     """Get the original type for reconstructing aggregates."""
     if is_joy_value(v):
@@ -103,12 +158,17 @@ def _get_original_type(v: Any) -> JoyType | str:
 
 
 def _make_aggregate(
-    items: tuple, original_type: JoyType | str, strict: bool = True
+    items: _Items, original_type: JoyType | str, strict: bool = True
 ) -> Any:
     """Create aggregate from items, matching original type where possible.
 
     Mode-aware: returns JoyValue in strict mode, raw Python in pythonic mode.
     """
+    if isinstance(items, _StringView):
+        if original_type in (JoyType.STRING, "STRING"):
+            return JoyValue.string(items.s) if strict else items.s
+        items = tuple(items)
+
     if strict:
         # Strict mode - return JoyValue
         if original_type in (JoyType.STRING, "STRING"):
@@ -138,7 +198,7 @@ def _make_aggregate(
             except Exception:
                 return JoyValue.list(items)
         elif original_type in (JoyType.QUOTATION, "QUOTATION"):
-            return JoyValue.quotation(JoyQuotation(items))
+            return JoyValue.quotation(JoyQuotation(items) if items else EMPTY_QUOTATION)
         else:
             return JoyValue.list(items)
     else:
@@ -168,7 +228,7 @@ def _make_aggregate(
             except Exception:
                 return list(items)
         elif original_type in (JoyType.QUOTATION, "QUOTATION"):
-            return JoyQuotation(items)
+            return JoyQuotation(items) if items else EMPTY_QUOTATION
         else:
             return list(items)
 
@@ -272,7 +332,7 @@ def unswons(ctx: ExecutionContext) -> None:
 def _push_boolean(ctx: ExecutionContext, result: bool) -> None:
     """Push a boolean result in a mode-appropriate way."""
     if ctx.strict:
-        ctx.stack.push_value(JoyValue.boolean(result))
+        ctx.stack.push_value(TRUE if result else FALSE)
     else:
         ctx.stack.push(result)
 
@@ -297,8 +357,7 @@ def null(ctx: ExecutionContext) -> None:
         elif x.type == JoyType.CHAR:
             result = ord(x.value) == 0
         elif x.type in (JoyType.LIST, JoyType.QUOTATION, JoyType.STRING, JoyType.SET):
-            items = _get_aggregate(x, "null")
-            result = len(items) == 0
+            result = _aggregate_size(x, "null") == 0
         elif x.type == JoyType.FILE:
             result = x.value is None
         else:
@@ -335,8 +394,7 @@ def small(ctx: ExecutionContext) -> None:
         elif x.type == JoyType.CHAR:
             result = ord(x.value) < 2
         elif x.type in (JoyType.LIST, JoyType.QUOTATION, JoyType.STRING, JoyType.SET):
-            items = _get_aggregate(x, "small")
-            result = len(items) <= 1
+            result = _aggregate_size(x, "small") <= 1
         else:
             result = False
     else:
@@ -361,8 +419,7 @@ def small(ctx: ExecutionContext) -> None:
 def size(ctx: ExecutionContext) -> None:
     """Get size of aggregate."""
     agg = ctx.stack.pop()
-    items = _get_aggregate(agg, "size")
-    _push_integer(ctx, len(items))
+    _push_integer(ctx, _aggregate_size(agg, "size"))
 
 
 # -----------------------------------------------------------------------------
@@ -374,6 +431,14 @@ def size(ctx: ExecutionContext) -> None:
 def concat(ctx: ExecutionContext) -> None:
     """Concatenate two aggregates."""
     b, a = ctx.stack.pop_n(2)
+    # Strings and sets of the same type combine without unpacking
+    if ctx.strict and a.__class__ is b.__class__ is JoyValue and a.type is b.type:
+        if a.type is JoyType.STRING:
+            ctx.stack.push_value(JoyValue.string(a.value + b.value))
+            return
+        if a.type is JoyType.SET:
+            ctx.stack.push_value(JoyValue(JoyType.SET, a.value | b.value))
+            return
     items_a = _get_aggregate(a, "concat")
     items_b = _get_aggregate(b, "concat")
     new_items = items_a + items_b
@@ -408,6 +473,14 @@ def enconcat(ctx: ExecutionContext) -> None:
 def reverse(ctx: ExecutionContext) -> None:
     """Reverse an aggregate."""
     agg = ctx.stack.pop()
+    if ctx.strict and is_joy_value(agg):
+        if agg.type == JoyType.STRING:
+            ctx.stack.push_value(JoyValue.string(agg.value[::-1]))
+            return
+        if agg.type == JoyType.SET:
+            # Sets are unordered, reversing does not change them
+            ctx.stack.push_value(agg)
+            return
     items = _get_aggregate(agg, "reverse")
     new_items = items[::-1]
     orig_type = _get_original_type(agg)
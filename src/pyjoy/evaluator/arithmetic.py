@@ -9,65 +9,109 @@ from __future__ import annotations
 
 import math as _math
 import random as _random
+from typing import Any
 
 from pyjoy.errors import JoyDivisionByZero, JoyTypeError
 from pyjoy.stack import ExecutionContext
 from pyjoy.types import JoyType, JoyValue
 
-from .core import get_numeric, joy_word, make_numeric_result
+from .core import WordFunc, get_numeric, joy_word, make_numeric_result
 
+# Extract numeric value, converting if needed (mode-aware: handles both
+# JoyValue and raw Python values). An alias rather than a wrapper, so each
+# operand costs one call.
+_numeric_value = get_numeric
 
-def _numeric_value(v) -> int | float:
-    """Extract numeric value, converting if needed.
 
-    Mode-aware: handles both JoyValue and raw Python values.
+def _make_numeric(value: int | float, ctx: ExecutionContext | None = None) -> Any:
+    """Create the stack form of a numeric result, preserving int when possible.
+
+    Returns a JoyValue in strict mode (the default without a context) and
+    the raw number in pythonic mode. In both modes an integral float result
+    becomes an integer, so ``2.5 2 *`` gives 5 either way.
     """
-    return get_numeric(v)
+    # Default to strict mode for backward compatibility
+    if ctx is None or ctx.strict:
+        return make_numeric_result(value, strict=True)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
 
 
-def _make_numeric(value: int | float, ctx: ExecutionContext | None = None) -> JoyValue:
-    """Create JoyValue from numeric result, preserving int when possible.
+def _make_float(value: float, ctx: ExecutionContext) -> Any:
+    """Create the stack form of a float result.
 
-    Note: In strict mode, always returns JoyValue for backward compatibility.
+    Returns a FLOAT JoyValue in strict mode and the raw float in pythonic
+    mode. Unlike _make_numeric the result stays a float, so ``4 sqrt``
+    gives 2.0 in both modes.
     """
-    # Default to strict mode for backward compatibility
-    strict = True if ctx is None else ctx.strict
-    return make_numeric_result(value, strict=strict)
+    if ctx.strict:
+        return JoyValue.floating(value)
+    return value
+
+
+_INTEGER = JoyType.INTEGER
 
 
 # -----------------------------------------------------------------------------
 # Basic Arithmetic
 # -----------------------------------------------------------------------------
 
-
-@joy_word(name="+", params=2, doc="N1 N2 -> N3")
-def add(ctx: ExecutionContext) -> None:
-    """Add two numbers."""
-    b, a = ctx.stack.pop_n(2)
-    result = _numeric_value(a) + _numeric_value(b)
-    ctx.stack.push_value(_make_numeric(result))
+# The simple binary operators are generated from _BINARY_TEMPLATE. Each
+# first checks for two INTEGER JoyValues in strict mode, or two raw ints in
+# pythonic mode (the common cases), which need no numeric coercion or
+# int/float result check; ``expr`` is the operation with ``{a}``/``{b}``
+# standing for the two operands.
+
+_BINARY_TEMPLATE = """
+def {func}(ctx):
+    \"\"\"{summary}\"\"\"
+    b, a = ctx.stack.pop2()
+    if a.__class__ is b.__class__ is JoyValue:
+        if a.type is b.type is _INTEGER and ctx.strict:
+            ctx.stack.push_value(JoyValue.integer({int_expr}))
+            return
+    elif a.__class__ is b.__class__ is int:
+        ctx.stack.push_value({raw_expr})
+        return
+    av = _numeric_value(a)
+    bv = _numeric_value(b)
+    ctx.stack.push_value(_make_numeric({expr}, ctx))
+"""
 
 
-@joy_word(name="-", params=2, doc="N1 N2 -> N3")
-def sub(ctx: ExecutionContext) -> None:
-    """Subtract: N1 - N2."""
-    b, a = ctx.stack.pop_n(2)
-    result = _numeric_value(a) - _numeric_value(b)
-    ctx.stack.push_value(_make_numeric(result))
+def _binary_word(name: str, func: str, summary: str, expr: str, doc: str) -> WordFunc:
+    """Generate a binary numeric primitive and register it as ``name``."""
+    source = _BINARY_TEMPLATE.format(
+        func=func,
+        summary=summary,
+        int_expr=expr.format(a="a.value", b="b.value"),
+        raw_expr=expr.format(a="a", b="b"),
+        expr=expr.format(a="av", b="bv"),
+    )
+    namespace = globals()
+    exec(compile(source, f"<pyjoy.evaluator.arithmetic:{func}>", "exec"), namespace)
+    return joy_word(name=name, params=2, doc=doc)(namespace[func])
 
 
-@joy_word(name="*", params=2, doc="N1 N2 -> N3")
-def mul(ctx: ExecutionContext) -> None:
-    """Multiply two numbers."""
-    b, a = ctx.stack.pop_n(2)
-    result = _numeric_value(a) * _numeric_value(b)
-    ctx.stack.push_value(_make_numeric(result))
+add = _binary_word("+", "add", "Add two numbers.", "{a} + {b}", "N1 N2 -> N3")
+sub = _binary_word("-", "sub", "Subtract: N1 - N2.", "{a} - {b}", "N1 N2 -> N3")
+mul = _binary_word("*", "mul", "Multiply two numbers.", "{a} * {b}", "N1 N2 -> N3")
 
 
 @joy_word(name="/", params=2, doc="N1 N2 -> N3")
 def div(ctx: ExecutionContext) -> None:
     """Divide: N1 / N2. Integer division for integers."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
+    if (
+        a.__class__ is b.__class__ is JoyValue
+        and a.type is b.type is _INTEGER
+        and ctx.strict
+    ):
+        if b.value == 0:
+            raise JoyDivisionByZero("/")
+        ctx.stack.push_value(JoyValue.integer(a.value // b.value))
+        return
     bv = _numeric_value(b)
     if bv == 0:
         raise JoyDivisionByZero("/")
@@ -77,32 +121,32 @@ def div(ctx: ExecutionContext) -> None:
         result = av // bv
     else:
         result = av / bv
-    ctx.stack.push_value(_make_numeric(result))
+    ctx.stack.push_value(_make_numeric(result, ctx))
 
 
 @joy_word(name="rem", params=2, doc="N1 N2 -> N3")
 def rem(ctx: ExecutionContext) -> None:
     """Remainder: N1 % N2."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
     bv = _numeric_value(b)
     if bv == 0:
         raise JoyDivisionByZero("rem")
     result = _numeric_value(a) % bv
-    ctx.stack.push_value(_make_numeric(result))
+    ctx.stack.push_value(_make_numeric(result, ctx))
 
 
 @joy_word(name="div", params=2, doc="N1 N2 -> Q R")
 def divmod_word(ctx: ExecutionContext) -> None:
     """Integer division with remainder: push quotient then remainder."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
     bv = _numeric_value(b)
     if bv == 0:
         raise JoyDivisionByZero("div")
     av = _numeric_value(a)
     q = int(av // bv)
     r = av % bv
-    ctx.stack.push_value(_make_numeric(q))
-    ctx.stack.push_value(_make_numeric(r))
+    ctx.stack.push_value(_make_numeric(q, ctx))
+    ctx.stack.push_value(_make_numeric(r, ctx))
 
 
 @joy_word(name="abs", params=1, doc="N -> N")
@@ -110,7 +154,7 @@ def abs_word(ctx: ExecutionContext) -> None:
     """Absolute value."""
     a = ctx.stack.pop()
     result = abs(_numeric_value(a))
-    ctx.stack.push_value(_make_numeric(result))
+    ctx.stack.push_value(_make_numeric(result, ctx))
 
 
 @joy_word(name="neg", params=1, doc="N -> N")
@@ -118,7 +162,7 @@ def neg(ctx: ExecutionContext) -> None:
     """Negate: -N."""
     a = ctx.stack.pop()
     result = -_numeric_value(a)
-    ctx.stack.push_value(_make_numeric(result))
+    ctx.stack.push_value(_make_numeric(result, ctx))
 
 
 @joy_word(name="sign", params=1, doc="N -> I")
@@ -132,7 +176,7 @@ def sign(ctx: ExecutionContext) -> None:
         result = 1
     else:
         result = 0
-    ctx.stack.push_value(JoyValue.integer(result))
+    ctx.stack.push_value(_make_numeric(result, ctx))
 
 
 @joy_word(name="succ", params=1, doc="N -> N")
@@ -140,7 +184,7 @@ def succ(ctx: ExecutionContext) -> None:
     """Successor: N + 1."""
     a = ctx.stack.pop()
     result = _numeric_value(a) + 1
-    ctx.stack.push_value(_make_numeric(result))
+    ctx.stack.push_value(_make_numeric(result, ctx))
 
 
 @joy_word(name="pred", params=1, doc="N -> N")
@@ -148,25 +192,23 @@ def pred(ctx: ExecutionContext) -> None:
     """Predecessor: N - 1."""
     a = ctx.stack.pop()
     result = _numeric_value(a) - 1
-    ctx.stack.push_value(_make_numeric(result))
-
-
-@joy_word(name="max", params=2, doc="N1 N2 -> N")
-def max_word(ctx: ExecutionContext) -> None:
-    """Maximum of two numbers."""
-    b, a = ctx.stack.pop_n(2)
-    av, bv = _numeric_value(a), _numeric_value(b)
-    result = av if av >= bv else bv
-    ctx.stack.push_value(_make_numeric(result))
+    ctx.stack.push_value(_make_numeric(result, ctx))
 
 
-@joy_word(name="min", params=2, doc="N1 N2 -> N")
-def min_word(ctx: ExecutionContext) -> None:
-    """Minimum of two numbers."""
-    b, a = ctx.stack.pop_n(2)
-    av, bv = _numeric_value(a), _numeric_value(b)
-    result = av if av <= bv else bv
-    ctx.stack.push_value(_make_numeric(result))
+max_word = _binary_word(
+    "max",
+    "max_word",
+    "Maximum of two numbers.",
+    "{a} if {a} >= {b} else {b}",
+    "N1 N2 -> N",
+)
+min_word = _binary_word(
+    "min",
+    "min_word",
+    "Minimum of two numbers.",
+    "{a} if {a} <= {b} else {b}",
+    "N1 N2 -> N",
+)
 
 
 # -----------------------------------------------------------------------------
@@ -179,7 +221,7 @@ def sin_(ctx: ExecutionContext) -> None:
     """Sine of F (radians)."""
     a = ctx.stack.pop()
     result = _math.sin(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="cos", params=1, doc="F -> F")
@@ -187,7 +229,7 @@ def cos_(ctx: ExecutionContext) -> None:
     """Cosine of F (radians)."""
     a = ctx.stack.pop()
     result = _math.cos(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="tan", params=1, doc="F -> F")
@@ -195,7 +237,7 @@ def tan_(ctx: ExecutionContext) -> None:
     """Tangent of F (radians)."""
     a = ctx.stack.pop()
     result = _math.tan(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="asin", params=1, doc="F -> F")
@@ -203,7 +245,7 @@ def asin_(ctx: ExecutionContext) -> None:
     """Arc sine of F."""
     a = ctx.stack.pop()
     result = _math.asin(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="acos", params=1, doc="F -> F")
@@ -211,7 +253,7 @@ def acos_(ctx: ExecutionContext) -> None:
     """Arc cosine of F."""
     a = ctx.stack.pop()
     result = _math.acos(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="atan", params=1, doc="F -> F")
@@ -219,15 +261,15 @@ def atan_(ctx: ExecutionContext) -> None:
     """Arc tangent of F."""
     a = ctx.stack.pop()
     result = _math.atan(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="atan2", params=2, doc="F G -> F")
 def atan2_(ctx: ExecutionContext) -> None:
     """Arc tangent of F/G using signs to determine quadrant."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
     result = _math.atan2(_numeric_value(a), _numeric_value(b))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="sinh", params=1, doc="F -> F")
@@ -235,7 +277,7 @@ def sinh_(ctx: ExecutionContext) -> None:
     """Hyperbolic sine of F."""
     a = ctx.stack.pop()
     result = _math.sinh(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="cosh", params=1, doc="F -> F")
@@ -243,7 +285,7 @@ def cosh_(ctx: ExecutionContext) -> None:
     """Hyperbolic cosine of F."""
     a = ctx.stack.pop()
     result = _math.cosh(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="tanh", params=1, doc="F -> F")
@@ -251,7 +293,7 @@ def tanh_(ctx: ExecutionContext) -> None:
     """Hyperbolic tangent of F."""
     a = ctx.stack.pop()
     result = _math.tanh(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="exp", params=1, doc="F -> F")
@@ -259,7 +301,7 @@ def exp_(ctx: ExecutionContext) -> None:
     """e raised to the power F."""
     a = ctx.stack.pop()
     result = _math.exp(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="log", params=1, doc="F -> F")
@@ -267,7 +309,7 @@ def log_(ctx: ExecutionContext) -> None:
     """Natural logarithm of F."""
     a = ctx.stack.pop()
     result = _math.log(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="log10", params=1, doc="F -> F")
@@ -275,7 +317,7 @@ def log10_(ctx: ExecutionContext) -> None:
     """Base-10 logarithm of F."""
     a = ctx.stack.pop()
     result = _math.log10(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="sqrt", params=1, doc="F -> F")
@@ -283,15 +325,15 @@ def sqrt_(ctx: ExecutionContext) -> None:
     """Square root of F."""
     a = ctx.stack.pop()
     result = _math.sqrt(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="pow", params=2, doc="F G -> F")
 def pow_(ctx: ExecutionContext) -> None:
     """F raised to the power G."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
     result = _math.pow(_numeric_value(a), _numeric_value(b))
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="ceil", params=1, doc="F -> F")
@@ -299,7 +341,7 @@ def ceil_(ctx: ExecutionContext) -> None:
     """Ceiling of F."""
     a = ctx.stack.pop()
     result = _math.ceil(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(float(result)))
+    ctx.stack.push_value(_make_float(float(result), ctx))
 
 
 @joy_word(name="floor", params=1, doc="F -> F")
@@ -307,7 +349,7 @@ def floor_(ctx: ExecutionContext) -> None:
     """Floor of F."""
     a = ctx.stack.pop()
     result = _math.floor(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(float(result)))
+    ctx.stack.push_value(_make_float(float(result), ctx))
 
 
 @joy_word(name="trunc", params=1, doc="F -> F")
@@ -315,7 +357,7 @@ def trunc_(ctx: ExecutionContext) -> None:
     """Truncate F toward zero."""
     a = ctx.stack.pop()
     result = _math.trunc(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(float(result)))
+    ctx.stack.push_value(_make_float(float(result), ctx))
 
 
 @joy_word(name="round", params=1, doc="F -> F")
@@ -323,7 +365,7 @@ def round_(ctx: ExecutionContext) -> None:
     """Round F to nearest integer."""
     a = ctx.stack.pop()
     result = round(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(float(result)))
+    ctx.stack.push_value(_make_float(float(result), ctx))
 
 
 @joy_word(name="frexp", params=1, doc="F -> F I")
@@ -331,14 +373,14 @@ def frexp_(ctx: ExecutionContext) -> None:
     """Split F into mantissa and exponent: F = mantissa * 2^exponent."""
     a = ctx.stack.pop()
     mantissa, exponent = _math.frexp(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(mantissa))
-    ctx.stack.push_value(JoyValue.integer(exponent))
+    ctx.stack.push_value(_make_float(mantissa, ctx))
+    ctx.stack.push_value(_make_numeric(exponent, ctx))
 
 
 @joy_word(name="ldexp", params=2, doc="F I -> F")
 def ldexp_(ctx: ExecutionContext) -> None:
     """Compute F * 2^I."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
     mantissa = _numeric_value(a)
     exponent = int(_numeric_value(b))
     try:
@@ -346,7 +388,7 @@ def ldexp_(ctx: ExecutionContext) -> None:
     except OverflowError:
         # Return infinity with appropriate sign
         result = float("inf") if mantissa >= 0 else float("-inf")
-    ctx.stack.push_value(JoyValue.floating(result))
+    ctx.stack.push_value(_make_float(result, ctx))
 
 
 @joy_word(name="modf", params=1, doc="F -> F F")
@@ -354,8 +396,8 @@ def modf_(ctx: ExecutionContext) -> None:
     """Split F into fractional and integer parts."""
     a = ctx.stack.pop()
     frac, integer = _math.modf(_numeric_value(a))
-    ctx.stack.push_value(JoyValue.floating(frac))
-    ctx.stack.push_value(JoyValue.floating(integer))
+    ctx.stack.push_value(_make_float(frac, ctx))
+    ctx.stack.push_value(_make_float(integer, ctx))
 
 
 # -----------------------------------------------------------------------------
@@ -14,7 +14,7 @@ from typing import Any
 
 from pyjoy.errors import JoyTypeError
 from pyjoy.stack import ExecutionContext
-from pyjoy.types import JoyQuotation, JoyType, JoyValue
+from pyjoy.types import FALSE, TRUE, JoyQuotation, JoyType, JoyValue
 
 from .core import expect_quotation, is_joy_value, joy_word
 
@@ -53,7 +53,7 @@ def _get_aggregate(v: JoyValue, op: str) -> tuple:
         # Return raw terms - do NOT convert to JoyValues here
         return v.value.terms
     elif v.type == JoyType.STRING:
-        return tuple(JoyValue.char(c) for c in v.value)
+        return tuple(map(JoyValue.char, v.value))
     elif v.type == JoyType.SET:
         return tuple(JoyValue.integer(x) for x in sorted(v.value))
     else:
@@ -533,10 +533,18 @@ def map_combinator(ctx: ExecutionContext) -> None:
     items = _get_aggregate(agg, "map")
     original_type = agg.type
 
+    native = ctx.evaluator.unary_native(q)
     results = []
     for item in items:
+        item = _ensure_joy_value(item)
+        if native is not None:
+            # P only sees the item, so run it on its own (see jit.py)
+            cell = [item]
+            if native.run(cell):
+                results.append(cell[0])
+                continue
         saved = ctx.stack._items.copy()
-        ctx.stack.push_value(_ensure_joy_value(item))
+        ctx.stack.push_value(item)
         ctx.evaluator.execute(q)
         result = ctx.stack.pop()
         results.append(result)
@@ -553,10 +561,18 @@ def filter_combinator(ctx: ExecutionContext) -> None:
     q = expect_quotation(quot, "filter")
     items = _get_aggregate(agg, "filter")
 
+    native = ctx.evaluator.unary_native(q)
     results = []
     for item in items:
-        saved = ctx.stack._items.copy()
         joy_item = _ensure_joy_value(item)
+        if native is not None:
+            # P only sees the item, so run it on its own (see jit.py)
+            cell = [joy_item]
+            if native.run(cell):
+                if _is_truthy(cell[0]):
+                    results.append(joy_item)
+                continue
+        saved = ctx.stack._items.copy()
         ctx.stack.push_value(joy_item)
         ctx.evaluator.execute(q)
         test_result = ctx.stack.pop()
@@ -640,10 +656,10 @@ def any_combinator(ctx: ExecutionContext) -> None:
         ctx.stack._items = saved
 
         if _is_truthy(test_result):
-            ctx.stack.push_value(JoyValue.boolean(True))
+            ctx.stack.push_value(TRUE)
             return
 
-    ctx.stack.push_value(JoyValue.boolean(False))
+    ctx.stack.push_value(FALSE)
 
 
 @joy_word(name="all", params=2, doc="A [P] -> B")
@@ -655,7 +671,7 @@ def all_combinator(ctx: ExecutionContext) -> None:
 
     # Empty predicate returns false
     if len(q.terms) == 0:
-        ctx.stack.push_value(JoyValue.boolean(False))
+        ctx.stack.push_value(FALSE)
         return
 
     for item in items:
@@ -666,10 +682,10 @@ def all_combinator(ctx: ExecutionContext) -> None:
         ctx.stack._items = saved
 
         if not _is_truthy(test_result):
-            ctx.stack.push_value(JoyValue.boolean(False))
+            ctx.stack.push_value(FALSE)
             return
 
-    ctx.stack.push_value(JoyValue.boolean(True))
+    ctx.stack.push_value(TRUE)
 
 
 @joy_word(name="some", params=2, doc="A [P] -> B")
@@ -690,10 +706,10 @@ def some_combinator(ctx: ExecutionContext) -> None:
         ctx.stack._items = saved
 
         if _is_truthy(test_result):
-            ctx.stack.push_value(JoyValue.boolean(True))
+            ctx.stack.push_value(TRUE)
             return
 
-    ctx.stack.push_value(JoyValue.boolean(False))
+    ctx.stack.push_value(FALSE)
 
 
 # -----------------------------------------------------------------------------
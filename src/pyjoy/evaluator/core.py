@@ -34,14 +34,18 @@ Use @python_word when you have:
 from __future__ import annotations
 
 import inspect
-from functools import wraps
+from functools import lru_cache, wraps
+from operator import attrgetter
 from typing import Any, Callable, Dict, Optional, Union
 
 from pyjoy.errors import JoyStackUnderflow, JoyTypeError, JoyUndefinedWord
 from pyjoy.parser import Definition, Parser, PythonExpr, PythonStmt
+from pyjoy.scanner import has_shell_escapes
 from pyjoy.stack import ExecutionContext
 from pyjoy.types import JoyQuotation, JoyType, JoyValue, python_to_joy
 
+from .jit import NativeCode, ThreadedCode, compile_quotation
+
 
 class PythonInteropError(Exception):
     """Raised when Python interop is used in strict mode."""
@@ -55,6 +59,45 @@ WordFunc = Callable[[ExecutionContext], None]
 # Global registry for primitive words
 _primitives: Dict[str, WordFunc] = {}
 
+# Opcodes for compiled quotations (see Evaluator._compile)
+OP_PUSH = 0  # push a stack-ready literal (payload: value)
+OP_PRIM = 1  # call a primitive (payload: WordFunc)
+OP_USER = 2  # call a non-primitive word, resolved at runtime (payload: name)
+OP_TERM = 3  # anything else, via Evaluator._execute_term (payload: term)
+OP_NATIVE = 4  # try native code first, see jit.py (payload: NativeCode)
+OP_TAIL = 5  # OP_USER in tail position, run without recursing (payload: name)
+OP_PUSH_N = 6  # push a run of literals (payload: tuple of values)
+OP_THREAD = 7  # run the straight-line entries after it, see jit.py (ThreadedCode)
+
+# Entries ThreadedCode can run: opcode -> stack list method (None = call)
+_THREAD_STEPS: Dict[int, Optional[str]] = {
+    OP_PRIM: None,
+    OP_PUSH: "append",
+    OP_PUSH_N: "extend",
+}
+
+# Compiled-code cache keys, one per evaluation mode. They are replaced
+# whenever the primitive registry changes, so stale compiled code (which
+# binds primitives directly) is recompiled on its next execution.
+_code_keys: Dict[bool, object] = {True: object(), False: object()}
+
+# Stack form of a literal term in each evaluation mode: strict mode pushes
+# the JoyValue itself, pythonic mode its raw value. Chosen once per compile.
+_LITERAL_FORMS: Dict[bool, Callable[[JoyValue], Any]] = {
+    True: lambda term: term,
+    False: attrgetter("value"),
+}
+
+# Sorted primitive names for list_primitives(), emptied with the code keys
+_sorted_primitives: list[str] = []
+
+
+def _invalidate_compiled() -> None:
+    """Mark all compiled quotations (and the sorted name list) as stale."""
+    _code_keys[True] = object()
+    _code_keys[False] = object()
+    _sorted_primitives.clear()
+
 
 # -----------------------------------------------------------------------------
 # Mode-Aware Value Helpers
@@ -75,11 +118,15 @@ def unwrap_value(value: Any) -> Any:
     Returns:
         Raw Python value
     """
-    if isinstance(value, JoyValue):
+    if value.__class__ is JoyValue:
         return value.value
     return value
 
 
+# unwrap_value for values known to be JoyValues (everything on a strict stack)
+_payload = attrgetter("value")
+
+
 def wrap_value(value: Any, strict: bool = True) -> Any:
     """
     Wrap value appropriately based on mode.
@@ -98,7 +145,24 @@ def wrap_value(value: Any, strict: bool = True) -> Any:
 
 def is_joy_value(value: Any) -> bool:
     """Check if value is a JoyValue instance."""
-    return isinstance(value, JoyValue)
+    return value.__class__ is JoyValue
+
+
+# Numeric extraction per JoyValue type: None means the payload is already a
+# number, otherwise a converter for it. Types not listed are not numeric.
+_NUMERIC_EXTRACT: Dict[JoyType, Optional[Callable[[Any], int]]] = {
+    JoyType.INTEGER: None,
+    JoyType.FLOAT: None,
+    JoyType.CHAR: ord,
+    JoyType.BOOLEAN: int,
+}
+# The same for raw Python values in pythonic mode, keyed by exact type
+_RAW_NUMERIC_EXTRACT: Dict[type, Optional[Callable[[Any], int]]] = {
+    int: None,
+    float: None,
+    bool: int,
+}
+_NOT_NUMERIC = object()
 
 
 def get_numeric(value: Any) -> Union[int, float]:
@@ -116,18 +180,21 @@ def get_numeric(value: Any) -> Union[int, float]:
     Raises:
         JoyTypeError: If value is not numeric
     """
-    if isinstance(value, JoyValue):
-        if value.type == JoyType.INTEGER:
+    if value.__class__ is JoyValue:
+        extract = _NUMERIC_EXTRACT.get(value.type, _NOT_NUMERIC)
+        if extract is None:
             return value.value
-        elif value.type == JoyType.FLOAT:
-            return value.value
-        elif value.type == JoyType.CHAR:
-            return ord(value.value)
-        elif value.type == JoyType.BOOLEAN:
-            return 1 if value.value else 0
-        else:
+        if extract is _NOT_NUMERIC:
             raise JoyTypeError("arithmetic", "numeric", value.type.name)
-    elif isinstance(value, bool):
+        return extract(value.value)
+
+    # Pythonic mode: exact raw types first, then subclasses and chars
+    extract = _RAW_NUMERIC_EXTRACT.get(value.__class__, _NOT_NUMERIC)
+    if extract is None:
+        return value
+    if extract is not _NOT_NUMERIC:
+        return extract(value)
+    if isinstance(value, bool):
         return 1 if value else 0
     elif isinstance(value, (int, float)):
         return value
@@ -151,6 +218,15 @@ def make_numeric_result(value: Union[int, float], strict: bool = True) -> Any:
     if not strict:
         return value
 
+    # Exact int and float first; subclasses (bool) fall through below
+    cls = value.__class__
+    if cls is int:
+        return JoyValue.integer(value)
+    if cls is float:
+        if value.is_integer():
+            return JoyValue.integer(int(value))
+        return JoyValue.floating(value)
+
     if isinstance(value, float) and value.is_integer():
         return JoyValue.integer(int(value))
     elif isinstance(value, float):
@@ -183,14 +259,19 @@ def joy_word(
     def decorator(func: Callable[..., None]) -> WordFunc:
         word_name = name or getattr(func, "__name__", "unknown")
 
-        @wraps(func)
-        def wrapper(ctx: ExecutionContext) -> None:
-            # Validate parameter count
-            if ctx.stack.depth < params:
-                raise JoyStackUnderflow(word_name, params, ctx.stack.depth)
+        if params == 0:
+            # Nothing to validate: register the function itself
+            wrapper = func
+        else:
 
-            # Execute the primitive
-            func(ctx)
+            @wraps(func)
+            def wrapper(ctx: ExecutionContext) -> None:
+                # Validate parameter count
+                if len(ctx.stack._items) < params:
+                    raise JoyStackUnderflow(word_name, params, ctx.stack.depth)
+
+                # Execute the primitive
+                func(ctx)
 
         # Store metadata on the wrapper
         wrapper.joy_word = word_name  # type: ignore[attr-defined]
@@ -199,6 +280,7 @@ def joy_word(
 
         # Register in global primitives
         _primitives[word_name] = wrapper
+        _invalidate_compiled()
         return wrapper
 
     return decorator
@@ -238,7 +320,11 @@ def python_word(
         sig = inspect.signature(func)
         n_params = len(sig.parameters)
 
-        # Generate specialized wrappers based on param count for performance
+        # Generate specialized wrappers based on param count for performance.
+        # They pop straight from the item list and push the result inline.
+        # Strict stacks hold only JoyValues, so unwrapping is a plain
+        # attribute read there; pythonic stacks may mix raw values and
+        # JoyValues (quotations), so they keep the checking unwrap_value.
         if n_params == 0:
 
             @wraps(func)
@@ -246,53 +332,62 @@ def python_word(
                 result = func()
                 if result is not None:
                     if ctx.strict:
-                        ctx.stack.push_value(python_to_joy(result, strict=True))
+                        ctx.stack._items.append(python_to_joy(result, strict=True))
                     else:
-                        ctx.stack.push(result)
+                        ctx.stack._items.append(result)
 
         elif n_params == 1:
 
             @wraps(func)
             def wrapper(ctx: ExecutionContext) -> None:
-                if ctx.stack.depth < 1:
-                    raise JoyStackUnderflow(word_name, 1, ctx.stack.depth)
-                a = unwrap_value(ctx.stack.pop())
-                result = func(a)
+                items = ctx.stack._items
+                if not items:
+                    raise JoyStackUnderflow(word_name, 1, 0)
+                strict = ctx.strict
+                unwrap = _payload if strict else unwrap_value
+                result = func(unwrap(items.pop()))
                 if result is not None:
-                    if ctx.strict:
-                        ctx.stack.push_value(python_to_joy(result, strict=True))
+                    if strict:
+                        items.append(python_to_joy(result, strict=True))
                     else:
-                        ctx.stack.push(result)
+                        items.append(result)
 
         elif n_params == 2:
 
             @wraps(func)
             def wrapper(ctx: ExecutionContext) -> None:
-                if ctx.stack.depth < 2:
-                    raise JoyStackUnderflow(word_name, 2, ctx.stack.depth)
-                b_raw, a_raw = ctx.stack.pop_n(2)
-                a, b = unwrap_value(a_raw), unwrap_value(b_raw)
+                items = ctx.stack._items
+                if len(items) < 2:
+                    raise JoyStackUnderflow(word_name, 2, len(items))
+                strict = ctx.strict
+                unwrap = _payload if strict else unwrap_value
+                b = unwrap(items.pop())
+                a = unwrap(items.pop())
                 result = func(a, b)
                 if result is not None:
-                    if ctx.strict:
-                        ctx.stack.push_value(python_to_joy(result, strict=True))
+                    if strict:
+                        items.append(python_to_joy(result, strict=True))
                     else:
-                        ctx.stack.push(result)
+                        items.append(result)
 
         elif n_params == 3:
 
             @wraps(func)
             def wrapper(ctx: ExecutionContext) -> None:
-                if ctx.stack.depth < 3:
-                    raise JoyStackUnderflow(word_name, 3, ctx.stack.depth)
-                c_raw, b_raw, a_raw = ctx.stack.pop_n(3)
-                a, b, c = unwrap_value(a_raw), unwrap_value(b_raw), unwrap_value(c_raw)
+                items = ctx.stack._items
+                if len(items) < 3:
+                    raise JoyStackUnderflow(word_name, 3, len(items))
+                strict = ctx.strict
+                unwrap = _payload if strict else unwrap_value
+                c = unwrap(items.pop())
+                b = unwrap(items.pop())
+                a = unwrap(items.pop())
                 result = func(a, b, c)
                 if result is not None:
-                    if ctx.strict:
-                        ctx.stack.push_value(python_to_joy(result, strict=True))
+                    if strict:
+                        items.append(python_to_joy(result, strict=True))
                     else:
-                        ctx.stack.push(result)
+                        items.append(result)
 
         else:
             # Fallback for 4+ params
@@ -318,6 +413,7 @@ def python_word(
 
         # Register in global primitives
         _primitives[word_name] = wrapper
+        _invalidate_compiled()
         return wrapper
 
     return decorator
@@ -331,11 +427,93 @@ def get_primitive(name: str) -> Optional[WordFunc]:
 def register_primitive(name: str, func: WordFunc) -> None:
     """Register a primitive without using the decorator."""
     _primitives[name] = func
+    _invalidate_compiled()
 
 
 def list_primitives() -> list[str]:
-    """List all registered primitive names."""
-    return sorted(_primitives.keys())
+    """List all registered primitive names (sorted)."""
+    if len(_sorted_primitives) != len(_primitives):
+        _sorted_primitives[:] = sorted(_primitives)
+    return _sorted_primitives.copy()
+
+
+def _fuse_pushes(code: list) -> list:
+    """Merge runs of consecutive OP_PUSH entries into OP_PUSH_N entries."""
+    fused: list = []
+    run: list = []
+    for entry in code:
+        if entry[0] == OP_PUSH:
+            run.append(entry[1])
+            continue
+        if run:
+            fused.append(
+                (OP_PUSH, run[0]) if len(run) == 1 else (OP_PUSH_N, tuple(run))
+            )
+            run = []
+        fused.append(entry)
+    if run:
+        fused.append((OP_PUSH, run[0]) if len(run) == 1 else (OP_PUSH_N, tuple(run)))
+    return fused
+
+
+@lru_cache(maxsize=2048)
+def _parse_program(source: str, python_interop: bool) -> JoyQuotation:
+    """
+    Parse source into an executable program, memoized.
+
+    Parsed programs are never mutated, so repeated runs of the same source
+    (REPL input, tests, generated snippets) share one program and its
+    compiled code.
+    """
+    return Parser(python_interop=python_interop).parse_full(source).program
+
+
+@lru_cache(maxsize=1024)
+def _compile_python(source: str, mode: str) -> Any:
+    """
+    Compile Python interop source ("eval" or "exec" mode), memoized.
+
+    Code objects do not depend on the namespace they run in, so evaluators
+    share them and repeated backtick/bang terms skip CPython's compiler.
+    """
+    return compile(source, "<string>", mode)
+
+
+def _python_step(term: Union[PythonExpr, PythonStmt]) -> Callable:
+    """
+    Lower a Python interop term to a primitive-style step.
+
+    The step finds the evaluator through the context, because compiled code
+    is cached on the (shared) parsed program, not per evaluator.
+    """
+    source = term.code
+    if term.__class__ is PythonExpr:
+
+        def python_expr(ctx: ExecutionContext) -> None:
+            ctx.evaluator._execute_python_expr(source)
+
+        return python_expr
+
+    def python_stmt(ctx: ExecutionContext) -> None:
+        ctx.evaluator._execute_python_stmt(source)
+
+    return python_stmt
+
+
+@lru_cache(maxsize=None)
+def _pythonic_modules() -> Dict[str, Any]:
+    """
+    Modules pre-imported into every pythonic evaluator's namespace.
+
+    Built once; evaluators copy the bindings instead of running import
+    statements on construction.
+    """
+    import json
+    import math
+    import os
+    import re
+
+    return {"math": math, "json": json, "os": os, "re_module": re}
 
 
 class Evaluator:
@@ -383,22 +561,24 @@ class Evaluator:
         # Local namespace for user-defined variables
         self.python_locals: Dict[str, Any] = {}
 
-        # Pre-import common modules (only in non-strict mode)
+        # Pre-import common modules (only in non-strict mode), bound the
+        # same way "import" in _python_exec would bind them
         if not self.strict:
-            self._python_exec("import math")
-            self._python_exec("import json")
-            self._python_exec("import os")
-            self._python_exec("import re as re_module")
+            modules = _pythonic_modules()
+            self.python_locals.update(modules)
+            self.python_globals.update(modules)
 
     def _python_exec(self, code: str) -> None:
         """Execute Python statement in the evaluator's namespace."""
-        exec(code, self.python_globals, self.python_locals)
+        exec(_compile_python(code, "exec"), self.python_globals, self.python_locals)
         # Merge locals into globals for persistence
         self.python_globals.update(self.python_locals)
 
     def _python_eval(self, expr: str) -> Any:
         """Evaluate Python expression and return result."""
-        return eval(expr, self.python_globals, self.python_locals)
+        return eval(
+            _compile_python(expr, "eval"), self.python_globals, self.python_locals
+        )
 
     def execute(self, program: JoyQuotation) -> None:
         """
@@ -407,8 +587,126 @@ class Evaluator:
         Args:
             program: JoyQuotation to execute
         """
+        ctx = self.ctx
+        definitions = self.definitions
+        while True:
+            code = program._code
+            if program._code_key is not _code_keys[self.strict]:
+                code = self._compile(program)
+
+            for op, arg in code:
+                if op == OP_PRIM:
+                    arg(ctx)
+                elif op == OP_PUSH:
+                    ctx.stack.push_value(arg)
+                elif op == OP_PUSH_N:
+                    ctx.stack._items.extend(arg)
+                elif op == OP_USER:
+                    body = definitions.get(arg)
+                    if body is not None:
+                        self.execute(body)
+                    else:
+                        self._execute_symbol(arg)
+                elif op == OP_TAIL:
+                    # Tail call: continue with the callee instead of recursing
+                    body = definitions.get(arg)
+                    if body is not None:
+                        program = body
+                        break
+                    self._execute_symbol(arg)
+                elif op == OP_NATIVE:
+                    if arg.run(ctx.stack._items):
+                        return
+                elif op == OP_THREAD:
+                    if arg.run(ctx):
+                        return
+                else:
+                    self._execute_term(arg)
+            else:
+                return
+
+    def unary_native(self, program: JoyQuotation) -> Optional[NativeCode]:
+        """
+        Get the native code of a quotation that maps one value to one value.
+
+        Returns None unless the quotation compiled to native code that reads
+        exactly the top stack item and leaves exactly one item. Combinators
+        can then run it on a one-element list instead of the whole stack.
+        """
+        if not self.strict:
+            return None
+        code = program._code
+        if program._code_key is not _code_keys[True]:
+            code = self._compile(program)
+        if code and code[0][0] == OP_NATIVE:
+            native = code[0][1]
+            if native.inputs == 1 and native.outputs == 1:
+                return native
+        return None
+
+    def _compile(self, program: JoyQuotation) -> list:
+        """
+        Compile a quotation into a list of (opcode, payload) pairs.
+
+        Primitives are bound directly; other symbols are looked up in
+        ``definitions`` when executed, since DEFINE blocks may add words
+        while a program runs. Literals are converted to their stack form
+        for the current mode. In strict mode, quotations eligible for
+        native code (see jit.py) start with an OP_NATIVE entry; when that
+        succeeds the remaining entries are skipped. A user word in tail
+        position becomes OP_TAIL, so chains of definitions do not grow the
+        Python stack. Runs of consecutive literals become one OP_PUSH_N.
+        Python interop terms are bound as primitive-style steps. Code made
+        only of primitive calls and pushes starts with an
+        OP_THREAD entry, which runs it as one generated function once hot.
+        The result is cached on the quotation.
+
+        Args:
+            program: JoyQuotation to compile
+
+        Returns:
+            The compiled code
+        """
+        strict = self.strict
+        literal = _LITERAL_FORMS[strict]
+        code: list = []
+        if strict:
+            native = compile_quotation(program.terms, _primitives)
+            if native is not None:
+                code.append((OP_NATIVE, native))
+
         for term in program.terms:
-            self._execute_term(term)
+            if term.__class__ is JoyValue:
+                if term.type == JoyType.SYMBOL:
+                    term = term.value
+                else:
+                    code.append((OP_PUSH, literal(term)))
+                    continue
+            elif isinstance(term, JoyQuotation):
+                code.append((OP_PUSH, JoyValue.quotation(term)))
+                continue
+
+            if isinstance(term, str):
+                primitive = _primitives.get(term)
+                if primitive is not None:
+                    code.append((OP_PRIM, primitive))
+                else:
+                    code.append((OP_USER, term))
+            elif term.__class__ is PythonExpr or term.__class__ is PythonStmt:
+                code.append((OP_PRIM, _python_step(term)))
+            else:
+                code.append((OP_TERM, term))
+
+        if code and code[-1][0] == OP_USER:
+            code[-1] = (OP_TAIL, code[-1][1])
+
+        code = _fuse_pushes(code)
+        if len(code) > 1 and all(op in _THREAD_STEPS for op, _ in code):
+            steps = [(_THREAD_STEPS[op], arg) for op, arg in code]
+            code.insert(0, (OP_THREAD, ThreadedCode(steps)))
+        program._code = code
+        program._code_key = _code_keys[strict]
+        return code
 
     def run(self, source: str) -> None:
         """
@@ -424,12 +722,15 @@ class Evaluator:
         Args:
             source: Joy source code string
         """
-        # Enable Python interop parsing only in pythonic mode
-        parser = Parser(python_interop=not self.strict)
-        result = parser.parse_full(source)
+        # Enable Python interop parsing only in pythonic mode. Shell escape
+        # lines run while scanning, so such source is never memoized.
+        if has_shell_escapes(source):
+            program = Parser(python_interop=not self.strict).parse_full(source).program
+        else:
+            program = _parse_program(source, not self.strict)
 
         # Execute the program (definitions are inlined and processed as encountered)
-        self.execute(result.program)
+        self.execute(program)
 
     def _execute_term(self, term: Any) -> None:
         """
@@ -439,7 +740,24 @@ class Evaluator:
             term: Can be JoyValue, JoyQuotation, Definition, PythonExpr,
                   PythonStmt, or string (symbol)
         """
-        if isinstance(term, Definition):
+        # Most frequent cases first: literals, symbols, quotations
+        if term.__class__ is JoyValue:
+            # Symbol values should be executed, not pushed
+            if term.type is JoyType.SYMBOL:
+                self._execute_symbol(term.value)
+            else:
+                # Other literal values: push their stack form for the mode
+                self.ctx.stack.push_value(_LITERAL_FORMS[self.strict](term))
+
+        elif isinstance(term, str):
+            # Symbol: look up and execute
+            self._execute_symbol(term)
+
+        elif isinstance(term, JoyQuotation):
+            # Quotation: wrap and push (don't execute)
+            self.ctx.stack.push_value(JoyValue.quotation(term))
+
+        elif isinstance(term, Definition):
             # Register the definition (inline processing)
             self.define(term.name, term.body)
 
@@ -451,26 +769,6 @@ class Evaluator:
             # Python statement: execute (no push)
             self._execute_python_stmt(term.code)
 
-        elif isinstance(term, JoyValue):
-            # Symbol values should be executed, not pushed
-            if term.type == JoyType.SYMBOL:
-                self._execute_symbol(term.value)
-            else:
-                # Other literal values: push to stack
-                # In pythonic mode, unwrap the value first
-                if self.strict:
-                    self.ctx.stack.push_value(term)
-                else:
-                    self.ctx.stack.push(term.value)
-
-        elif isinstance(term, JoyQuotation):
-            # Quotation: wrap and push (don't execute)
-            self.ctx.stack.push_value(JoyValue.quotation(term))
-
-        elif isinstance(term, str):
-            # Symbol: look up and execute
-            self._execute_symbol(term)
-
         else:
             # Unknown: try to convert and push
             self.ctx.stack.push(term)
@@ -522,14 +820,15 @@ class Evaluator:
             JoyUndefinedWord: If symbol is not defined and undeferror is True
         """
         # Check primitives first
-        primitive = get_primitive(name)
+        primitive = _primitives.get(name)
         if primitive is not None:
             primitive(self.ctx)
             return
 
         # Check user definitions
-        if name in self.definitions:
-            self.execute(self.definitions[name])
+        body = self.definitions.get(name)
+        if body is not None:
+            self.execute(body)
             return
 
         # Undefined word
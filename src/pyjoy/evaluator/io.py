@@ -10,11 +10,12 @@ from __future__ import annotations
 
 import io as io_module
 import sys
+from typing import Any
 
 from pyjoy.errors import JoyTypeError
 from pyjoy.parser import parse
 from pyjoy.stack import ExecutionContext
-from pyjoy.types import JoyType, JoyValue
+from pyjoy.types import FALSE, TRUE, JoyType, JoyValue
 
 from .core import joy_word
 
@@ -32,12 +33,37 @@ def _expect_file(v: JoyValue, op: str) -> io_module.IOBase:
 # Output Primitives
 # -----------------------------------------------------------------------------
 
+_INTEGER = JoyType.INTEGER
+_FLOAT = JoyType.FLOAT
+_STRING = JoyType.STRING
+_CHAR = JoyType.CHAR
+
+
+def _write_value(x: Any, end: str) -> None:
+    """Write the Joy representation of X followed by END to stdout.
+
+    Scalars are formatted directly instead of going through
+    ``JoyValue.__repr__``; everything else falls back to ``repr``.
+    """
+    if x.__class__ is JoyValue:
+        t = x.type
+        if t is _INTEGER or t is _FLOAT:
+            text = str(x.value)
+        elif t is _STRING:
+            text = '"' + x.value + '"'
+        elif t is _CHAR:
+            text = "'" + x.value + "'"
+        else:
+            text = repr(x)
+    else:
+        text = repr(x)
+    sys.stdout.write(text + end)
+
 
 @joy_word(name=".", params=1, doc="X ->")
 def print_top(ctx: ExecutionContext) -> None:
     """Pop and print top of stack."""
-    top = ctx.stack.pop()
-    print(repr(top))
+    _write_value(ctx.stack.pop(), "\n")
 
 
 @joy_word(name="newline", params=0, doc="->")
@@ -49,23 +75,20 @@ def newline(ctx: ExecutionContext) -> None:
 @joy_word(name="put", params=1, doc="X ->")
 def put(ctx: ExecutionContext) -> None:
     """Write X to output, then pop X off stack."""
-    x = ctx.stack.pop()
-    print(repr(x), end="")
+    _write_value(ctx.stack.pop(), "")
 
 
 @joy_word(name=".", params=0, doc="X ->")
 def dot(ctx: ExecutionContext) -> None:
     """Write X to output with newline, then pop X off stack. No-op if stack empty."""
     if ctx.stack.depth > 0:
-        x = ctx.stack.pop()
-        print(repr(x))
+        _write_value(ctx.stack.pop(), "\n")
 
 
 @joy_word(name="putln", params=1, doc="X ->")
 def putln(ctx: ExecutionContext) -> None:
     """Write X to output with newline."""
-    x = ctx.stack.pop()
-    print(repr(x))
+    _write_value(ctx.stack.pop(), "\n")
 
 
 @joy_word(name="putch", params=1, doc="N ->")
@@ -251,7 +274,7 @@ def ferror(ctx: ExecutionContext) -> None:
     _expect_file(stream, "ferror")
     # Python files don't have a simple error flag like C
     # Just return false for now
-    ctx.stack.push_value(JoyValue.boolean(False))
+    ctx.stack.push_value(FALSE)
 
 
 @joy_word(name="ftell", params=1, doc="S -> S I")
@@ -278,9 +301,9 @@ def fseek(ctx: ExecutionContext) -> None:
         f.seek(pos.value, whence.value)
         # C fseek returns 0 on success, non-zero on failure
         # !!fseek means: success -> false, failure -> true
-        ctx.stack.push_value(JoyValue.boolean(False))  # Success
+        ctx.stack.push_value(FALSE)  # Success
     except (OSError, IOError):
-        ctx.stack.push_value(JoyValue.boolean(True))  # Error occurred
+        ctx.stack.push_value(TRUE)  # Error occurred
 
 
 @joy_word(name="fputch", params=2, doc="S C -> S")
@@ -374,9 +397,9 @@ def fremove(ctx: ExecutionContext) -> None:
         raise JoyTypeError("fremove", "string", path.type.name)
     try:
         os.remove(path.value)
-        ctx.stack.push_value(JoyValue.boolean(True))
+        ctx.stack.push_value(TRUE)
     except OSError:
-        ctx.stack.push_value(JoyValue.boolean(False))
+        ctx.stack.push_value(FALSE)
 
 
 @joy_word(name="frename", params=2, doc="P1 P2 -> B")
@@ -391,9 +414,9 @@ def frename(ctx: ExecutionContext) -> None:
         raise JoyTypeError("frename", "string (new)", new_path.type.name)
     try:
         os.rename(old_path.value, new_path.value)
-        ctx.stack.push_value(JoyValue.boolean(True))
+        ctx.stack.push_value(TRUE)
     except OSError:
-        ctx.stack.push_value(JoyValue.boolean(False))
+        ctx.stack.push_value(FALSE)
 
 
 @joy_word(name="filetime", params=1, doc="P -> I")
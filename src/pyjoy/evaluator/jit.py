@@ -0,0 +1,277 @@
+"""
+pyjoy.evaluator.jit - Native code for hot integer quotations.
+
+Straight-line quotations built only from integer/boolean literals,
+integer arithmetic, comparisons and stack shuffles (e.g. ``[dup 1 -]``,
+``[swap over +]``) are translated into a single Python function that works
+directly on the stack list. The translation is done statically: the
+quotation's stack effect is computed up front, so the generated function
+reads its inputs, checks that the ones used arithmetically are INTEGER
+values, and writes its outputs in one step.
+
+If the guard fails (too few items, or a non-integer operand) the function
+returns False without touching the stack and the evaluator runs the
+quotation normally, so errors and mixed-type semantics are unchanged.
+Only strict mode is supported.
+
+Other straight-line quotations (only primitive calls and literal pushes,
+in either mode) get ThreadedCode instead: the compiled entries are
+unrolled into one function that calls the primitives in sequence, which
+removes the evaluator's per-entry dispatch.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pyjoy.types import FALSE, TRUE, JoyType, JoyValue
+
+# Number of plain executions before a quotation's native code is generated
+JIT_THRESHOLD = 50
+
+# Stack shuffles: word -> (module, function, params, outputs). Outputs are
+# indices into the popped parameters, 0 being the deepest.
+_SHUFFLES: Dict[str, Tuple[str, str, int, Tuple[int, ...]]] = {
+    "id": ("stack_ops", "id_", 0, ()),
+    "dup": ("stack_ops", "dup", 1, (0, 0)),
+    "pop": ("stack_ops", "pop", 1, ()),
+    "swap": ("stack_ops", "swap", 2, (1, 0)),
+    "over": ("stack_ops", "over", 2, (0, 1, 0)),
+    "dup2": ("stack_ops", "dup2", 2, (0, 1, 0, 1)),
+    "dupd": ("stack_ops", "dupd", 2, (0, 0, 1)),
+    "popd": ("stack_ops", "popd", 2, (1,)),
+    "rotate": ("stack_ops", "rotate", 3, (2, 1, 0)),
+    "rollup": ("stack_ops", "rollup", 3, (2, 0, 1)),
+    "rolldown": ("stack_ops", "rolldown", 3, (1, 2, 0)),
+    "swapd": ("stack_ops", "swapd", 3, (1, 0, 2)),
+    "rotated": ("stack_ops", "rotated", 4, (2, 1, 0, 3)),
+    "rollupd": ("stack_ops", "rollupd", 4, (2, 0, 1, 3)),
+    "rolldownd": ("stack_ops", "rolldownd", 4, (1, 2, 0, 3)),
+}
+
+# Integer operations: word -> (module, function, params, template, result).
+# Templates use {0}, {1}, ... for the operands, deepest first.
+_OPERATORS: Dict[str, Tuple[str, str, int, str, str]] = {
+    "+": ("arithmetic", "add", 2, "{0} + {1}", "int"),
+    "-": ("arithmetic", "sub", 2, "{0} - {1}", "int"),
+    "*": ("arithmetic", "mul", 2, "{0} * {1}", "int"),
+    "max": ("arithmetic", "max_word", 2, "max({0}, {1})", "int"),
+    "min": ("arithmetic", "min_word", 2, "min({0}, {1})", "int"),
+    "succ": ("arithmetic", "succ", 1, "{0} + 1", "int"),
+    "pred": ("arithmetic", "pred", 1, "{0} - 1", "int"),
+    "neg": ("arithmetic", "neg", 1, "-{0}", "int"),
+    "abs": ("arithmetic", "abs_word", 1, "abs({0})", "int"),
+    "<": ("logic", "lt", 2, "{0} < {1}", "bool"),
+    ">": ("logic", "gt", 2, "{0} > {1}", "bool"),
+    "<=": ("logic", "le", 2, "{0} <= {1}", "bool"),
+    ">=": ("logic", "ge", 2, "{0} >= {1}", "bool"),
+    "=": ("logic", "eq", 2, "{0} == {1}", "bool"),
+    "!=": ("logic", "ne", 2, "{0} != {1}", "bool"),
+}
+
+
+def _is_stock(func: Any, module: str, name: str) -> bool:
+    """Check that a registered primitive is the built-in implementation."""
+    return (
+        getattr(func, "__module__", None) == "pyjoy.evaluator." + module
+        and getattr(func, "__name__", None) == name
+    )
+
+
+class NativeCode:
+    """
+    Lazily generated native code for a quotation.
+
+    ``run(items)`` executes the quotation against a stack list and returns
+    True, or returns False (leaving the stack untouched) if the quotation
+    must be interpreted instead. Until ``JIT_THRESHOLD`` calls have been
+    made it always returns False, so one-shot quotations never pay for
+    code generation.
+
+    ``inputs`` is the number of stack items the quotation reads and
+    ``outputs`` the number it leaves in their place.
+    """
+
+    __slots__ = ("source", "constants", "inputs", "outputs", "run", "_calls")
+
+    def __init__(
+        self,
+        source: str,
+        constants: Tuple[JoyValue, ...] = (),
+        inputs: int = 0,
+        outputs: int = 0,
+    ) -> None:
+        self.source = source
+        self.constants = constants
+        self.inputs = inputs
+        self.outputs = outputs
+        self._calls = 0
+        self.run: Callable[[List[Any]], bool] = self._warmup
+
+    def _warmup(self, items: List[Any]) -> bool:
+        self._calls += 1
+        if self._calls < JIT_THRESHOLD:
+            return False
+        namespace: Dict[str, Any] = {
+            "JoyValue": JoyValue,
+            "INTEGER": JoyType.INTEGER,
+            "TRUE": TRUE,
+            "FALSE": FALSE,
+        }
+        for i, value in enumerate(self.constants):
+            namespace[f"c{i}"] = value
+        exec(compile(self.source, "<joy-native>", "exec"), namespace)
+        self.run = namespace["native"]
+        return self.run(items)
+
+
+class ThreadedCode:
+    """
+    Lazily generated straight-line code for a compiled quotation.
+
+    ``steps`` are (method, payload) pairs: method None calls the payload
+    primitive with the context, otherwise the payload is passed to that
+    method of the stack list ("append" or "extend"). ``run(ctx)`` executes
+    the steps and returns True; like NativeCode it returns False (so the
+    evaluator interprets the entries itself) until ``JIT_THRESHOLD`` calls
+    have been made.
+    """
+
+    __slots__ = ("steps", "run", "_calls")
+
+    def __init__(self, steps: List[Tuple[Optional[str], Any]]) -> None:
+        self.steps = steps
+        self._calls = 0
+        self.run: Callable[[Any], bool] = self._warmup
+
+    def _warmup(self, ctx: Any) -> bool:
+        self._calls += 1
+        if self._calls < JIT_THRESHOLD:
+            return False
+        namespace: Dict[str, Any] = {}
+        source = ["def threaded(ctx):"]
+        for i, (method, payload) in enumerate(self.steps):
+            namespace[f"a{i}"] = payload
+            if method is None:
+                source.append(f"    a{i}(ctx)")
+            else:
+                # Re-read the list each time: primitives may replace it
+                source.append(f"    ctx.stack._items.{method}(a{i})")
+        source.append("    return True")
+        exec(compile("\n".join(source) + "\n", "<joy-threaded>", "exec"), namespace)
+        self.run = namespace["threaded"]
+        return self.run(ctx)
+
+
+def compile_quotation(
+    terms: Tuple[Any, ...], primitives: Dict[str, Any]
+) -> Optional[NativeCode]:
+    """
+    Translate a quotation into native code, if it is eligible.
+
+    Args:
+        terms: Quotation terms
+        primitives: The primitive registry, used to make sure each word
+            still refers to its built-in implementation
+
+    Returns:
+        NativeCode, or None if the quotation cannot be translated
+    """
+    if len(terms) < 2:
+        return None
+
+    # Symbolic stack entries: ("in", k) for the k-th input (0 = TOS on
+    # entry), ("lit", value) for literals, ("tmp", expr, kind) for results
+    stack: List[Tuple[Any, ...]] = []
+    n_inputs = 0
+    guarded: set[int] = set()
+    lines: List[str] = []
+    constants: List[JoyValue] = []
+
+    def take(n: int) -> List[Tuple[Any, ...]]:
+        nonlocal n_inputs
+        while len(stack) < n:
+            stack.insert(0, ("in", n_inputs))
+            n_inputs += 1
+        args = stack[len(stack) - n :]
+        del stack[len(stack) - n :]
+        return args
+
+    def operand(entry: Tuple[Any, ...]) -> Optional[str]:
+        if entry[0] == "in":
+            guarded.add(entry[1])
+            return f"x{entry[1]}.value"
+        if entry[0] == "lit":
+            value = entry[1]
+            return repr(value.value) if value.type == JoyType.INTEGER else None
+        return entry[1] if entry[2] == "int" else None
+
+    for term in terms:
+        if isinstance(term, JoyValue) and term.type != JoyType.SYMBOL:
+            if term.type not in (JoyType.INTEGER, JoyType.BOOLEAN):
+                return None
+            stack.append(("lit", term))
+            continue
+        if isinstance(term, JoyValue):
+            term = term.value
+        if not isinstance(term, str):
+            return None
+
+        func = primitives.get(term)
+        if term in _SHUFFLES:
+            module, name, params, outputs = _SHUFFLES[term]
+            if not _is_stock(func, module, name):
+                return None
+            args = take(params)
+            stack.extend(args[i] for i in outputs)
+        elif term in _OPERATORS:
+            module, name, params, template, kind = _OPERATORS[term]
+            if not _is_stock(func, module, name):
+                return None
+            operands = [operand(entry) for entry in take(params)]
+            if None in operands:
+                return None
+            temp = f"t{len(lines)}"
+            lines.append(f"    {temp} = {template.format(*operands)}")
+            stack.append(("tmp", temp, kind))
+        else:
+            return None
+
+    # Inputs that stay in place at the bottom need not be rewritten
+    keep = 0
+    while (
+        keep < len(stack)
+        and keep < n_inputs
+        and stack[keep] == ("in", n_inputs - 1 - keep)
+    ):
+        keep += 1
+
+    pushes = []
+    for entry in stack[keep:]:
+        if entry[0] == "in":
+            pushes.append(f"x{entry[1]}")
+        elif entry[0] == "lit":
+            constants.append(entry[1])
+            pushes.append(f"c{len(constants) - 1}")
+        elif entry[2] == "int":
+            pushes.append(f"JoyValue(INTEGER, {entry[1]})")
+        else:
+            pushes.append(f"(TRUE if {entry[1]} else FALSE)")
+
+    source = ["def native(items):"]
+    if n_inputs:
+        source.append(f"    if len(items) < {n_inputs}:")
+        source.append("        return False")
+        names = ", ".join(f"x{k}" for k in reversed(range(n_inputs)))
+        source.append(f"    {names}, = items[-{n_inputs}:]")
+        for k in sorted(guarded):
+            source.append(f"    if x{k}.type is not INTEGER:")
+            source.append("        return False")
+    source.extend(lines)
+    if n_inputs > keep:
+        source.append(f"    del items[-{n_inputs - keep}:]")
+    if pushes:
+        source.append(f"    items.extend(({', '.join(pushes)},))")
+    source.append("    return True")
+
+    return NativeCode("\n".join(source) + "\n", tuple(constants), n_inputs, len(stack))
@@ -7,12 +7,12 @@ Contains: <, >, <=, >=, =, !=, equal, compare, and, or, not, xor
 from __future__ import annotations
 
 import struct
-from typing import Any
+from typing import Any, Callable
 
 from pyjoy.stack import ExecutionContext
-from pyjoy.types import JoyQuotation, JoyType, JoyValue
+from pyjoy.types import FALSE, TRUE, JoyQuotation, JoyType, JoyValue
 
-from .core import is_joy_value, joy_word
+from .core import WordFunc, is_joy_value, joy_word
 
 
 def _float_to_bits(f: float) -> int:
@@ -20,6 +20,35 @@ def _float_to_bits(f: float) -> int:
     return struct.unpack(">Q", struct.pack(">d", f))[0]
 
 
+def _not_comparable(value: Any) -> None:
+    """Comparison value for types with no numeric interpretation."""
+    return None
+
+
+def _empty_is_zero(items: Any) -> int | None:
+    """Comparison value for aggregates: 0 if empty, else not comparable."""
+    return 0 if len(items) == 0 else None
+
+
+# Comparison value per JoyValue type: None means the payload is used as-is,
+# otherwise a function of the payload (returning None if not comparable).
+_COMPARE_EXTRACT: dict[JoyType, Callable[[Any], int | None] | None] = {
+    JoyType.INTEGER: None,
+    JoyType.FLOAT: None,
+    JoyType.CHAR: ord,
+    JoyType.BOOLEAN: int,
+    # Set is a bitset - convert to integer
+    JoyType.SET: lambda members: sum(1 << n for n in members),
+    # Empty list/quotation/string equals 0
+    JoyType.LIST: _empty_is_zero,
+    JoyType.QUOTATION: lambda quot: _empty_is_zero(quot.terms),
+    JoyType.STRING: _empty_is_zero,
+    # Failed file open (None value) equals 0
+    # Valid file handles are not numerically comparable
+    JoyType.FILE: lambda handle: 0 if handle is None else None,
+}
+
+
 def _numeric_value(v: Any) -> int | float | None:
     """Extract numeric value for comparison.
 
@@ -37,30 +66,8 @@ def _numeric_value(v: Any) -> int | float | None:
     """
     # Handle JoyValue objects
     if is_joy_value(v):
-        if v.type == JoyType.INTEGER:
-            return v.value
-        elif v.type == JoyType.FLOAT:
-            return v.value
-        elif v.type == JoyType.CHAR:
-            return ord(v.value)
-        elif v.type == JoyType.BOOLEAN:
-            return 1 if v.value else 0
-        elif v.type == JoyType.SET:
-            # Set is a bitset - convert to integer
-            return sum(1 << n for n in v.value)
-        elif v.type in (JoyType.LIST, JoyType.QUOTATION):
-            # Empty list/quotation equals 0
-            items = v.value if v.type == JoyType.LIST else v.value.terms
-            return 0 if len(items) == 0 else None  # None means not comparable
-        elif v.type == JoyType.STRING:
-            # Empty string equals 0
-            return 0 if len(v.value) == 0 else None
-        elif v.type == JoyType.FILE:
-            # Failed file open (None value) equals 0
-            # Valid file handles are not numerically comparable
-            return 0 if v.value is None else None
-        else:
-            return None  # Not numerically comparable
+        extract = _COMPARE_EXTRACT.get(v.type, _not_comparable)
+        return v.value if extract is None else extract(v.value)
 
     # Handle raw Python values (pythonic mode)
     if isinstance(v, bool):
@@ -130,57 +137,46 @@ def _can_compare_numerically(a: Any, b: Any) -> tuple[bool, Any, Any]:
 def _push_boolean(ctx: ExecutionContext, result: bool) -> None:
     """Push a boolean result in a mode-appropriate way."""
     if ctx.strict:
-        ctx.stack.push_value(JoyValue.boolean(result))
+        ctx.stack.push_value(TRUE if result else FALSE)
     else:
         ctx.stack.push(result)
 
 
-@joy_word(name="<", params=2, doc="X Y -> B")
-def lt(ctx: ExecutionContext) -> None:
-    """Less than."""
-    b, a = ctx.stack.pop_n(2)
-    can_cmp, av, bv = _can_compare_numerically(a, b)
-    if can_cmp:
-        result = av < bv
-    else:
-        result = False
-    _push_boolean(ctx, result)
-
-
-@joy_word(name=">", params=2, doc="X Y -> B")
-def gt(ctx: ExecutionContext) -> None:
-    """Greater than."""
-    b, a = ctx.stack.pop_n(2)
+_INTEGER = JoyType.INTEGER
+
+# The ordering comparisons are generated from _ORDERING_TEMPLATE. Each first
+# checks for two INTEGER JoyValues in strict mode (the common case) before
+# falling back to the general comparable-value extraction, which also pushes
+# the result in the stack form of the current mode.
+
+_ORDERING_TEMPLATE = """
+def {func}(ctx):
+    \"\"\"{summary}\"\"\"
+    b, a = ctx.stack.pop2()
+    if (
+        a.__class__ is b.__class__ is JoyValue
+        and a.type is b.type is _INTEGER
+        and ctx.strict
+    ):
+        ctx.stack.push_value(TRUE if a.value {op} b.value else FALSE)
+        return
     can_cmp, av, bv = _can_compare_numerically(a, b)
-    if can_cmp:
-        result = av > bv
-    else:
-        result = False
-    _push_boolean(ctx, result)
+    _push_boolean(ctx, can_cmp and av {op} bv)
+"""
 
 
-@joy_word(name="<=", params=2, doc="X Y -> B")
-def le(ctx: ExecutionContext) -> None:
-    """Less than or equal."""
-    b, a = ctx.stack.pop_n(2)
-    can_cmp, av, bv = _can_compare_numerically(a, b)
-    if can_cmp:
-        result = av <= bv
-    else:
-        result = False
-    _push_boolean(ctx, result)
+def _ordering_word(name: str, func: str, summary: str) -> WordFunc:
+    """Generate an ordering comparison primitive for operator ``name``."""
+    source = _ORDERING_TEMPLATE.format(func=func, summary=summary, op=name)
+    namespace = globals()
+    exec(compile(source, f"<pyjoy.evaluator.logic:{func}>", "exec"), namespace)
+    return joy_word(name=name, params=2, doc="X Y -> B")(namespace[func])
 
 
-@joy_word(name=">=", params=2, doc="X Y -> B")
-def ge(ctx: ExecutionContext) -> None:
-    """Greater than or equal."""
-    b, a = ctx.stack.pop_n(2)
-    can_cmp, av, bv = _can_compare_numerically(a, b)
-    if can_cmp:
-        result = av >= bv
-    else:
-        result = False
-    _push_boolean(ctx, result)
+lt = _ordering_word("<", "lt", "Less than.")
+gt = _ordering_word(">", "gt", "Greater than.")
+le = _ordering_word("<=", "le", "Less than or equal.")
+ge = _ordering_word(">=", "ge", "Greater than or equal.")
 
 
 @joy_word(name="=", params=2, doc="X Y -> B")
@@ -193,7 +189,14 @@ def eq(ctx: ExecutionContext) -> None:
     - Symbols compare with their string names
     - Non-empty lists/quotations are only equal to themselves
     """
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
+    if (
+        a.__class__ is b.__class__ is JoyValue
+        and a.type is b.type is _INTEGER
+        and ctx.strict
+    ):
+        ctx.stack.push_value(TRUE if a.value == b.value else FALSE)
+        return
     result = _joy_equals(a, b, ctx.strict)
     _push_boolean(ctx, result)
 
@@ -290,7 +293,14 @@ def _joy_equals(a: Any, b: Any, strict: bool = True) -> bool:
 @joy_word(name="!=", params=2, doc="X Y -> B")
 def ne(ctx: ExecutionContext) -> None:
     """Not equal."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
+    if (
+        a.__class__ is b.__class__ is JoyValue
+        and a.type is b.type is _INTEGER
+        and ctx.strict
+    ):
+        ctx.stack.push_value(TRUE if a.value != b.value else FALSE)
+        return
     result = not _joy_equals(a, b, ctx.strict)
     _push_boolean(ctx, result)
 
@@ -298,7 +308,7 @@ def ne(ctx: ExecutionContext) -> None:
 @joy_word(name="equal", params=2, doc="T U -> B")
 def equal(ctx: ExecutionContext) -> None:
     """Recursively test whether trees T and U are identical."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
     result = _values_equal(a, b, ctx.strict)
     _push_boolean(ctx, result)
 
@@ -398,7 +408,7 @@ def compare(ctx: ExecutionContext) -> None:
     - Files: compare by identity/order
     - Different incompatible types: 1
     """
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
     result = _joy_compare(a, b, ctx.strict)
     if ctx.strict:
         ctx.stack.push_value(JoyValue.integer(result))
@@ -490,6 +500,11 @@ def _joy_compare(a: Any, b: Any, strict: bool = True) -> int:
 # -----------------------------------------------------------------------------
 
 
+# and/or/xor/not first handle BOOLEAN JoyValues (the common case) by
+# pushing one of the operands or a TRUE/FALSE singleton directly.
+_BOOLEAN = JoyType.BOOLEAN
+
+
 def _is_truthy(v: Any) -> bool:
     """Check if a value is truthy in a mode-agnostic way."""
     if is_joy_value(v):
@@ -515,7 +530,18 @@ def _get_set_value(v: Any) -> frozenset:
 @joy_word(name="and", params=2, doc="B1 B2 -> B | S1 S2 -> S")
 def and_word(ctx: ExecutionContext) -> None:
     """Logical and, or set intersection."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
+    if (
+        a.__class__ is b.__class__ is JoyValue
+        and a.type is b.type is _BOOLEAN
+        and ctx.strict
+    ):
+        ctx.stack.push_value(b if a.value else a)
+        return
+    if a.__class__ is b.__class__ is bool:
+        # Pythonic mode booleans: bitwise ops on bools give bools
+        ctx.stack.push_value(a & b)
+        return
     # Set intersection
     if _is_set(a) and _is_set(b):
         result = _get_set_value(a) & _get_set_value(b)
@@ -531,7 +557,18 @@ def and_word(ctx: ExecutionContext) -> None:
 @joy_word(name="or", params=2, doc="B1 B2 -> B | S1 S2 -> S")
 def or_word(ctx: ExecutionContext) -> None:
     """Logical or, or set union."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
+    if (
+        a.__class__ is b.__class__ is JoyValue
+        and a.type is b.type is _BOOLEAN
+        and ctx.strict
+    ):
+        ctx.stack.push_value(a if a.value else b)
+        return
+    if a.__class__ is b.__class__ is bool:
+        # Pythonic mode booleans: bitwise ops on bools give bools
+        ctx.stack.push_value(a | b)
+        return
     # Set union
     if _is_set(a) and _is_set(b):
         result = _get_set_value(a) | _get_set_value(b)
@@ -548,6 +585,12 @@ def or_word(ctx: ExecutionContext) -> None:
 def not_word(ctx: ExecutionContext) -> None:
     """Logical not, or set complement."""
     a = ctx.stack.pop()
+    if a.__class__ is JoyValue and a.type is _BOOLEAN and ctx.strict:
+        ctx.stack.push_value(FALSE if a.value else TRUE)
+        return
+    if a.__class__ is bool:
+        ctx.stack.push_value(not a)
+        return
     # Set complement (all 64 possible members minus current)
     if _is_set(a):
         all_members = frozenset(range(64))
@@ -564,7 +607,18 @@ def not_word(ctx: ExecutionContext) -> None:
 @joy_word(name="xor", params=2, doc="B1 B2 -> B | S1 S2 -> S")
 def xor_word(ctx: ExecutionContext) -> None:
     """Logical exclusive or, or set symmetric difference."""
-    b, a = ctx.stack.pop_n(2)
+    b, a = ctx.stack.pop2()
+    if (
+        a.__class__ is b.__class__ is JoyValue
+        and a.type is b.type is _BOOLEAN
+        and ctx.strict
+    ):
+        ctx.stack.push_value(TRUE if bool(a.value) != bool(b.value) else FALSE)
+        return
+    if a.__class__ is b.__class__ is bool:
+        # Pythonic mode booleans: bitwise ops on bools give bools
+        ctx.stack.push_value(a ^ b)
+        return
     # Set symmetric difference
     if _is_set(a) and _is_set(b):
         result = _get_set_value(a) ^ _get_set_value(b)
@@ -586,7 +640,7 @@ def xor_word(ctx: ExecutionContext) -> None:
 def true_(ctx: ExecutionContext) -> None:
     """Push true."""
     if ctx.strict:
-        ctx.stack.push_value(JoyValue.boolean(True))
+        ctx.stack.push_value(TRUE)
     else:
         ctx.stack.push(True)
 
@@ -595,6 +649,6 @@ def true_(ctx: ExecutionContext) -> None:
 def false_(ctx: ExecutionContext) -> None:
     """Push false."""
     if ctx.strict:
-        ctx.stack.push_value(JoyValue.boolean(False))
+        ctx.stack.push_value(FALSE)
     else:
         ctx.stack.push(False)
@@ -42,18 +42,22 @@ def id_(ctx: ExecutionContext) -> None:
     pass
 
 
+# The shuffles below permute the stack list in place; the joy_word wrapper
+# has already checked the depth.
+
+
 @joy_word(name="swap", params=2, doc="X Y -> Y X")
 def swap(ctx: ExecutionContext) -> None:
     """Exchange top two stack items."""
-    b, a = ctx.stack.pop_n(2)
-    ctx.stack.push_value(b)
-    ctx.stack.push_value(a)
+    items = ctx.stack._items
+    items[-2], items[-1] = items[-1], items[-2]
 
 
 @joy_word(name="stack", params=0, doc=".. -> .. [..]")
 def stack_word(ctx: ExecutionContext) -> None:
     """Push a list of the current stack contents (TOS first)."""
-    items = tuple(reversed(ctx.stack.items()))
+    # Reverse the backing list directly; items() would copy it first
+    items = tuple(reversed(ctx.stack._items))
     ctx.stack.push_value(JoyValue.list(items))
 
 
@@ -92,83 +96,64 @@ def over(ctx: ExecutionContext) -> None:
 @joy_word(name="rotate", params=3, doc="X Y Z -> Z Y X")
 def rotate(ctx: ExecutionContext) -> None:
     """Rotate top three items: X Y Z -> Z Y X (flip first and third)."""
-    z, y, x = ctx.stack.pop_n(3)
-    ctx.stack.push_value(z)
-    ctx.stack.push_value(y)
-    ctx.stack.push_value(x)
+    items = ctx.stack._items
+    items[-3], items[-1] = items[-1], items[-3]
 
 
 @joy_word(name="rotated", params=4, doc="X Y Z W -> Z Y X W")
 def rotated(ctx: ExecutionContext) -> None:
     """Rotate under top: X Y Z W -> Z Y X W."""
-    w, z, y, x = ctx.stack.pop_n(4)
-    ctx.stack.push_value(z)
-    ctx.stack.push_value(y)
-    ctx.stack.push_value(x)
-    ctx.stack.push_value(w)
+    items = ctx.stack._items
+    items[-4], items[-2] = items[-2], items[-4]
 
 
 @joy_word(name="rollup", params=3, doc="X Y Z -> Z X Y")
 def rollup(ctx: ExecutionContext) -> None:
     """Roll up top three items: X Y Z -> Z X Y."""
-    z, y, x = ctx.stack.pop_n(3)
-    ctx.stack.push_value(z)
-    ctx.stack.push_value(x)
-    ctx.stack.push_value(y)
+    items = ctx.stack._items
+    items[-3], items[-2], items[-1] = items[-1], items[-3], items[-2]
 
 
 @joy_word(name="rolldown", params=3, doc="X Y Z -> Y Z X")
 def rolldown(ctx: ExecutionContext) -> None:
     """Roll down top three items (same as rotate)."""
-    z, y, x = ctx.stack.pop_n(3)
-    ctx.stack.push_value(y)
-    ctx.stack.push_value(z)
-    ctx.stack.push_value(x)
+    items = ctx.stack._items
+    items[-3], items[-2], items[-1] = items[-2], items[-1], items[-3]
 
 
 @joy_word(name="rollupd", params=4, doc="X Y Z W -> Z X Y W")
 def rollupd(ctx: ExecutionContext) -> None:
     """Rollup under top element: X Y Z W -> Z X Y W."""
-    w, z, y, x = ctx.stack.pop_n(4)
-    ctx.stack.push_value(z)
-    ctx.stack.push_value(x)
-    ctx.stack.push_value(y)
-    ctx.stack.push_value(w)
+    items = ctx.stack._items
+    items[-4], items[-3], items[-2] = items[-2], items[-4], items[-3]
 
 
 @joy_word(name="rolldownd", params=4, doc="X Y Z W -> Y Z X W")
 def rolldownd(ctx: ExecutionContext) -> None:
     """Rolldown under top element: X Y Z W -> Y Z X W."""
-    w, z, y, x = ctx.stack.pop_n(4)
-    ctx.stack.push_value(y)
-    ctx.stack.push_value(z)
-    ctx.stack.push_value(x)
-    ctx.stack.push_value(w)
+    items = ctx.stack._items
+    items[-4], items[-3], items[-2] = items[-3], items[-2], items[-4]
 
 
 @joy_word(name="dupd", params=2, doc="X Y -> X X Y")
 def dupd(ctx: ExecutionContext) -> None:
     """Duplicate second item."""
-    y, x = ctx.stack.pop_n(2)
-    ctx.stack.push_value(x)
-    ctx.stack.push_value(x)
-    ctx.stack.push_value(y)
+    items = ctx.stack._items
+    items.insert(-1, items[-2])
 
 
 @joy_word(name="popd", params=2, doc="X Y -> Y")
 def popd(ctx: ExecutionContext) -> None:
     """Pop second item."""
-    y, _ = ctx.stack.pop_n(2)
-    ctx.stack.push_value(y)
+    items = ctx.stack._items
+    del items[-2]
 
 
 @joy_word(name="swapd", params=3, doc="X Y Z -> Y X Z")
 def swapd(ctx: ExecutionContext) -> None:
     """Swap second and third items."""
-    z, y, x = ctx.stack.pop_n(3)
-    ctx.stack.push_value(y)
-    ctx.stack.push_value(x)
-    ctx.stack.push_value(z)
+    items = ctx.stack._items
+    items[-3], items[-2] = items[-2], items[-3]
 
 
 @joy_word(name="choice", params=3, doc="B T F -> X")
@@ -15,7 +15,7 @@ import time as time_module
 
 from pyjoy.errors import JoyTypeError, JoyUndefinedWord
 from pyjoy.stack import ExecutionContext
-from pyjoy.types import JoyQuotation, JoyType, JoyValue
+from pyjoy.types import EMPTY_QUOTATION, JoyQuotation, JoyType, JoyValue
 
 from .core import joy_word
 
@@ -471,13 +471,13 @@ def body_(ctx: ExecutionContext) -> None:
     elif u.type == JoyType.STRING:
         name = u.value
     else:
-        ctx.stack.push_value(JoyValue.quotation(JoyQuotation(())))
+        ctx.stack.push_value(JoyValue.quotation(EMPTY_QUOTATION))
         return
 
     if name in ctx.evaluator.definitions:
         ctx.stack.push_value(JoyValue.quotation(ctx.evaluator.definitions[name]))
     else:
-        ctx.stack.push_value(JoyValue.quotation(JoyQuotation(())))
+        ctx.stack.push_value(JoyValue.quotation(EMPTY_QUOTATION))
 
 
 @joy_word(name="assign", params=2, doc="X [N] ->")
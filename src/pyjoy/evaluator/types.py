@@ -10,21 +10,19 @@ iflist, iffloat, iffile
 
 from __future__ import annotations
 
-from typing import Any
+import struct
+from typing import Any, Callable, Optional
 
 from pyjoy.errors import JoyTypeError
 from pyjoy.stack import ExecutionContext
-from pyjoy.types import JoyQuotation, JoyType, JoyValue
+from pyjoy.types import FALSE, TRUE, JoyQuotation, JoyType, JoyValue
 
-from .core import expect_quotation, get_primitive, is_joy_value, joy_word
-
-
-def _push_boolean(ctx: ExecutionContext, result: bool) -> None:
-    """Push a boolean result in a mode-appropriate way."""
-    if ctx.strict:
-        ctx.stack.push_value(JoyValue.boolean(result))
-    else:
-        ctx.stack.push(result)
+from .core import (
+    WordFunc,
+    expect_quotation,
+    get_primitive,
+    joy_word,
+)
 
 
 def _push_integer(ctx: ExecutionContext, result: int) -> None:
@@ -39,10 +37,14 @@ def _push_integer(ctx: ExecutionContext, result: int) -> None:
 # Type Predicates
 # -----------------------------------------------------------------------------
 
+# The predicates push their boolean result inline (TRUE/FALSE in strict mode,
+# a raw bool otherwise) rather than through a helper, as they run in the
+# inner loops of many programs.
+
 
 def _check_type(x: Any, joy_type: JoyType, python_types: tuple) -> bool:
     """Check if x matches the given Joy type or Python types."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type == joy_type
     return isinstance(x, python_types)
 
@@ -51,137 +53,176 @@ def _check_type(x: Any, joy_type: JoyType, python_types: tuple) -> bool:
 def is_integer(ctx: ExecutionContext) -> None:
     """Test if X is an integer."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
-        result = x.type == JoyType.INTEGER
+    if x.__class__ is JoyValue:
+        result = x.type is JoyType.INTEGER
     else:
         result = isinstance(x, int) and not isinstance(x, bool)
-    _push_boolean(ctx, result)
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
 
 
 @joy_word(name="float", params=1, doc="X -> B")
 def is_float(ctx: ExecutionContext) -> None:
     """Test if X is a float."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
-        result = x.type == JoyType.FLOAT
+    if x.__class__ is JoyValue:
+        result = x.type is JoyType.FLOAT
     else:
         result = isinstance(x, float)
-    _push_boolean(ctx, result)
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
 
 
 @joy_word(name="char", params=1, doc="X -> B")
 def is_char(ctx: ExecutionContext) -> None:
     """Test if X is a character."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
-        result = x.type == JoyType.CHAR
+    if x.__class__ is JoyValue:
+        result = x.type is JoyType.CHAR
     else:
         # In pythonic mode, a single-character string is a char
         result = isinstance(x, str) and len(x) == 1
-    _push_boolean(ctx, result)
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
 
 
 @joy_word(name="string", params=1, doc="X -> B")
 def is_string(ctx: ExecutionContext) -> None:
     """Test if X is a string."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
-        result = x.type == JoyType.STRING
+    if x.__class__ is JoyValue:
+        result = x.type is JoyType.STRING
     else:
         # In pythonic mode, multi-char strings are strings (not chars)
         result = isinstance(x, str) and len(x) != 1
-    _push_boolean(ctx, result)
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
 
 
 @joy_word(name="list", params=1, doc="X -> B")
 def is_list(ctx: ExecutionContext) -> None:
     """Test if X is a list (or quotation, treated as list in Joy)."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         result = x.type in (JoyType.LIST, JoyType.QUOTATION)
     else:
         result = isinstance(x, (list, tuple, JoyQuotation))
-    _push_boolean(ctx, result)
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
 
 
 @joy_word(name="logical", params=1, doc="X -> B")
 def is_logical(ctx: ExecutionContext) -> None:
     """Test if X is a boolean."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
-        result = x.type == JoyType.BOOLEAN
+    if x.__class__ is JoyValue:
+        result = x.type is JoyType.BOOLEAN
     else:
         result = isinstance(x, bool)
-    _push_boolean(ctx, result)
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
 
 
 @joy_word(name="set", params=1, doc="X -> B")
 def is_set(ctx: ExecutionContext) -> None:
     """Test if X is a set."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
-        result = x.type == JoyType.SET
+    if x.__class__ is JoyValue:
+        result = x.type is JoyType.SET
     else:
         result = isinstance(x, frozenset)
-    _push_boolean(ctx, result)
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
 
 
 @joy_word(name="leaf", params=1, doc="X -> B")
 def is_leaf(ctx: ExecutionContext) -> None:
     """Test if X is an atom (not a list or quotation)."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
-        is_aggregate = x.type in (JoyType.LIST, JoyType.QUOTATION)
+    if x.__class__ is JoyValue:
+        result = x.type not in (JoyType.LIST, JoyType.QUOTATION)
+    else:
+        result = not isinstance(x, (list, tuple, JoyQuotation))
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
     else:
-        is_aggregate = isinstance(x, (list, tuple, JoyQuotation))
-    _push_boolean(ctx, not is_aggregate)
+        ctx.stack.push(result)
 
 
 @joy_word(name="file", params=1, doc="X -> B")
 def is_file(ctx: ExecutionContext) -> None:
     """Test if X is a file handle."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
-        result = x.type == JoyType.FILE
+    if x.__class__ is JoyValue:
+        result = x.type is JoyType.FILE
     else:
         # In pythonic mode, check for file-like object
         result = hasattr(x, "read") and hasattr(x, "write")
-    _push_boolean(ctx, result)
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
 
 
 @joy_word(name="user", params=1, doc="X -> B")
 def is_user(ctx: ExecutionContext) -> None:
     """Test if X is a user-defined symbol."""
     x = ctx.stack.pop()
-    if is_joy_value(x):
-        if x.type != JoyType.SYMBOL:
-            _push_boolean(ctx, False)
-        else:
-            is_defined = x.value in ctx.evaluator.definitions
-            _push_boolean(ctx, is_defined)
+    if x.__class__ is JoyValue:
+        result = x.type is JoyType.SYMBOL and x.value in ctx.evaluator.definitions
     else:
         # In pythonic mode, symbols are just strings
-        if isinstance(x, str):
-            is_defined = x in ctx.evaluator.definitions
-            _push_boolean(ctx, is_defined)
-        else:
-            _push_boolean(ctx, False)
+        result = isinstance(x, str) and x in ctx.evaluator.definitions
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
+
+
+# Type keys for raw Python values whose exact type decides the key
+_TYPE_KEYS_PY = {
+    bool: "BOOLEAN",
+    int: "INTEGER",
+    float: "FLOAT",
+    list: "LIST",
+    tuple: "LIST",
+    JoyQuotation: "QUOTATION",
+    frozenset: "SET",
+}
 
 
 def _get_type_key(x: Any) -> str:
     """Get a type key for comparison purposes."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type.name
+    key = _TYPE_KEYS_PY.get(type(x))
+    if key is not None:
+        return key
+    if isinstance(x, str):
+        if len(x) == 1:
+            return "CHAR"
+        return "STRING"
+    # Subclasses of the types above
     if isinstance(x, bool):
         return "BOOLEAN"
     if isinstance(x, int):
         return "INTEGER"
     if isinstance(x, float):
         return "FLOAT"
-    if isinstance(x, str):
-        if len(x) == 1:
-            return "CHAR"
-        return "STRING"
     if isinstance(x, (list, tuple)):
         return "LIST"
     if isinstance(x, JoyQuotation):
@@ -202,7 +243,7 @@ def sametype(ctx: ExecutionContext) -> None:
     """
     b, a = ctx.stack.pop_n(2)
 
-    if is_joy_value(a) and is_joy_value(b):
+    if a.__class__ is JoyValue and b.__class__ is JoyValue:
         # Both are JoyValues - check types
         if a.type != b.type:
             result = False
@@ -237,7 +278,35 @@ def sametype(ctx: ExecutionContext) -> None:
     else:
         result = _get_type_key(a) == _get_type_key(b)
 
-    _push_boolean(ctx, result)
+    if ctx.strict:
+        ctx.stack.push_value(TRUE if result else FALSE)
+    else:
+        ctx.stack.push(result)
+
+
+# Joy42 type codes for JoyValue tags and for raw Python values (pythonic
+# mode). str, JoyQuotation and file-like objects are handled by typeof_.
+_TYPE_CODES_JOY = {
+    JoyType.BOOLEAN: 4,
+    JoyType.CHAR: 5,
+    JoyType.INTEGER: 6,
+    JoyType.SET: 7,
+    JoyType.STRING: 8,
+    JoyType.LIST: 9,
+    JoyType.QUOTATION: 9,  # Quotation treated as list
+    JoyType.FLOAT: 10,
+    JoyType.FILE: 11,
+}
+
+_TYPE_CODES_PY = {
+    bool: 4,
+    int: 6,
+    frozenset: 7,
+    list: 9,
+    tuple: 9,
+    JoyQuotation: 9,
+    float: 10,
+}
 
 
 @joy_word(name="typeof", params=1, doc="X -> I")
@@ -252,7 +321,7 @@ def typeof_(ctx: ExecutionContext) -> None:
     x = ctx.stack.pop()
 
     # Handle JoyValue objects
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         # For symbols, check if it's a builtin or user-defined
         if x.type == JoyType.SYMBOL:
             # Check if it's registered as a primitive
@@ -264,45 +333,34 @@ def typeof_(ctx: ExecutionContext) -> None:
                 _push_integer(ctx, 2)  # USRDEF
             return
 
-        type_codes = {
-            JoyType.BOOLEAN: 4,
-            JoyType.CHAR: 5,
-            JoyType.INTEGER: 6,
-            JoyType.SET: 7,
-            JoyType.STRING: 8,
-            JoyType.LIST: 9,
-            JoyType.QUOTATION: 9,  # Quotation treated as list
-            JoyType.FLOAT: 10,
-            JoyType.FILE: 11,
-        }
-        _push_integer(ctx, type_codes.get(x.type, 0))
+        _push_integer(ctx, _TYPE_CODES_JOY.get(x.type, 0))
         return
 
     # Handle raw Python values (pythonic mode)
-    if isinstance(x, bool):
-        _push_integer(ctx, 4)  # BOOLEAN
-    elif isinstance(x, int):
-        _push_integer(ctx, 6)  # INTEGER
-    elif isinstance(x, float):
-        _push_integer(ctx, 10)  # FLOAT
-    elif isinstance(x, str):
-        if len(x) == 1:
-            _push_integer(ctx, 5)  # CHAR
+    code = _TYPE_CODES_PY.get(type(x))
+    if code is None:
+        if isinstance(x, str):
+            code = 5 if len(x) == 1 else 8  # CHAR / STRING
+        elif isinstance(x, bool):
+            code = 4
+        elif isinstance(x, int):
+            code = 6
+        elif isinstance(x, float):
+            code = 10
+        elif isinstance(x, (list, tuple, JoyQuotation)):
+            code = 9
+        elif isinstance(x, frozenset):
+            code = 7
+        elif hasattr(x, "read") and hasattr(x, "write"):
+            code = 11  # FILE
         else:
-            _push_integer(ctx, 8)  # STRING
-    elif isinstance(x, (list, tuple, JoyQuotation)):
-        _push_integer(ctx, 9)  # LIST
-    elif isinstance(x, frozenset):
-        _push_integer(ctx, 7)  # SET
-    elif hasattr(x, "read") and hasattr(x, "write"):
-        _push_integer(ctx, 11)  # FILE
-    else:
-        _push_integer(ctx, 0)  # UNKNOWN
+            code = 0  # UNKNOWN
+    _push_integer(ctx, code)
 
 
 def _get_int_value(v: Any, op: str) -> int:
     """Extract integer value from JoyValue or raw int."""
-    if is_joy_value(v):
+    if v.__class__ is JoyValue:
         if v.type != JoyType.INTEGER:
             raise JoyTypeError(op, "INTEGER", v.type.name)
         return v.value
@@ -313,11 +371,169 @@ def _get_int_value(v: Any, op: str) -> int:
 
 def _is_truthy(v: Any) -> bool:
     """Check if a value is truthy (mode-aware)."""
-    if is_joy_value(v):
+    if v.__class__ is JoyValue:
         return v.is_truthy()
     return bool(v)
 
 
+def _push_result(ctx: ExecutionContext, value: Any) -> None:
+    """Push a result in a mode-appropriate way."""
+    if ctx.strict:
+        ctx.stack.push_value(value)
+    else:
+        ctx.stack.push(value)
+
+
+# (member, mask) for each possible SET member
+_SET_BITS = tuple((i, 1 << i) for i in range(64))
+
+
+# Handlers for casting, one per target type code. Each receives the value X,
+# its Joy type and its raw value, and pushes the converted result.
+
+
+def _cast_to_boolean(
+    ctx: ExecutionContext, x: Any, x_type: JoyType, x_val: Any
+) -> None:
+    result = _is_truthy(x)
+    _push_result(ctx, JoyValue.boolean(result) if ctx.strict else result)
+
+
+def _cast_to_char(ctx: ExecutionContext, x: Any, x_type: JoyType, x_val: Any) -> None:
+    if x_type == JoyType.CHAR:
+        _push_result(ctx, x)
+    elif x_type == JoyType.INTEGER:
+        ch = chr(x_val & 0xFF)
+        _push_result(ctx, JoyValue.char(ch) if ctx.strict else ch)
+    elif x_type == JoyType.STRING and x_val:
+        ch = x_val[0]
+        _push_result(ctx, JoyValue.char(ch) if ctx.strict else ch)
+    else:
+        _push_result(ctx, JoyValue.char("\0") if ctx.strict else "\0")
+
+
+def _cast_to_integer(
+    ctx: ExecutionContext, x: Any, x_type: JoyType, x_val: Any
+) -> None:
+    if x_type == JoyType.INTEGER:
+        _push_result(ctx, x)
+        return
+    if x_type == JoyType.CHAR:
+        val = ord(x_val)
+    elif x_type == JoyType.FLOAT:
+        val = int(x_val)
+    elif x_type == JoyType.BOOLEAN:
+        val = 1 if x_val else 0
+    elif x_type == JoyType.SET:
+        # Convert set to bitfield integer
+        val = 0
+        for bit in x_val:
+            val |= 1 << bit
+    else:
+        val = 0
+    _push_result(ctx, JoyValue.integer(val) if ctx.strict else val)
+
+
+def _cast_to_set(ctx: ExecutionContext, x: Any, x_type: JoyType, x_val: Any) -> None:
+    if x_type == JoyType.SET:
+        _push_result(ctx, x)
+        return
+    items: frozenset[int]
+    if x_type == JoyType.INTEGER:
+        # Convert int bits to set members
+        items = frozenset(i for i, bit in _SET_BITS if x_val & bit)
+    elif x_type == JoyType.LIST:
+        if x.__class__ is JoyValue:
+            items = frozenset(
+                v.value
+                for v in x_val
+                if v.__class__ is JoyValue and v.type == JoyType.INTEGER
+            )
+        else:
+            items = frozenset(
+                v for v in x_val if isinstance(v, int) and not isinstance(v, bool)
+            )
+    else:
+        items = frozenset()
+    _push_result(ctx, JoyValue.joy_set(items) if ctx.strict else items)
+
+
+def _cast_to_string(ctx: ExecutionContext, x: Any, x_type: JoyType, x_val: Any) -> None:
+    if x_type == JoyType.STRING:
+        _push_result(ctx, x)
+        return
+    if x_type == JoyType.CHAR:
+        s = x_val
+    elif x_type == JoyType.LIST:
+        if x.__class__ is JoyValue:
+            s = "".join(
+                v.value
+                for v in x_val
+                if v.__class__ is JoyValue and v.type == JoyType.CHAR
+            )
+        else:
+            s = "".join(str(v) for v in x_val if isinstance(v, str) and len(v) == 1)
+    else:
+        s = str(x_val)
+    _push_result(ctx, JoyValue.string(s) if ctx.strict else s)
+
+
+def _cast_to_list(ctx: ExecutionContext, x: Any, x_type: JoyType, x_val: Any) -> None:
+    if x_type in (JoyType.LIST, JoyType.QUOTATION):
+        _push_result(ctx, x)
+    elif x_type == JoyType.STRING:
+        if ctx.strict:
+            _push_result(ctx, JoyValue.list(tuple(map(JoyValue.char, x_val))))
+        else:
+            _push_result(ctx, list(x_val))
+    elif x_type == JoyType.SET:
+        if ctx.strict:
+            items = tuple(JoyValue.integer(i) for i in sorted(x_val))
+            _push_result(ctx, JoyValue.list(items))
+        else:
+            _push_result(ctx, list(sorted(x_val)))
+    else:
+        _push_result(ctx, JoyValue.list(()) if ctx.strict else [])
+
+
+def _cast_to_float(ctx: ExecutionContext, x: Any, x_type: JoyType, x_val: Any) -> None:
+    if x_type == JoyType.FLOAT:
+        _push_result(ctx, x)
+        return
+    if x_type == JoyType.INTEGER:
+        # Bit-level reinterpretation: treat integer bits as IEEE 754 double
+        val = struct.unpack("d", struct.pack("Q", x_val & 0xFFFFFFFFFFFFFFFF))[0]
+    elif x_type == JoyType.CHAR:
+        val = float(ord(x_val))
+    elif x_type == JoyType.BOOLEAN:
+        val = 1.0 if x_val else 0.0
+    else:
+        val = 0.0
+    _push_result(ctx, JoyValue.floating(val) if ctx.strict else val)
+
+
+def _cast_to_file(ctx: ExecutionContext, x: Any, x_type: JoyType, x_val: Any) -> None:
+    # Can't really cast to file
+    _push_result(ctx, JoyValue.file(None) if ctx.strict else None)
+
+
+# Indexed by Joy42 type code; codes 0-3 have no cast and leave X unchanged
+_CAST_HANDLERS: tuple[Optional[Callable[..., None]], ...] = (
+    None,  # 0 = UNKNOWN
+    None,  # 1 = (reserved)
+    None,  # 2 = USRDEF
+    None,  # 3 = BUILTIN
+    _cast_to_boolean,  # 4
+    _cast_to_char,  # 5
+    _cast_to_integer,  # 6
+    _cast_to_set,  # 7
+    _cast_to_string,  # 8
+    _cast_to_list,  # 9
+    _cast_to_float,  # 10
+    _cast_to_file,  # 11
+)
+
+
 @joy_word(name="casting", params=2, doc="X T -> Y")
 def casting_(ctx: ExecutionContext) -> None:
     """Cast value X to type T (type code from typeof).
@@ -329,15 +545,16 @@ def casting_(ctx: ExecutionContext) -> None:
     t, x = ctx.stack.pop_n(2)
     target_type = _get_int_value(t, "casting")
 
-    # Helper to push result in mode-appropriate way
-    def push_result(value: Any) -> None:
-        if ctx.strict:
-            ctx.stack.push_value(value)
-        else:
-            ctx.stack.push(value)
+    handler = (
+        _CAST_HANDLERS[target_type] if 0 <= target_type < len(_CAST_HANDLERS) else None
+    )
+    if handler is None:
+        # Unknown type code - return value unchanged
+        _push_result(ctx, x)
+        return
 
     # Get raw value and type info for x
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         x_type = x.type
         x_val = x.value
     else:
@@ -360,147 +577,7 @@ def casting_(ctx: ExecutionContext) -> None:
         else:
             x_type = JoyType.OBJECT
 
-    # Joy42 type codes:
-    # 4=bool, 5=char, 6=int, 7=set, 8=string, 9=list, 10=float, 11=file
-    if target_type == 4:  # BOOLEAN
-        result = _is_truthy(x)
-        push_result(JoyValue.boolean(result) if ctx.strict else result)
-
-    elif target_type == 5:  # CHAR
-        if x_type == JoyType.CHAR:
-            push_result(x)
-        elif x_type == JoyType.INTEGER:
-            ch = chr(x_val & 0xFF)  # type: ignore[operator]
-            push_result(JoyValue.char(ch) if ctx.strict else ch)
-        elif x_type == JoyType.STRING and x_val:
-            ch = x_val[0]  # type: ignore[index]
-            push_result(JoyValue.char(ch) if ctx.strict else ch)
-        else:
-            push_result(JoyValue.char("\0") if ctx.strict else "\0")
-
-    elif target_type == 6:  # INTEGER
-        if x_type == JoyType.INTEGER:
-            push_result(x)
-        elif x_type == JoyType.CHAR:
-            val = ord(x_val)  # type: ignore[arg-type]
-            push_result(JoyValue.integer(val) if ctx.strict else val)
-        elif x_type == JoyType.FLOAT:
-            val = int(x_val)  # type: ignore[arg-type]
-            push_result(JoyValue.integer(val) if ctx.strict else val)
-        elif x_type == JoyType.BOOLEAN:
-            val = 1 if x_val else 0
-            push_result(JoyValue.integer(val) if ctx.strict else val)
-        elif x_type == JoyType.SET:
-            # Convert set to bitfield integer
-            int_val = 0
-            for bit in x_val:  # type: ignore[union-attr]
-                int_val |= 1 << bit
-            push_result(JoyValue.integer(int_val) if ctx.strict else int_val)
-        else:
-            push_result(JoyValue.integer(0) if ctx.strict else 0)
-
-    elif target_type == 7:  # SET
-        if x_type == JoyType.SET:
-            push_result(x)
-        elif x_type == JoyType.INTEGER:
-            # Convert int bits to set members
-            bits: set[int] = set()
-            int_val: int = x_val  # type: ignore[assignment]
-            for i in range(64):
-                if int_val & (1 << i):
-                    bits.add(i)
-            result_set: frozenset[int] = frozenset(bits)
-            push_result(JoyValue.joy_set(result_set) if ctx.strict else result_set)
-        elif x_type == JoyType.LIST:
-            if is_joy_value(x):
-                items = frozenset(
-                    v.value
-                    for v in x_val  # type: ignore[union-attr]
-                    if is_joy_value(v) and v.type == JoyType.INTEGER
-                )
-            else:
-                items = frozenset(
-                    v
-                    for v in x_val  # type: ignore[union-attr]
-                    if isinstance(v, int) and not isinstance(v, bool)
-                )
-            push_result(JoyValue.joy_set(items) if ctx.strict else items)
-        else:
-            push_result(JoyValue.joy_set(frozenset()) if ctx.strict else frozenset())
-
-    elif target_type == 8:  # STRING
-        if x_type == JoyType.STRING:
-            push_result(x)
-        elif x_type == JoyType.CHAR:
-            push_result(JoyValue.string(x_val) if ctx.strict else x_val)  # type: ignore[arg-type]
-        elif x_type == JoyType.INTEGER:
-            s = str(x_val)
-            push_result(JoyValue.string(s) if ctx.strict else s)
-        elif x_type == JoyType.FLOAT:
-            s = str(x_val)
-            push_result(JoyValue.string(s) if ctx.strict else s)
-        elif x_type == JoyType.LIST:
-            if is_joy_value(x):
-                chars = "".join(
-                    v.value
-                    for v in x_val  # type: ignore[union-attr]
-                    if is_joy_value(v) and v.type == JoyType.CHAR
-                )
-            else:
-                chars = "".join(
-                    str(v)
-                    for v in x_val  # type: ignore[union-attr]
-                    if isinstance(v, str) and len(v) == 1
-                )
-            push_result(JoyValue.string(chars) if ctx.strict else chars)
-        else:
-            s = str(x_val)
-            push_result(JoyValue.string(s) if ctx.strict else s)
-
-    elif target_type == 9:  # LIST
-        if x_type in (JoyType.LIST, JoyType.QUOTATION):
-            push_result(x)
-        elif x_type == JoyType.STRING:
-            if ctx.strict:
-                chars = tuple(JoyValue.char(c) for c in x_val)  # type: ignore[union-attr]
-                push_result(JoyValue.list(chars))
-            else:
-                push_result(list(x_val))  # type: ignore[arg-type]
-        elif x_type == JoyType.SET:
-            if ctx.strict:
-                items = tuple(JoyValue.integer(i) for i in sorted(x_val))  # type: ignore[arg-type]
-                push_result(JoyValue.list(items))
-            else:
-                push_result(list(sorted(x_val)))  # type: ignore[arg-type]
-        else:
-            push_result(JoyValue.list(()) if ctx.strict else [])
-
-    elif target_type == 10:  # FLOAT
-        if x_type == JoyType.FLOAT:
-            push_result(x)
-        elif x_type == JoyType.INTEGER:
-            # Bit-level reinterpretation: treat integer bits as IEEE 754 double
-            import struct
-
-            int_val: int = x_val & 0xFFFFFFFFFFFFFFFF  # type: ignore[assignment]
-            val = struct.unpack("d", struct.pack("Q", int_val))[0]
-            push_result(JoyValue.floating(val) if ctx.strict else val)
-        elif x_type == JoyType.CHAR:
-            val = float(ord(x_val))  # type: ignore[arg-type]
-            push_result(JoyValue.floating(val) if ctx.strict else val)
-        elif x_type == JoyType.BOOLEAN:
-            val = 1.0 if x_val else 0.0
-            push_result(JoyValue.floating(val) if ctx.strict else val)
-        else:
-            push_result(JoyValue.floating(0.0) if ctx.strict else 0.0)
-
-    elif target_type == 11:  # FILE
-        # Can't really cast to file
-        push_result(JoyValue.file(None) if ctx.strict else None)
-
-    else:
-        # Unknown type code - return value unchanged
-        push_result(x)
+    handler(ctx, x, x_type, x_val)
 
 
 # Bit-level reinterpretation casting
@@ -510,12 +587,10 @@ def bitcast_(ctx: ExecutionContext) -> None:
 
     Type codes: 0=int-to-float-bits, 1=float-to-int-bits
     """
-    import struct
-
     t, x = ctx.stack.pop_n(2)
     target_type = _get_int_value(t, "bitcast")
 
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         x_val = x.value
     else:
         x_val = x
@@ -552,35 +627,35 @@ def bitcast_(ctx: ExecutionContext) -> None:
 
 def _check_is_integer(x: Any) -> bool:
     """Check if x is an integer (mode-aware)."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type == JoyType.INTEGER
     return isinstance(x, int) and not isinstance(x, bool)
 
 
 def _check_is_char(x: Any) -> bool:
     """Check if x is a character (mode-aware)."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type == JoyType.CHAR
     return isinstance(x, str) and len(x) == 1
 
 
 def _check_is_logical(x: Any) -> bool:
     """Check if x is a boolean (mode-aware)."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type == JoyType.BOOLEAN
     return isinstance(x, bool)
 
 
 def _check_is_set(x: Any) -> bool:
     """Check if x is a set (mode-aware)."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type == JoyType.SET
     return isinstance(x, frozenset)
 
 
 def _check_is_string(x: Any) -> bool:
     """Check if x is a string (mode-aware)."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type == JoyType.STRING
     # In pythonic mode, multi-char strings are strings (not chars)
     return isinstance(x, str) and len(x) != 1
@@ -588,21 +663,21 @@ def _check_is_string(x: Any) -> bool:
 
 def _check_is_list(x: Any) -> bool:
     """Check if x is a list or quotation (mode-aware)."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type in (JoyType.LIST, JoyType.QUOTATION)
     return isinstance(x, (list, tuple, JoyQuotation))
 
 
 def _check_is_float(x: Any) -> bool:
     """Check if x is a float (mode-aware)."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type == JoyType.FLOAT
     return isinstance(x, float)
 
 
 def _check_is_file(x: Any) -> bool:
     """Check if x is a file (mode-aware)."""
-    if is_joy_value(x):
+    if x.__class__ is JoyValue:
         return x.type == JoyType.FILE
     return hasattr(x, "read") and hasattr(x, "write")
 
@@ -615,89 +690,25 @@ def _push_value_for_conditional(ctx: ExecutionContext, x: Any) -> None:
         ctx.stack.push(x)
 
 
-@joy_word(name="ifinteger", params=3, doc="X [T] [F] -> ...")
-def ifinteger(ctx: ExecutionContext) -> None:
-    """Execute T if X is integer, else F."""
-    f_quot, t_quot, x = ctx.stack.pop_n(3)
-    _push_value_for_conditional(ctx, x)
-    if _check_is_integer(x):
-        ctx.evaluator.execute(expect_quotation(t_quot, "ifinteger"))
-    else:
-        ctx.evaluator.execute(expect_quotation(f_quot, "ifinteger"))
-
-
-@joy_word(name="ifchar", params=3, doc="X [T] [F] -> ...")
-def ifchar(ctx: ExecutionContext) -> None:
-    """Execute T if X is char, else F."""
-    f_quot, t_quot, x = ctx.stack.pop_n(3)
-    _push_value_for_conditional(ctx, x)
-    if _check_is_char(x):
-        ctx.evaluator.execute(expect_quotation(t_quot, "ifchar"))
-    else:
-        ctx.evaluator.execute(expect_quotation(f_quot, "ifchar"))
-
-
-@joy_word(name="iflogical", params=3, doc="X [T] [F] -> ...")
-def iflogical(ctx: ExecutionContext) -> None:
-    """Execute T if X is boolean, else F."""
-    f_quot, t_quot, x = ctx.stack.pop_n(3)
-    _push_value_for_conditional(ctx, x)
-    if _check_is_logical(x):
-        ctx.evaluator.execute(expect_quotation(t_quot, "iflogical"))
-    else:
-        ctx.evaluator.execute(expect_quotation(f_quot, "iflogical"))
-
-
-@joy_word(name="ifset", params=3, doc="X [T] [F] -> ...")
-def ifset(ctx: ExecutionContext) -> None:
-    """Execute T if X is set, else F."""
-    f_quot, t_quot, x = ctx.stack.pop_n(3)
-    _push_value_for_conditional(ctx, x)
-    if _check_is_set(x):
-        ctx.evaluator.execute(expect_quotation(t_quot, "ifset"))
-    else:
-        ctx.evaluator.execute(expect_quotation(f_quot, "ifset"))
-
+def _type_conditional(name: str, check: Callable[[Any], bool], what: str) -> WordFunc:
+    """Create and register the type conditional NAME ("X [T] [F] -> ...")."""
 
-@joy_word(name="ifstring", params=3, doc="X [T] [F] -> ...")
-def ifstring(ctx: ExecutionContext) -> None:
-    """Execute T if X is string, else F."""
-    f_quot, t_quot, x = ctx.stack.pop_n(3)
-    _push_value_for_conditional(ctx, x)
-    if _check_is_string(x):
-        ctx.evaluator.execute(expect_quotation(t_quot, "ifstring"))
-    else:
-        ctx.evaluator.execute(expect_quotation(f_quot, "ifstring"))
+    def conditional(ctx: ExecutionContext) -> None:
+        f_quot, t_quot, x = ctx.stack.pop_n(3)
+        _push_value_for_conditional(ctx, x)
+        quot = t_quot if check(x) else f_quot
+        ctx.evaluator.execute(expect_quotation(quot, name))
 
-
-@joy_word(name="iflist", params=3, doc="X [T] [F] -> ...")
-def iflist(ctx: ExecutionContext) -> None:
-    """Execute T if X is list, else F."""
-    f_quot, t_quot, x = ctx.stack.pop_n(3)
-    _push_value_for_conditional(ctx, x)
-    if _check_is_list(x):
-        ctx.evaluator.execute(expect_quotation(t_quot, "iflist"))
-    else:
-        ctx.evaluator.execute(expect_quotation(f_quot, "iflist"))
+    conditional.__name__ = conditional.__qualname__ = name
+    conditional.__doc__ = f"Execute T if X is {what}, else F."
+    return joy_word(name=name, params=3, doc="X [T] [F] -> ...")(conditional)
 
 
-@joy_word(name="iffloat", params=3, doc="X [T] [F] -> ...")
-def iffloat(ctx: ExecutionContext) -> None:
-    """Execute T if X is float, else F."""
-    f_quot, t_quot, x = ctx.stack.pop_n(3)
-    _push_value_for_conditional(ctx, x)
-    if _check_is_float(x):
-        ctx.evaluator.execute(expect_quotation(t_quot, "iffloat"))
-    else:
-        ctx.evaluator.execute(expect_quotation(f_quot, "iffloat"))
-
-
-@joy_word(name="iffile", params=3, doc="X [T] [F] -> ...")
-def iffile(ctx: ExecutionContext) -> None:
-    """Execute T if X is file, else F."""
-    f_quot, t_quot, x = ctx.stack.pop_n(3)
-    _push_value_for_conditional(ctx, x)
-    if _check_is_file(x):
-        ctx.evaluator.execute(expect_quotation(t_quot, "iffile"))
-    else:
-        ctx.evaluator.execute(expect_quotation(f_quot, "iffile"))
+ifinteger = _type_conditional("ifinteger", _check_is_integer, "integer")
+ifchar = _type_conditional("ifchar", _check_is_char, "char")
+iflogical = _type_conditional("iflogical", _check_is_logical, "boolean")
+ifset = _type_conditional("ifset", _check_is_set, "set")
+ifstring = _type_conditional("ifstring", _check_is_string, "string")
+iflist = _type_conditional("iflist", _check_is_list, "list")
+iffloat = _type_conditional("iffloat", _check_is_float, "float")
+iffile = _type_conditional("iffile", _check_is_file, "file")
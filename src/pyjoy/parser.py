@@ -10,16 +10,21 @@ Supports Python interop syntax (when python_interop=True):
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any, List, Optional, Set
+from typing import AbstractSet, Any, Callable, Dict, List, Optional
 
 from pyjoy.errors import JoySetMemberError, JoySyntaxError
 from pyjoy.scanner import Scanner, Token
-from pyjoy.types import JoyQuotation, JoyValue
+from pyjoy.types import EMPTY_QUOTATION, FALSE, TRUE, JoyQuotation, JoyType, JoyValue
 
 # Sentinel for terms to skip
 _SKIP = object()
 
+# Terminators for container literals
+_QUOTATION_END = frozenset(("RBRACKET",))
+_SET_END = frozenset(("RBRACE",))
+
 
 @dataclass
 class Definition:
@@ -29,7 +34,7 @@ class Definition:
     body: JoyQuotation
 
 
-@dataclass
+@dataclass(slots=True)
 class PythonExpr:
     """A Python expression to evaluate and push result.
 
@@ -39,7 +44,7 @@ class PythonExpr:
     code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PythonStmt:
     """A Python statement to execute (no push).
 
@@ -69,10 +74,13 @@ class Parser:
     - PythonStmt for Python statements (when python_interop=True)
     """
 
+    __slots__ = ("_tokens", "_pos", "_python_interop", "_quotations")
+
     def __init__(self, python_interop: bool = False) -> None:
         self._tokens: List[Token] = []
         self._pos: int = 0
         self._python_interop = python_interop
+        self._quotations: Dict[tuple, JoyQuotation] = {}
 
     def parse(self, source: str) -> JoyQuotation:
         """
@@ -102,8 +110,9 @@ class Parser:
             ParseResult with definitions inlined in program
         """
         scanner = Scanner(python_interop=self._python_interop)
-        self._tokens = list(scanner.tokenize(source))
+        self._tokens = scanner.scan(source)
         self._pos = 0
+        self._quotations = {}
 
         terms: List[Any] = []
 
@@ -139,7 +148,7 @@ class Parser:
         self._pos += 1
         return token
 
-    def _parse_terms(self, terminators: Set[str]) -> List[Any]:
+    def _parse_terms(self, terminators: AbstractSet[str]) -> List[Any]:
         """
         Parse sequence of terms until a terminator token.
 
@@ -150,16 +159,37 @@ class Parser:
             List of terms
         """
         terms: List[Any] = []
-
-        while True:
-            token = self._current()
-            if token is None or token.type in terminators:
+        append = terms.append
+        tokens = self._tokens
+        pos = self._pos
+        n = len(tokens)
+        token_terms = _TOKEN_TERMS
+
+        while pos < n:
+            token = tokens[pos]
+            kind = token.type
+            if kind in terminators:
                 break
 
-            term = self._parse_term()
-            if term is not _SKIP:
-                terms.append(term)
-
+            build = token_terms.get(kind)
+            if build is not None:
+                pos += 1
+                append(build(token))
+            elif kind in _SKIP_TOKENS:
+                pos += 1
+            else:
+                # Container literals consume several tokens via self._pos;
+                # they are parsed directly, without a _parse_term frame
+                self._pos = pos
+                if kind == "LBRACKET":
+                    append(self._parse_quotation())
+                elif kind == "LBRACE":
+                    append(self._parse_set())
+                else:
+                    self._parse_term()  # raises JoySyntaxError
+                pos = self._pos
+
+        self._pos = pos
         return terms
 
     def _parse_definition_block(self) -> List[Definition]:
@@ -212,7 +242,7 @@ class Parser:
                     token.column,
                 )
 
-            name = token.value
+            name = sys.intern(token.value)
             self._advance()
 
             # Expect ==
@@ -362,88 +392,24 @@ class Parser:
         if token is None:
             return _SKIP
 
-        if token.type == "INTEGER":
-            self._advance()
-            return JoyValue.integer(token.value)
-
-        elif token.type == "FLOAT":
-            self._advance()
-            return JoyValue.floating(token.value)
-
-        elif token.type == "STRING":
-            self._advance()
-            return JoyValue.string(token.value)
-
-        elif token.type == "CHAR":
-            self._advance()
-            return JoyValue.char(token.value)
-
-        elif token.type == "LBRACKET":
+        kind = token.type
+        build = _TOKEN_TERMS.get(kind)
+        if build is not None:
+            self._pos += 1
+            return build(token)
+        elif kind == "LBRACKET":
             return self._parse_quotation()
-
-        elif token.type == "LBRACE":
+        elif kind == "LBRACE":
             return self._parse_set()
-
-        elif token.type == "SYMBOL":
-            self._advance()
-            name = token.value
-
-            # Handle boolean literals
-            if name == "true":
-                return JoyValue.boolean(True)
-            elif name == "false":
-                return JoyValue.boolean(False)
-
-            # Return as symbol string (late binding - resolved at runtime)
-            return name
-
-        # Python interop tokens
-        elif token.type == "PYTHON_EXPR":
-            self._advance()
-            return PythonExpr(token.value)
-
-        elif token.type == "PYTHON_DOLLAR":
-            self._advance()
-            return PythonExpr(token.value)
-
-        elif token.type == "PYTHON_STMT":
-            self._advance()
-            return PythonStmt(token.value)
-
-        elif token.type == "SEMICOLON":
-            # Statement separator - skip
-            self._advance()
+        elif kind in _SKIP_TOKENS:
+            self._pos += 1
             return _SKIP
 
-        elif token.type == "PERIOD":
-            # Period is the print operator (.) in executable code
-            self._advance()
-            return "."
-
-        elif token.type == "DEF_OP":
-            # == should only appear in definition context, skip if stray
-            self._advance()
-            return _SKIP
-
-        elif token.type in (
-            "DEFINE_KW",
-            "PUBLIC_KW",
-            "PRIVATE_KW",
-            "END_KW",
-            "HIDE_KW",
-            "IN_KW",
-            "MODULE_KW",
-        ):
-            # Keywords - skip when encountered outside definition context
-            self._advance()
-            return _SKIP
-
-        else:
-            raise JoySyntaxError(
-                f"Unexpected token: {token.type}",
-                token.line,
-                token.column,
-            )
+        raise JoySyntaxError(
+            f"Unexpected token: {kind}",
+            token.line,
+            token.column,
+        )
 
     def _parse_quotation(self) -> JoyQuotation:
         """
@@ -452,10 +418,10 @@ class Parser:
         Returns:
             JoyQuotation containing the parsed terms
         """
-        start_token = self._advance()  # Consume '['
-        assert start_token is not None
+        start_token = self._tokens[self._pos]
+        self._pos += 1  # Consume '['
 
-        terms = self._parse_terms({"RBRACKET"})
+        terms = tuple(self._parse_terms(_QUOTATION_END))
 
         end_token = self._current()
         if end_token is None or end_token.type != "RBRACKET":
@@ -465,8 +431,20 @@ class Parser:
                 start_token.column,
             )
         self._advance()  # Consume ']'
-
-        return JoyQuotation(tuple(terms))
+        if not terms:
+            return EMPTY_QUOTATION
+
+        # Identical literals within one source share a quotation (and so
+        # its compiled code)
+        try:
+            key = tuple(map(_intern_key, terms))
+            quot = self._quotations.get(key)
+        except TypeError:
+            # Unhashable terms (Python interop)
+            return JoyQuotation(terms)
+        if quot is None:
+            quot = self._quotations[key] = JoyQuotation(terms)
+        return quot
 
     def _parse_set(self) -> JoyValue:
         """
@@ -477,10 +455,10 @@ class Parser:
         Returns:
             JoyValue of type SET
         """
-        start_token = self._advance()  # Consume '{'
-        assert start_token is not None
+        start_token = self._tokens[self._pos]
+        self._pos += 1  # Consume '{'
 
-        terms = self._parse_terms({"RBRACE"})
+        terms = self._parse_terms(_SET_END)
 
         end_token = self._current()
         if end_token is None or end_token.type != "RBRACE":
@@ -492,21 +470,111 @@ class Parser:
         self._advance()  # Consume '}'
 
         # Convert to set of integers
-        members: Set[int] = set()
+        members: List[int] = []
         for term in terms:
-            if isinstance(term, JoyValue) and term.type.name == "INTEGER":
-                member = term.value
-                if not (0 <= member <= 63):
-                    raise JoySetMemberError(member)
-                members.add(member)
-            else:
+            if term.__class__ is not JoyValue or term.type is not JoyType.INTEGER:
                 raise JoySyntaxError(
                     "Set members must be integers in range [0, 63]",
                     start_token.line,
                     start_token.column,
                 )
+            member = term.value
+            if member < 0 or member > 63:
+                raise JoySetMemberError(member)
+            members.append(member)
+
+        # Members are already validated, so skip JoyValue.joy_set's check
+        return JoyValue(JoyType.SET, frozenset(members))
+
+
+def _intern_key(term: Any) -> Any:
+    """Key for a quotation term that is equal only for identical terms.
+
+    Nested quotations are already shared, so they are keyed by identity;
+    floats are keyed by repr so that 0.0 and -0.0 stay distinct.
+    """
+    cls = term.__class__
+    if cls is JoyQuotation:
+        return (id(term),)
+    if cls is JoyValue and term.type is JoyType.FLOAT:
+        return (repr(term.value),)
+    return term
+
+
+# -----------------------------------------------------------------------------
+# Single-token terms, dispatched on token type by the parser
+# -----------------------------------------------------------------------------
+
+
+def _term_integer(token: Token) -> JoyValue:
+    return JoyValue.integer(token.value)
+
+
+def _term_float(token: Token) -> JoyValue:
+    return JoyValue.floating(token.value)
+
+
+def _term_string(token: Token) -> JoyValue:
+    return JoyValue.string(token.value)
+
+
+def _term_char(token: Token) -> JoyValue:
+    return JoyValue.char(token.value)
+
+
+def _term_symbol(token: Token) -> Any:
+    # Interned so word lookups by name hit the identity fast path
+    name = sys.intern(token.value)
+
+    # Handle boolean literals
+    if name == "true":
+        return TRUE
+    elif name == "false":
+        return FALSE
+
+    # Return as symbol string (late binding - resolved at runtime)
+    return name
+
+
+def _term_python_expr(token: Token) -> PythonExpr:
+    return PythonExpr(token.value)
+
+
+def _term_python_stmt(token: Token) -> PythonStmt:
+    return PythonStmt(token.value)
+
+
+def _term_period(token: Token) -> str:
+    # Period is the print operator (.) in executable code
+    return "."
+
+
+_TOKEN_TERMS: Dict[str, Callable[[Token], Any]] = {
+    "INTEGER": _term_integer,
+    "FLOAT": _term_float,
+    "STRING": _term_string,
+    "CHAR": _term_char,
+    "SYMBOL": _term_symbol,
+    "PYTHON_EXPR": _term_python_expr,
+    "PYTHON_DOLLAR": _term_python_expr,
+    "PYTHON_STMT": _term_python_stmt,
+    "PERIOD": _term_period,
+}
 
-        return JoyValue.joy_set(frozenset(members))
+# Separators, stray '==' and keywords outside definition context: skipped
+_SKIP_TOKENS = frozenset(
+    (
+        "SEMICOLON",
+        "DEF_OP",
+        "DEFINE_KW",
+        "PUBLIC_KW",
+        "PRIVATE_KW",
+        "END_KW",
+        "HIDE_KW",
+        "IN_KW",
+        "MODULE_KW",
+    )
+)
 
 
 def parse(source: str, python_interop: bool = False) -> JoyQuotation:
@@ -11,13 +11,46 @@ Supports:
 
 from __future__ import annotations
 
+import codeop
+import os
 import re
+import sys
 import traceback
-from typing import List
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 
 from pyjoy.errors import JoyError
 from pyjoy.evaluator import Evaluator, list_primitives
 
+# Python lines that start a multi-line block: a keyword followed by a
+# space, or one of the prefixes
+_BLOCK_KEYWORDS = frozenset(("def", "class", "if", "for", "while", "with", "async"))
+_BLOCK_PREFIXES = ("try:", "@")
+
+# Default interactive history file, used by run_repl
+HISTORY_FILE = os.path.expanduser("~/.pyjoy_history")
+
+# .def NAME [BODY]
+_DEF_RE = re.compile(r"(\w[\w\-\?]*)\s+\[(.+)\]")
+
+
+@lru_cache(maxsize=64)
+def _is_incomplete_python(code: str) -> bool:
+    """
+    Check if Python code is incomplete, memoized per source.
+
+    Invalid code counts as complete, so executing it reports the error.
+    """
+    try:
+        return codeop.compile_command(code, "<input>", "exec") is None
+    except (SyntaxError, ValueError, OverflowError):
+        return False
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 class REPL:
     """
@@ -48,17 +81,67 @@ Python interop enabled: `expr`, $(expr), !stmt
 Type 'quit' to exit, '.help' for commands.
 """
 
-    def __init__(self, strict: bool = True, debug: bool = False) -> None:
+    def __init__(
+        self,
+        strict: bool = True,
+        debug: bool = False,
+        history_file: str | None = None,
+    ) -> None:
         self.strict = strict
         self.debug = debug
+        # Read and written only for interactive sessions (stdin is a tty)
+        self.history_file = history_file
         self.evaluator = Evaluator(strict=strict)
         self.running = True
         self.pending_lines: List[str] = []
+        # pending_lines joined with newlines, extended as lines arrive
+        self._pending_code = ""
+        self._definitions_key: Tuple[str, ...] = ()
+        self._definitions_sorted: List[str] = []
+        self._completions: List[str] = []
+
+        # REPL commands without an argument, by exact text
+        self._commands: Dict[str, Callable[[], None]] = {
+            ".s": self._show_stack,
+            ".stack": self._show_stack,
+            ".c": self._clear_stack,
+            ".clear": self._clear_stack,
+            ".w": self._show_words,
+            ".words": self._show_words,
+            ".h": self._show_help,
+            ".help": self._show_help,
+        }
+        # REPL commands taking the rest of the line, by first word
+        self._arg_commands: Dict[str, Callable[[str], None]] = {
+            ".w": lambda arg: self._show_words(arg.strip()),
+            ".words": lambda arg: self._show_words(arg.strip()),
+            ".help": lambda arg: self._show_word_help(arg.strip()),
+            ".def": self._define_word,
+            ".import": lambda arg: self._import_module(arg.strip()),
+            ".load": lambda arg: self._load_file(arg.strip()),
+        }
 
     def run(self) -> None:
         """Run the interactive REPL."""
         print(self.BANNER_STRICT if self.strict else self.BANNER_PYTHONIC)
-
+        readline = self._setup_readline()
+        history = self._history_path()
+        if readline is not None and history is not None:
+            try:
+                readline.read_history_file(history)
+            except OSError:
+                pass
+        try:
+            self._loop()
+        finally:
+            if readline is not None and history is not None:
+                try:
+                    readline.write_history_file(history)
+                except OSError:
+                    pass
+
+    def _loop(self) -> None:
+        """Read and process lines until quit or end of input."""
         while self.running:
             try:
                 prompt = self.CONTINUATION_PROMPT if self.pending_lines else self.PROMPT
@@ -69,117 +152,109 @@ Type 'quit' to exit, '.help' for commands.
             except KeyboardInterrupt:
                 print("\nInterrupted. Type 'quit' to exit.")
                 self.pending_lines = []
+                self._pending_code = ""
                 continue
 
             self._process_line(line)
 
+    def _setup_readline(self) -> Any:
+        """
+        Enable line editing and Tab completion of words.
+
+        Returns the readline module, or None where it is unavailable.
+        """
+        try:
+            import readline
+        except ImportError:
+            return None
+        readline.set_completer(self._complete)
+        # Joy words may contain characters such as - and ?
+        readline.set_completer_delims(" \t\n[]{}")
+        readline.parse_and_bind("tab: complete")
+        return readline
+
+    def _history_path(self) -> str | None:
+        """Get the history file to use, or None if history is disabled."""
+        if self.history_file is None or not sys.stdin.isatty():
+            return None
+        return self.history_file
+
+    def _complete(self, text: str, state: int) -> str | None:
+        """readline completer: return the state-th word starting with text."""
+        if state == 0:
+            words = list_primitives() + self._sorted_definitions()
+            self._completions = [w for w in words if w.startswith(text)]
+        if state < len(self._completions):
+            return self._completions[state]
+        return None
+
     def _process_line(self, line: str) -> None:
         """Process a single input line."""
         stripped = line.strip()
 
+        # Handle empty line (finishes a pending block, otherwise ignored)
+        if not stripped:
+            if self.pending_lines:
+                self._finish_python_block()
+            return
+
         # Handle quit (not in multi-line mode)
         if stripped in ("quit", "exit") and not self.pending_lines:
             self.running = False
             return
 
-        # Handle empty line in pending block (finishes the block)
-        if not stripped and self.pending_lines:
-            self._finish_python_block()
-            return
-
         # In pythonic mode, check for multi-line Python blocks
         if not self.strict and self._handle_python_block(line):
             return
 
         # Handle REPL commands (only when not in multi-line mode)
         if not self.pending_lines:
-            if stripped in (".s", ".stack"):
-                self._show_stack()
-                return
-
-            if stripped in (".c", ".clear"):
-                self.evaluator.stack.clear()
-                print("Stack cleared.")
-                return
-
-            if stripped in (".w", ".words"):
-                self._show_words()
-                return
-
-            if stripped.startswith(".w "):
-                self._show_words(stripped[3:].strip())
-                return
-
-            if stripped.startswith(".words "):
-                self._show_words(stripped[7:].strip())
-                return
-
-            if stripped in (".h", ".help"):
-                self._show_help()
-                return
-
-            if stripped.startswith(".help "):
-                self._show_word_help(stripped[6:].strip())
-                return
-
-            if stripped.startswith(".def "):
-                self._define_word(stripped[5:])
-                return
-
-            if stripped.startswith(".import "):
-                self._import_module(stripped[8:].strip())
-                return
-
-            if stripped.startswith(".load "):
-                self._load_file(stripped[6:].strip())
-                return
-
-        if not stripped:
-            return
+            head, _, rest = stripped.partition(" ")
+            if rest:
+                command = self._arg_commands.get(head)
+                if command is not None:
+                    command(rest)
+                    return
+            else:
+                exact = self._commands.get(head)
+                if exact is not None:
+                    exact()
+                    return
 
         # Execute as Joy code
         try:
             self.evaluator.run(stripped)
             self._show_stack_brief()
         except JoyError as e:
-            print(f"Error: {e}")
+            sys.stdout.write(f"Error: {e}\n")
         except Exception as e:
-            print(f"Error: {type(e).__name__}: {e}")
+            sys.stdout.write(f"Error: {type(e).__name__}: {e}\n")
             if self.debug:
                 traceback.print_exc()
 
     def _is_incomplete(self, code: str) -> bool:
         """Check if Python code is incomplete (needs more lines)."""
-        try:
-            compile(code, "<input>", "exec")
-            return False
-        except SyntaxError as e:
-            msg = str(e)
-            return "unexpected EOF" in msg or "EOF while scanning" in msg
+        return _is_incomplete_python(code)
 
     def _handle_python_block(self, line: str) -> bool:
         """
         Handle multi-line Python blocks (def, class, etc.)
         Returns True if line was handled as Python block.
         """
-        block_starters = (
-            "def ",
-            "class ",
-            "if ",
-            "for ",
-            "while ",
-            "with ",
-            "try:",
-            "async ",
-            "@",
-        )
-        is_block_start = any(line.lstrip().startswith(s) for s in block_starters)
+        code_line = line.lstrip()
+        first, space, _ = code_line.partition(" ")
+        is_block_start = (
+            bool(space) and first in _BLOCK_KEYWORDS
+        ) or code_line.startswith(_BLOCK_PREFIXES)
 
         if self.pending_lines or is_block_start:
+            if self.pending_lines:
+                self._pending_code += "\n" + line
+            else:
+                self._pending_code = line
             self.pending_lines.append(line)
-            code = "\n".join(self.pending_lines)
 
-            if self._is_incomplete(code):
+            if self._is_incomplete(self._pending_code):
                 return True  # Need more lines
 
             # Execute complete block
@@ -193,8 +268,9 @@ Type 'quit' to exit, '.help' for commands.
         if not self.pending_lines:
             return
 
-        code = "\n".join(self.pending_lines)
+        code = self._pending_code
         self.pending_lines = []
+        self._pending_code = ""
 
         try:
             self.evaluator._python_exec(code)
@@ -204,13 +280,18 @@ Type 'quit' to exit, '.help' for commands.
             if self.debug:
                 traceback.print_exc()
 
+    def _clear_stack(self) -> None:
+        """Clear the stack."""
+        self.evaluator.stack.clear()
+        print("Stack cleared.")
+
     def _define_word(self, defn: str) -> None:
         """Define new word: .def name [body]"""
         if self.strict:
             print("  Error: .def requires pythonic mode (strict=False)")
             return
 
-        match = re.match(r"(\w[\w\-\?]*)\s+\[(.+)\]", defn)
+        match = _DEF_RE.match(defn)
         if not match:
             print("  Usage: .def name [body]")
             return
@@ -239,8 +320,9 @@ Type 'quit' to exit, '.help' for commands.
     def _load_file(self, filename: str) -> None:
         """Load and execute a Joy file."""
         try:
-            with open(filename) as f:
-                source = f.read()
+            # Read raw bytes and decode once, bypassing text-mode buffering
+            with open(filename, "rb") as f:
+                source = f.read().decode("utf-8")
             self.evaluator.run(source)
             print(f"  Loaded: {filename}")
         except FileNotFoundError:
@@ -257,56 +339,76 @@ Type 'quit' to exit, '.help' for commands.
             print("Stack: (empty)")
             return
 
-        print("Stack (bottom to top):")
-        for i, item in enumerate(stack.items()):
+        lines = ["Stack (bottom to top):"]
+        for i, item in enumerate(stack.iter_items()):
             if self.strict:
-                print(f"  {i}: {item.type.name}: {item!r}")
+                lines.append(f"  {i}: {item.type.name}: {item!r}")
             else:
                 type_name = type(item).__name__
                 repr_str = repr(item)
                 if len(repr_str) > 60:
                     repr_str = repr_str[:57] + "..."
-                print(f"  {i}: ({type_name}) {repr_str}")
+                lines.append(f"  {i}: ({type_name}) {repr_str}")
+        _write_lines(lines)
 
     def _show_stack_brief(self) -> None:
         """Show brief stack representation."""
-        stack = self.evaluator.stack
-        if stack.is_empty():
+        items = self.evaluator.stack._items
+        if not items:
             print("Stack: (empty)")
-        else:
-            items = " ".join(repr(v) for v in stack.items())
-            if len(items) > 70:
-                items = items[:67] + "..."
-            print(f"Stack: {items}")
+            return
+
+        # Only the first 70 characters are shown, so stop once they are known
+        parts = []
+        length = -1
+        for v in items:
+            r = repr(v)
+            parts.append(r)
+            length += len(r) + 1
+            if length > 70:
+                break
+        text = " ".join(parts)
+        if length > 70:
+            text = text[:67] + "..."
+        print(f"Stack: {text}")
+
+    def _sorted_definitions(self) -> List[str]:
+        """Return sorted user definition names, re-sorted only when they change."""
+        names = tuple(self.evaluator.definitions)
+        if names != self._definitions_key:
+            self._definitions_key = names
+            self._definitions_sorted = sorted(names)
+        return self._definitions_sorted
 
     def _show_words(self, pattern: str | None = None) -> None:
         """Show available words, optionally filtered by pattern."""
         primitives = list_primitives()
-        definitions = sorted(self.evaluator.definitions.keys())
+        definitions = self._sorted_definitions()
 
         all_words = primitives + definitions
 
         if pattern:
             all_words = [w for w in all_words if pattern in w]
-            print(f"{len(all_words)} words matching '{pattern}':")
+            lines = [f"{len(all_words)} words matching '{pattern}':"]
         else:
-            print(f"Primitives ({len(primitives)}):")
+            lines = [f"Primitives ({len(primitives)}):"]
 
-        if not all_words:
-            return
+        if all_words:
+            # Print in columns
+            cols = 6
+            words_to_print = all_words if pattern else primitives
+            for i in range(0, len(words_to_print), cols):
+                row = words_to_print[i : i + cols]
+                lines.append("  " + "  ".join([w.ljust(12) for w in row]))
 
-        # Print in columns
-        cols = 6
-        words_to_print = all_words if pattern else primitives
-        for i in range(0, len(words_to_print), cols):
-            row = words_to_print[i : i + cols]
-            print("  " + "  ".join(f"{w:12}" for w in row))
+            if not pattern and definitions:
+                lines.append("")
+                lines.append(f"User definitions ({len(definitions)}):")
+                for i in range(0, len(definitions), cols):
+                    row = definitions[i : i + cols]
+                    lines.append("  " + "  ".join([w.ljust(12) for w in row]))
 
-        if not pattern and definitions:
-            print(f"\nUser definitions ({len(definitions)}):")
-            for i in range(0, len(definitions), cols):
-                row = definitions[i : i + cols]
-                print("  " + "  ".join(f"{w:12}" for w in row))
+        _write_lines(lines)
 
     def _show_word_help(self, word_name: str) -> None:
         """Show help for a specific word."""
@@ -316,29 +418,31 @@ Type 'quit' to exit, '.help' for commands.
 
         if primitive is None and word_name not in self.evaluator.definitions:
             # Try to find similar words
-            all_words = list_primitives() + list(self.evaluator.definitions.keys())
+            all_words = list_primitives() + self._sorted_definitions()
             similar = [w for w in all_words if word_name in w or w in word_name]
-            print(f"Unknown word: {word_name}")
+            lines = [f"Unknown word: {word_name}"]
             if similar:
-                print(f"Did you mean: {', '.join(sorted(similar)[:5])}")
+                lines.append(f"Did you mean: {', '.join(sorted(similar)[:5])}")
+            _write_lines(lines)
             return
 
-        print(f"\n  {word_name}")
+        lines = ["", f"  {word_name}"]
 
         if primitive:
             doc = getattr(primitive, "joy_doc", None) or getattr(
                 primitive, "__doc__", None
             )
             if doc:
-                print(f"    {doc.strip()}")
+                lines.append(f"    {doc.strip()}")
             else:
-                print("    (built-in, no documentation)")
+                lines.append("    (built-in, no documentation)")
         else:
             # User definition
             body = self.evaluator.definitions[word_name]
-            print(f"    User-defined: {body}")
+            lines.append(f"    User-defined: {body}")
 
-        print()
+        lines.append("")
+        _write_lines(lines)
 
     def _show_help(self) -> None:
         """Show REPL help."""
@@ -395,7 +499,9 @@ Pythonic Mode Extensions:
             print(pythonic_help)
 
 
-def run_repl(strict: bool = True, debug: bool = False) -> None:
-    """Entry point for running the REPL."""
-    repl = REPL(strict=strict, debug=debug)
+def run_repl(
+    strict: bool = True, debug: bool = False, history_file: str | None = HISTORY_FILE
+) -> None:
+    """Entry point for running the REPL (with history in HISTORY_FILE)."""
+    repl = REPL(strict=strict, debug=debug, history_file=history_file)
     repl.run()
@@ -14,7 +14,7 @@ from __future__ import annotations
 import os
 import re
 from dataclasses import dataclass
-from typing import Any, Iterator
+from typing import Any, Iterator, List, Tuple
 
 
 @dataclass(slots=True)
@@ -27,6 +27,31 @@ class Token:
     column: int
 
 
+def _token_regex(patterns: List[Tuple[str, str]], python_interop: bool) -> re.Pattern:
+    """
+    Combine token patterns into one regex with a named group per kind.
+
+    Leading whitespace is consumed by the match itself, so it costs no loop
+    iteration. Without interop, the PYTHON_* patterns are merged into one
+    INTEROP group whose text is dropped like a comment rather than scanned
+    as symbols.
+    """
+    alternatives: List[str] = []
+    interop: List[str] = []
+    slot = 0
+    for name, pattern in patterns:
+        if not python_interop and name.startswith("PYTHON_"):
+            if not interop:
+                slot = len(alternatives)
+                alternatives.append("")
+            interop.append(pattern)
+        else:
+            alternatives.append(f"(?P<{name}>{pattern})")
+    if interop:
+        alternatives[slot] = "(?P<INTEROP>" + "|".join(interop) + ")"
+    return re.compile(r"\s*(?:" + "|".join(alternatives) + ")", re.DOTALL)
+
+
 class Scanner:
     """
     Joy lexical analyzer.
@@ -90,6 +115,13 @@ class Scanner:
         ("WHITESPACE", r"\s+"),  # whitespace
     ]
 
+    # Combined regexes, compiled once for all scanners
+    _REGEX = _token_regex(PATTERNS, python_interop=True)
+    _REGEX_NO_INTEROP = _token_regex(PATTERNS, python_interop=False)
+
+    # Token kinds that produce no token
+    _IGNORED = frozenset(("WHITESPACE", "COMMENT", "COMMENT2", "INTEROP"))
+
     def __init__(self, python_interop: bool = False) -> None:
         """
         Initialize the scanner.
@@ -99,9 +131,7 @@ class Scanner:
                            If False (default), treat them as regular symbols/errors.
         """
         self.python_interop = python_interop
-        # Compile the combined regex pattern
-        pattern = "|".join(f"(?P<{name}>{pat})" for name, pat in self.PATTERNS)
-        self._regex = re.compile(pattern, re.DOTALL)
+        self._regex = self._REGEX if python_interop else self._REGEX_NO_INTEROP
 
     def tokenize(self, source: str, execute_shell: bool = True) -> Iterator[Token]:
         """
@@ -120,47 +150,60 @@ class Scanner:
         Python interop tokens (backticks, $(), !) are only yielded when
         python_interop=True was set in __init__.
         """
+        yield from self.scan(source, execute_shell)
+
+    def scan(self, source: str, execute_shell: bool = True) -> List[Token]:
+        """
+        Tokenize source code into a list of tokens.
+
+        Same as tokenize(), but builds the whole list at once, which is
+        what the parser needs.
+
+        Args:
+            source: Joy source code
+            execute_shell: If True, execute shell escape lines ($ at line start)
+
+        Returns:
+            List of Token objects
+        """
         # Pre-process shell escape lines
         source = self._process_shell_escapes(source, execute_shell)
 
+        tokens: List[Token] = []
+        append = tokens.append
         line = 1
         line_start = 0
+        pos = 0
+        ignored = self._IGNORED
+        count = source.count
+        rfind = source.rfind
 
         for match in self._regex.finditer(source):
             kind = match.lastgroup
-            value: Any = match.group()
-            column = match.start() - line_start
+            assert kind is not None
+            value: Any = match.group(kind)
+            start = match.start(kind)
 
-            # Track line numbers for newlines in the match
-            newlines = value.count("\n")
+            # Track line numbers for newlines since the previous token
+            newlines = count("\n", pos, start)
             if newlines:
                 line += newlines
-                # Find the position after the last newline
-                last_newline = value.rfind("\n")
-                line_start = match.start() + last_newline + 1
+                line_start = rfind("\n", pos, start) + 1
+            pos = start
+            column = start - line_start
 
             # Skip whitespace and comments
-            if kind in ("WHITESPACE", "COMMENT", "COMMENT2"):
+            if kind in ignored:
                 continue
 
-            assert kind is not None
-
-            # Handle Python interop tokens
+            # Handle Python interop tokens (only matched with python_interop)
             if kind == "PYTHON_EXPR":
-                if not self.python_interop:
-                    # Skip in strict mode - this will cause a parse error
-                    # which is the desired behavior
-                    continue
                 # Extract expression from backticks: `expr` -> expr
                 value = value[1:-1]
             elif kind == "PYTHON_DOLLAR":
-                if not self.python_interop:
-                    continue
                 # Extract expression from $(expr) -> expr
                 value = value[2:-1]
             elif kind == "PYTHON_STMT":
-                if not self.python_interop:
-                    continue
                 # Extract statement from !stmt -> stmt (strip leading !)
                 value = value[1:].strip()
 
@@ -182,7 +225,9 @@ class Scanner:
                 else:
                     value = self._unescape_char(value[1:])
 
-            yield Token(kind, value, line, column)
+            append(Token(kind, value, line, column))
+
+        return tokens
 
     def _unescape_string(self, s: str) -> str:
         """
@@ -223,12 +268,14 @@ class Scanner:
         Returns:
             Source with shell escape lines removed
         """
+        if "$" not in source:
+            return source
+
         lines = source.split("\n")
         result_lines = []
 
         for line in lines:
-            # Shell escape: $ at start of line, but NOT $( which is Python interop
-            if line.startswith("$") and not line.startswith("$("):
+            if _is_shell_escape(line):
                 # Shell escape: execute the command (everything after $)
                 if execute:
                     cmd = line[1:].strip()
@@ -242,6 +289,22 @@ class Scanner:
         return "\n".join(result_lines)
 
 
+def _is_shell_escape(line: str) -> bool:
+    """Check for a shell escape: $ at start of line, but NOT $( (Python interop)."""
+    return line.startswith("$") and not line.startswith("$(")
+
+
+def has_shell_escapes(source: str) -> bool:
+    """
+    Check whether source contains shell escape lines.
+
+    Scanning such source runs the commands, so it must not be cached.
+    """
+    if "$" not in source:
+        return False
+    return any(_is_shell_escape(line) for line in source.split("\n"))
+
+
 # Convenience function for one-shot tokenization
 def tokenize(source: str, python_interop: bool = False) -> Iterator[Token]:
     """
@@ -4,14 +4,15 @@ pyjoy.stack - Stack implementation and execution context.
 The Joy stack is the central data structure for evaluation.
 All operations manipulate values on the stack.
 
-Supports two modes:
+Supports two modes, both served by one Stack implementation:
 - Strict mode (JoyStack): All values wrapped in JoyValue
 - Pythonic mode (PythonStack): Any Python object allowed
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Protocol, Tuple, Union, runtime_checkable
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Tuple
 
 from pyjoy.errors import JoyStackUnderflow
 from pyjoy.types import JoyValue, python_to_joy
@@ -20,215 +21,121 @@ if TYPE_CHECKING:
     from pyjoy.evaluator import Evaluator
 
 
-@runtime_checkable
-class StackProtocol(Protocol):
+class StackProtocol(ABC):
     """
-    Protocol defining the stack interface.
+    Abstract base defining the stack interface.
 
     Both JoyStack (strict mode) and PythonStack (pythonic mode)
-    implement this protocol.
+    implement this interface through Stack, which subclasses it; custom
+    stacks must subclass it too and implement every abstract method.
     """
 
+    __slots__ = ()
+
+    @abstractmethod
     def push(self, value: Any) -> None:
         """Push a value onto the stack."""
         ...
 
+    @abstractmethod
     def push_value(self, value: Any) -> None:
         """Push a value directly (no conversion in pythonic mode)."""
         ...
 
+    @abstractmethod
     def pop(self) -> Any:
         """Pop and return top of stack."""
         ...
 
+    @abstractmethod
     def peek(self, depth: int = 0) -> Any:
         """Peek at item at given depth without removing."""
         ...
 
+    @abstractmethod
     def pop_n(self, n: int) -> Tuple[Any, ...]:
         """Pop n items, returning tuple with TOS first."""
         ...
 
+    @abstractmethod
+    def pop2(self) -> Tuple[Any, Any]:
+        """Pop two items, returning (TOS, second)."""
+        ...
+
+    @abstractmethod
     def push_many(self, *values: Any) -> None:
         """Push multiple values."""
         ...
 
     @property
+    @abstractmethod
     def depth(self) -> int:
         """Current stack depth."""
         ...
 
+    @abstractmethod
     def is_empty(self) -> bool:
         """Check if stack is empty."""
         ...
 
+    @abstractmethod
     def clear(self) -> None:
         """Clear all items."""
         ...
 
+    @abstractmethod
     def copy(self) -> "StackProtocol":
         """Create a shallow copy."""
         ...
 
+    @abstractmethod
     def items(self) -> List[Any]:
         """Return copy of items (bottom to top)."""
         ...
 
+    @abstractmethod
+    def iter_items(self) -> Iterator[Any]:
+        """Iterate over items (bottom to top) without copying."""
+        ...
+
 
-class JoyStack:
+class Stack(StackProtocol):
     """
     Joy evaluation stack.
 
     Uses a Python list internally but provides Joy-like interface.
     Stack grows upward: index -1 is TOS (top of stack).
-    All values on the stack are JoyValue instances.
-    """
-
-    __slots__ = ("_items",)
-
-    def __init__(self) -> None:
-        self._items: List[JoyValue] = []
-
-    def push(self, value: Any) -> None:
-        """
-        Push value onto stack, auto-converting to JoyValue.
-
-        Args:
-            value: Any Python value (will be converted to JoyValue)
-        """
-        self._items.append(python_to_joy(value))
-
-    def push_value(self, value: JoyValue) -> None:
-        """
-        Push a JoyValue directly onto stack (no conversion).
-
-        Args:
-            value: JoyValue to push
-        """
-        self._items.append(value)
-
-    def pop(self) -> JoyValue:
-        """
-        Pop and return top of stack.
-
-        Returns:
-            The top JoyValue
-
-        Raises:
-            JoyStackUnderflow: If stack is empty
-        """
-        if not self._items:
-            raise JoyStackUnderflow("pop", 1, 0)
-        return self._items.pop()
-
-    def peek(self, depth: int = 0) -> JoyValue:
-        """
-        Peek at stack item at given depth without removing.
-
-        Args:
-            depth: 0 = TOS, 1 = second item, etc.
-
-        Returns:
-            JoyValue at the specified depth
-
-        Raises:
-            JoyStackUnderflow: If depth exceeds stack size
-        """
-        if depth >= len(self._items):
-            raise JoyStackUnderflow("peek", depth + 1, len(self._items))
-        return self._items[-(depth + 1)]
-
-    def pop_n(self, n: int) -> Tuple[JoyValue, ...]:
-        """
-        Pop n items from stack.
 
-        Args:
-            n: Number of items to pop
-
-        Returns:
-            Tuple of JoyValues, TOS first
-
-        Raises:
-            JoyStackUnderflow: If stack has fewer than n items
-        """
-        if n > len(self._items):
-            raise JoyStackUnderflow("pop_n", n, len(self._items))
-        if n == 0:
-            return ()
-        result = tuple(self._items[-n:])
-        self._items = self._items[:-n]
-        return result[::-1]  # Reverse so TOS is first
-
-    def push_many(self, *values: Any) -> None:
-        """
-        Push multiple values (first arg pushed first).
-
-        Args:
-            values: Values to push (each converted to JoyValue)
-        """
-        for v in values:
-            self.push(v)
-
-    @property
-    def depth(self) -> int:
-        """Current stack depth."""
-        return len(self._items)
-
-    def is_empty(self) -> bool:
-        """Check if stack is empty."""
-        return len(self._items) == 0
-
-    def clear(self) -> None:
-        """Clear all items from stack."""
-        self._items.clear()
-
-    def copy(self) -> JoyStack:
-        """Create a shallow copy for state preservation."""
-        new_stack = JoyStack()
-        new_stack._items = self._items.copy()
-        return new_stack
-
-    def items(self) -> List[JoyValue]:
-        """Return a copy of the stack items (bottom to top)."""
-        return self._items.copy()
-
-    def __repr__(self) -> str:
-        return f"Stack({[repr(v) for v in self._items]})"
-
-    def __len__(self) -> int:
-        return len(self._items)
-
-
-class PythonStack:
+    Both modes share this one implementation; they differ only in the
+    converter applied by push(). Strict mode converts every pushed value
+    with python_to_joy, pythonic mode (convert=None) pushes values as-is.
     """
-    Pythonic stack for non-strict mode.
 
-    Unlike JoyStack, this stack accepts any Python object directly
-    without wrapping in JoyValue. This enables seamless Python interop.
+    __slots__ = ("_items", "_convert")
 
-    Used when Evaluator is initialized with strict=False.
-    """
-
-    __slots__ = ("_items",)
-
-    def __init__(self) -> None:
+    def __init__(self, convert: Callable[[Any], Any] | None = None) -> None:
         self._items: List[Any] = []
+        self._convert = convert
 
     def push(self, value: Any) -> None:
         """
-        Push value onto stack (no conversion).
+        Push value onto stack, converting it if the stack has a converter.
 
         Args:
             value: Any Python value
         """
-        self._items.append(value)
+        convert = self._convert
+        if convert is None or value.__class__ is JoyValue:
+            self._items.append(value)
+        else:
+            self._items.append(convert(value))
 
     def push_value(self, value: Any) -> None:
         """
-        Push value directly onto stack (same as push in pythonic mode).
+        Push a value directly onto stack (no conversion).
 
         Args:
-            value: Any value to push
+            value: Value to push (a JoyValue in strict mode)
         """
         self._items.append(value)
 
@@ -242,9 +149,10 @@ class PythonStack:
         Raises:
             JoyStackUnderflow: If stack is empty
         """
-        if not self._items:
-            raise JoyStackUnderflow("pop", 1, 0)
-        return self._items.pop()
+        try:
+            return self._items.pop()
+        except IndexError:
+            raise JoyStackUnderflow("pop", 1, 0) from None
 
     def peek(self, depth: int = 0) -> Any:
         """
@@ -259,9 +167,10 @@ class PythonStack:
         Raises:
             JoyStackUnderflow: If depth exceeds stack size
         """
-        if depth >= len(self._items):
-            raise JoyStackUnderflow("peek", depth + 1, len(self._items))
-        return self._items[-(depth + 1)]
+        try:
+            return self._items[-(depth + 1)]
+        except IndexError:
+            raise JoyStackUnderflow("peek", depth + 1, len(self._items)) from None
 
     def pop_n(self, n: int) -> Tuple[Any, ...]:
         """
@@ -280,16 +189,32 @@ class PythonStack:
             raise JoyStackUnderflow("pop_n", n, len(self._items))
         if n == 0:
             return ()
-        result = tuple(self._items[-n:])
-        self._items = self._items[:-n]
-        return result[::-1]  # Reverse so TOS is first
+        items = self._items
+        result = tuple(items[: -n - 1 : -1])  # Reversed slice: TOS first
+        del items[-n:]
+        return result
+
+    def pop2(self) -> Tuple[Any, Any]:
+        """
+        Pop two items from stack (fast path for binary operators).
+
+        Returns:
+            Tuple of (TOS, second), the same order as pop_n(2)
+
+        Raises:
+            JoyStackUnderflow: If stack has fewer than 2 items
+        """
+        items = self._items
+        if len(items) < 2:
+            raise JoyStackUnderflow("pop2", 2, len(items))
+        return items.pop(), items.pop()
 
     def push_many(self, *values: Any) -> None:
         """
         Push multiple values (first arg pushed first).
 
         Args:
-            values: Values to push
+            values: Values to push (each converted like push())
         """
         for v in values:
             self.push(v)
@@ -307,18 +232,30 @@ class PythonStack:
         """Clear all items from stack."""
         self._items.clear()
 
-    def copy(self) -> PythonStack:
+    def copy(self) -> Stack:
         """Create a shallow copy for state preservation."""
-        new_stack = PythonStack()
+        new_stack = self.__class__.__new__(self.__class__)
         new_stack._items = self._items.copy()
+        new_stack._convert = self._convert
         return new_stack
 
     def items(self) -> List[Any]:
         """Return a copy of the stack items (bottom to top)."""
         return self._items.copy()
 
+    def iter_items(self) -> Iterator[Any]:
+        """
+        Iterate over the stack items (bottom to top) without copying.
+
+        The stack must not be modified while iterating; use items() for a
+        snapshot.
+        """
+        return iter(self._items)
+
     def __repr__(self) -> str:
-        return f"PythonStack({self._items})"
+        if self._convert is None:
+            return f"PythonStack({self._items})"
+        return f"Stack({[repr(v) for v in self._items]})"
 
     def __len__(self) -> int:
         return len(self._items)
@@ -327,13 +264,42 @@ class PythonStack:
         """Support indexing: stack[-1] for top, stack[0] for bottom."""
         return self._items[index]
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Any]:
         """Support iteration over stack items."""
         return iter(self._items)
 
 
+class JoyStack(Stack):
+    """
+    Strict-mode stack: all values on the stack are JoyValue instances.
+
+    Values passed to push() are auto-converted with python_to_joy.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(python_to_joy)
+
+
+class PythonStack(Stack):
+    """
+    Pythonic stack for non-strict mode.
+
+    Unlike JoyStack, this stack accepts any Python object directly
+    without wrapping in JoyValue. This enables seamless Python interop.
+
+    Used when Evaluator is initialized with strict=False.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(None)
+
+
 # Type alias for either stack type
-AnyStack = Union[JoyStack, PythonStack]
+AnyStack = Stack
 
 
 class ExecutionContext:
@@ -349,19 +315,17 @@ class ExecutionContext:
     - strict=False: Uses PythonStack, any Python object allowed
     """
 
-    __slots__ = ("stack", "_saved_states", "_evaluator", "_strict")
+    __slots__ = ("stack", "strict", "_saved_states", "_evaluator")
 
     def __init__(self, strict: bool = True) -> None:
-        self._strict = strict
+        # Whether this context is in strict mode. A plain slot rather than a
+        # property since primitives read it on every call; treat it as
+        # read-only, the stack type is chosen from it here.
+        self.strict = strict
         self.stack: AnyStack = JoyStack() if strict else PythonStack()
-        self._saved_states: List[List[Any]] = []
+        self._saved_states: List[Tuple[Any, ...]] = []
         self._evaluator: Evaluator | None = None
 
-    @property
-    def strict(self) -> bool:
-        """Whether this context is in strict mode."""
-        return self._strict
-
     def save_stack(self) -> int:
         """
         Save current stack state.
@@ -369,9 +333,10 @@ class ExecutionContext:
         Returns:
             State ID for later restoration
 
-        This is equivalent to the SAVESTACK macro in C.
+        This is equivalent to the SAVESTACK macro in C. Saved states are
+        immutable tuples, so restoring never has to defend against aliasing.
         """
-        self._saved_states.append(self.stack._items.copy())
+        self._saved_states.append(tuple(self.stack._items))
         return len(self._saved_states) - 1
 
     def restore_stack(self, state_id: int) -> None:
@@ -381,7 +346,7 @@ class ExecutionContext:
         Args:
             state_id: ID returned by save_stack()
         """
-        self.stack._items = self._saved_states[state_id].copy()
+        self.stack._items = list(self._saved_states[state_id])
 
     def pop_saved(self) -> None:
         """
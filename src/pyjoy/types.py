@@ -37,8 +37,13 @@ class JoyType(Enum):
     FILE = auto()  # File handle for I/O operations
     OBJECT = auto()  # Opaque Python object (strict=False mode only)
 
+    # Members are singletons compared by identity, so the identity hash is
+    # consistent with equality and much cheaper than Enum's name-based hash
+    # (JoyType is used as a key in dispatch tables).
+    __hash__ = object.__hash__
 
-@dataclass(frozen=True, slots=True)
+
+@dataclass(frozen=True, slots=True, init=False)
 class JoyValue:
     """
     Tagged union for Joy values.
@@ -50,6 +55,12 @@ class JoyValue:
     type: JoyType
     value: Any
 
+    def __init__(self, type: JoyType, value: Any) -> None:
+        # The generated frozen __init__ goes through object.__setattr__;
+        # writing the slots through their descriptors is cheaper.
+        _set_type(self, type)
+        _set_value(self, value)
+
     def __repr__(self) -> str:
         if self.type == JoyType.STRING:
             return f'"{self.value}"'
@@ -81,7 +92,9 @@ class JoyValue:
 
     @classmethod
     def integer(cls, n: int) -> JoyValue:
-        """Create an INTEGER value."""
+        """Create an INTEGER value (small ints are shared singletons)."""
+        if type(n) is int and SMALL_INT_MIN <= n <= SMALL_INT_MAX:
+            return _SMALL_INTS[n - SMALL_INT_MIN]
         return cls(JoyType.INTEGER, n)
 
     @classmethod
@@ -96,14 +109,21 @@ class JoyValue:
 
     @classmethod
     def char(cls, c: str) -> JoyValue:
-        """Create a CHAR value (single character)."""
+        """Create a CHAR value (ASCII chars are shared singletons)."""
         if len(c) != 1:
             raise ValueError(f"CHAR must be single character, got {len(c)} chars")
+        code = ord(c)
+        if code < 128:
+            return _ASCII_CHARS[code]
         return cls(JoyType.CHAR, c)
 
     @classmethod
     def boolean(cls, b: bool) -> JoyValue:
-        """Create a BOOLEAN value."""
+        """Create a BOOLEAN value (True/False are shared singletons)."""
+        if b is True:
+            return TRUE
+        if b is False:
+            return FALSE
         return cls(JoyType.BOOLEAN, b)
 
     @classmethod
@@ -121,7 +141,12 @@ class JoyValue:
 
     @classmethod
     def quotation(cls, quot: JoyQuotation) -> JoyValue:
-        """Create a QUOTATION value."""
+        """Create a QUOTATION value (cached on the quotation and reused)."""
+        if quot.__class__ is JoyQuotation and cls is JoyValue:
+            value = quot._value
+            if value is None:
+                value = quot._value = cls(JoyType.QUOTATION, quot)
+            return value
         return cls(JoyType.QUOTATION, quot)
 
     @classmethod
@@ -179,13 +204,23 @@ class JoyQuotation:
 
     A quotation is a sequence of terms that can be executed later.
     Terms can be JoyValues, symbols (strings), or nested JoyQuotations.
+    They are always stored as a tuple.
+
+    The evaluator caches the compiled form of the terms in ``_code``; it is
+    tagged with ``_code_key`` so it can be recompiled when stale.
+    ``JoyValue.quotation`` caches the QUOTATION wrapper in ``_value``, so a
+    nested quotation literal is boxed once rather than on every push. None
+    of these slots take part in equality or hashing.
     """
 
-    __slots__ = ("terms",)
+    __slots__ = ("terms", "_code", "_code_key", "_value")
 
     def __init__(self, terms: Tuple[Any, ...]):
-        """Create a quotation from a tuple of terms."""
-        self.terms = terms
+        """Create a quotation from a tuple (or other sequence) of terms."""
+        self.terms = terms if terms.__class__ is tuple else tuple(terms)
+        self._code: Any = None
+        self._code_key: Any = None
+        self._value: JoyValue | None = None
 
     def __repr__(self) -> str:
         inner = " ".join(_term_repr(t) for t in self.terms)
@@ -233,6 +268,13 @@ def python_to_joy(value: Any, strict: bool = True) -> JoyValue:
     Raises:
         JoyTypeError: If the value cannot be converted (in strict mode)
     """
+    # Common scalars by exact class (a table lookup instead of isinstance)
+    cls = value.__class__
+    if cls is JoyValue:
+        return value
+    make = _FROM_PYTHON.get(cls)
+    if make is not None:
+        return make(value)
     if isinstance(value, JoyValue):
         return value
 
@@ -292,8 +334,36 @@ def joy_to_python(value: JoyValue) -> Any:
         return value.value
 
 
+# Slot setters used by JoyValue.__init__ (they bypass the frozen __setattr__)
+_set_type = JoyValue.type.__set__  # type: ignore[attr-defined]
+_set_value = JoyValue.value.__set__  # type: ignore[attr-defined]
+
 # Singleton values for common cases
-TRUE = JoyValue.boolean(True)
-FALSE = JoyValue.boolean(False)
+SMALL_INT_MIN = -128
+SMALL_INT_MAX = 256
+_SMALL_INTS = tuple(
+    JoyValue(JoyType.INTEGER, n) for n in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)
+)
+_ASCII_CHARS = tuple(JoyValue(JoyType.CHAR, chr(i)) for i in range(128))
+TRUE = JoyValue(JoyType.BOOLEAN, True)
+FALSE = JoyValue(JoyType.BOOLEAN, False)
 EMPTY_LIST = JoyValue.list(())
+EMPTY_QUOTATION = JoyQuotation(())
 EMPTY_SET = JoyValue.joy_set(frozenset())
+
+
+def _str_to_joy(value: str) -> JoyValue:
+    """Convert a str to a CHAR (length 1) or a STRING."""
+    if len(value) == 1:
+        return JoyValue.char(value)
+    return JoyValue.string(value)
+
+
+# Constructors for python_to_joy keyed by exact Python class. Containers
+# convert their items recursively, so they stay on the general path.
+_FROM_PYTHON = {
+    bool: JoyValue.boolean,
+    int: JoyValue.integer,
+    float: JoyValue.floating,
+    str: _str_to_joy,
+}
@@ -5,7 +5,15 @@ Tests for pyjoy.evaluator module.
 import pytest
 
 from pyjoy.errors import JoyStackUnderflow, JoyTypeError, JoyUndefinedWord
-from pyjoy.evaluator import get_primitive, list_primitives
+from pyjoy.evaluator import Evaluator, get_primitive, list_primitives
+from pyjoy.evaluator.core import (
+    OP_PRIM,
+    OP_PUSH_N,
+    OP_THREAD,
+    _parse_program,
+    _primitives,
+    register_primitive,
+)
 from pyjoy.types import JoyQuotation, JoyType, JoyValue
 
 
@@ -132,6 +140,15 @@ class TestPrimitiveRegistry:
         assert "swap" in prims
         assert "i" in prims
 
+    def test_list_primitives_tracks_registry(self):
+        assert "_test_listed_word" not in list_primitives()
+        register_primitive("_test_listed_word", lambda ctx: None)
+        try:
+            assert "_test_listed_word" in list_primitives()
+        finally:
+            del _primitives["_test_listed_word"]
+        assert "_test_listed_word" not in list_primitives()
+
     def test_get_primitive(self):
         dup = get_primitive("dup")
         assert dup is not None
@@ -140,6 +157,13 @@ class TestPrimitiveRegistry:
     def test_get_nonexistent(self):
         assert get_primitive("nonexistent_xyz") is None
 
+    def test_nullary_primitive_is_not_wrapped(self):
+        stack_word = get_primitive("stack")
+        assert stack_word.__name__ == "stack_word"
+        assert not hasattr(stack_word, "__wrapped__")
+        assert stack_word.joy_params == 0
+        assert get_primitive("dup").joy_params == 1
+
 
 class TestStackWord:
     """Tests for stack introspection."""
@@ -159,3 +183,111 @@ class TestStackWord:
         assert evaluator.stack.peek(0).value == 1
         assert evaluator.stack.peek(1).value == 2
         assert evaluator.stack.peek(2).value == 3
+
+
+class TestCompiledExecution:
+    """Tests for compiled quotation execution."""
+
+    def test_compiled_code_is_cached(self, evaluator):
+        quot = JoyQuotation((JoyValue.integer(1), "dup"))
+        evaluator.execute(quot)
+        code = quot._code
+        evaluator.execute(quot)
+        assert quot._code is code
+        assert evaluator.stack.depth == 4
+
+    def test_literal_runs_are_fused(self, evaluator):
+        quot = _parse_program("1 2 3 + [dup] 4 5 *", False)
+        evaluator.execute(quot)
+        ops = [op for op, _ in quot._code]
+        assert ops == [OP_THREAD, OP_PUSH_N, OP_PRIM, OP_PUSH_N, OP_PRIM]
+        assert evaluator.stack.pop().value == 20
+        assert evaluator.stack.pop().type == JoyType.QUOTATION
+        assert evaluator.stack.pop().value == 5
+        assert evaluator.stack.pop().value == 1
+
+    def test_definition_added_after_compile(self, evaluator):
+        quot = JoyQuotation(("later",))
+        evaluator.undeferror = False
+        evaluator.execute(quot)
+        assert evaluator.stack.pop().type == JoyType.SYMBOL
+        evaluator.define("later", JoyQuotation((JoyValue.integer(7),)))
+        evaluator.execute(quot)
+        assert evaluator.stack.peek().value == 7
+
+    def test_inline_definition_in_same_program(self, evaluator):
+        evaluator.run("DEFINE a == 1 . a DEFINE a == 2 . a")
+        assert evaluator.stack.peek(0).value == 2
+        assert evaluator.stack.peek(1).value == 1
+
+    def test_new_primitive_invalidates_code(self, evaluator):
+        quot = JoyQuotation(("_test_compiled_word",))
+        evaluator.define("_test_compiled_word", JoyQuotation((JoyValue.integer(1),)))
+        evaluator.execute(quot)
+        register_primitive(
+            "_test_compiled_word",
+            lambda ctx: ctx.stack.push_value(JoyValue.integer(2)),
+        )
+        try:
+            evaluator.execute(quot)
+        finally:
+            del _primitives["_test_compiled_word"]
+        assert evaluator.stack.peek().value == 2
+
+    def test_same_quotation_in_both_modes(self, evaluator):
+        quot = JoyQuotation((JoyValue.integer(3),))
+        evaluator.execute(quot)
+        pythonic = Evaluator(strict=False)
+        pythonic.execute(quot)
+        assert evaluator.stack.peek().value == 3
+        assert pythonic.stack.peek() == 3
+
+    def test_parsed_programs_are_shared(self, evaluator):
+        evaluator.run("1 2 +")
+        evaluator.run("1 2 +")
+        assert [v.value for v in evaluator.stack.items()] == [3, 3]
+        assert _parse_program("1 2 +", False) is _parse_program("1 2 +", False)
+        assert _parse_program("1 2 +", False) is not _parse_program("1 2 +", True)
+
+    def test_shell_escapes_run_every_time(self, evaluator, tmp_path):
+        log = tmp_path / "log"
+        source = f"$ echo x >> {log}\n1 2 +"
+        evaluator.run("0")
+        evaluator.run(source)
+        evaluator.run(source)
+        assert log.read_text() == "x\nx\n"
+        assert [v.value for v in evaluator.stack.items()] == [0, 3, 3]
+
+    def test_same_source_in_two_evaluators(self):
+        source = "[1 2 3] [dup *] map [0 > ] filter uncons"
+        first = Evaluator()
+        first.run(source)
+        second = Evaluator()
+        second.run(source)
+        assert second.stack.items() == first.stack.items()
+
+    def test_shell_escapes_run_in_every_evaluator(self, tmp_path):
+        log = tmp_path / "log"
+        source = f"$ echo x >> {log}\n1 2 +"
+        for _ in range(2):
+            evaluator = Evaluator()
+            evaluator.run(source)
+            assert evaluator.stack.peek().value == 3
+        Evaluator().run(f"$ echo y >> {log}")
+        Evaluator().run(f"$ echo y >> {log}")
+        assert log.read_text() == "x\nx\ny\ny\n"
+
+    def test_definitions_are_per_evaluator(self):
+        evaluator = Evaluator()
+        evaluator.run("DEFINE _pure_test == 2 .")
+        evaluator.run("_pure_test 1 +")
+        assert evaluator.stack.peek().value == 3
+        other = Evaluator()
+        other.run("DEFINE _pure_test == 5 .")
+        other.run("_pure_test 1 +")
+        assert other.stack.peek().value == 6
+
+    def test_repeated_definition_source(self, evaluator):
+        for _ in range(2):
+            evaluator.run("DEFINE twice == dup + . 4 twice")
+        assert [v.value for v in evaluator.stack.items()] == [8, 8]
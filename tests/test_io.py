@@ -24,6 +24,12 @@ class TestOutputPrimitives:
         captured = capsys.readouterr()
         assert '"hello"' in captured.out
 
+    def test_dot_scalars(self, evaluator, capsys):
+        """. prints scalars in their Joy representation."""
+        evaluator.run('42 . 1.5 . \'a . "hi" . true . [1 2] .')
+        captured = capsys.readouterr()
+        assert captured.out == "42\n1.5\n'a'\n\"hi\"\ntrue\n[1 2]\n"
+
     def test_putch(self, evaluator, capsys):
         """putch writes single character."""
         evaluator.run("65 putch")  # ASCII 'A'
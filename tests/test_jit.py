@@ -0,0 +1,151 @@
+"""
+Tests for pyjoy.evaluator.jit native code generation.
+"""
+
+import pytest
+
+from pyjoy.errors import JoyStackUnderflow
+from pyjoy.evaluator import Evaluator
+from pyjoy.evaluator.core import OP_THREAD, _primitives
+from pyjoy.evaluator.jit import JIT_THRESHOLD, NativeCode, compile_quotation
+from pyjoy.parser import parse
+from pyjoy.types import JoyType, JoyValue
+
+
+def native_for(source):
+    """Compile the first quotation in source to native code."""
+    quot = parse(source).terms[0]
+    return compile_quotation(quot.terms, _primitives)
+
+
+class TestCompileQuotation:
+    """Tests for eligibility of quotations."""
+
+    def test_integer_quotation_is_eligible(self):
+        assert isinstance(native_for("[dup 1 -]"), NativeCode)
+
+    def test_shuffles_are_eligible(self):
+        assert isinstance(native_for("[rotate rollup swapd dupd popd]"), NativeCode)
+
+    def test_single_term_is_not_compiled(self):
+        assert native_for("[dup]") is None
+
+    def test_other_words_are_not_compiled(self):
+        assert native_for("[dup size]") is None
+        assert native_for("[1 2 /]") is None
+
+    def test_non_integer_literal_is_not_compiled(self):
+        assert native_for("[1.5 +]") is None
+        assert native_for('["a" swap]') is None
+        assert native_for("[[1] +]") is None
+
+    def test_boolean_arithmetic_is_not_compiled(self):
+        assert native_for("[1 2 < 1 +]") is None
+        assert isinstance(native_for("[1 2 < true]"), NativeCode)
+
+
+class TestNativeExecution:
+    """Tests that native code matches the interpreter."""
+
+    def run_hot(self, source, args):
+        """Run a quotation hot (native) and cold (interpreted)."""
+        hot = Evaluator()
+        hot.run("DEFINE hotword == " + source[1:-1] + " .")
+        for _ in range(JIT_THRESHOLD + 1):
+            hot.stack.clear()
+            hot.run(args + " hotword")
+        cold = Evaluator()
+        cold.run(args + " " + source + " i")
+        return hot.stack.items(), cold.stack.items()
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "[dup 1 -]",
+            "[swap over + max]",
+            "[rotate rollup swapd dupd popd]",
+            "[dup2 * neg abs succ pred]",
+            "[< 7 true]",
+            "[= swap]",
+        ],
+    )
+    def test_matches_interpreter(self, source):
+        hot, cold = self.run_hot(source, "3 4 5")
+        assert hot == cold
+        assert [v.type for v in hot] == [v.type for v in cold]
+
+    def test_native_code_is_used(self, evaluator):
+        evaluator.run("DEFINE dec == 1 - 0 max .")
+        body = evaluator.definitions["dec"]
+        for _ in range(JIT_THRESHOLD):
+            evaluator.run("5 dec")
+        assert body._code[0][1].run.__name__ == "native"
+        assert evaluator.stack.peek() == JoyValue.integer(4)
+
+    def test_non_integer_falls_back(self, evaluator):
+        evaluator.run("DEFINE dec == 1 - 0 max .")
+        for _ in range(JIT_THRESHOLD):
+            evaluator.run("5 dec")
+        evaluator.run("2.5 dec")
+        assert evaluator.stack.peek().type == JoyType.FLOAT
+        assert evaluator.stack.peek().value == 1.5
+
+    def test_shuffles_keep_any_type(self, evaluator):
+        evaluator.run("DEFINE sw == swap dup .")
+        for _ in range(JIT_THRESHOLD):
+            evaluator.run('"a" [b] sw')
+        assert evaluator.stack.peek().type == JoyType.STRING
+
+    def test_underflow_still_raises(self, evaluator):
+        evaluator.run("DEFINE dec == 1 - 0 max .")
+        for _ in range(JIT_THRESHOLD):
+            evaluator.run("5 dec")
+        evaluator.stack.clear()
+        with pytest.raises(JoyStackUnderflow):
+            evaluator.run("dec")
+
+
+class TestThreadedExecution:
+    """Tests for straight-line code run as one generated function."""
+
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_threaded_code_is_used(self, strict):
+        evaluator = Evaluator(strict=strict)
+        evaluator.run('DEFINE sz == size "ab" size + .')
+        body = evaluator.definitions["sz"]
+        for _ in range(JIT_THRESHOLD):
+            evaluator.stack.clear()
+            evaluator.run('"abc" sz')
+        op, threaded = body._code[0]
+        assert op == OP_THREAD
+        assert threaded.run.__name__ == "threaded"
+        evaluator.stack.clear()
+        evaluator.run('"abcd" sz')
+        cold = Evaluator(strict=strict)
+        cold.run('"abcd" size "ab" size +')
+        assert evaluator.stack.items() == cold.stack.items()
+
+    def test_user_words_are_not_threaded(self, evaluator):
+        evaluator.run("DEFINE one == 1 . DEFINE two == one one + .")
+        evaluator.run("two")
+        assert all(op != OP_THREAD for op, _ in evaluator.definitions["two"]._code)
+
+
+class TestElementwiseNative:
+    """Tests for map/filter running native code on each element."""
+
+    def test_unary_native_shape(self, evaluator):
+        assert evaluator.unary_native(parse("[dup *]").terms[0]) is not None
+        assert evaluator.unary_native(parse("[dup]").terms[0]) is None
+        assert evaluator.unary_native(parse("[+ 1 +]").terms[0]) is None
+
+    def test_map_and_filter_match_interpreter(self, evaluator):
+        items = " ".join(str(n) for n in range(JIT_THRESHOLD * 2))
+        evaluator.run(f"[{items}] [dup *] map [{items}] [3 rem 0 =] filter")
+        cold = Evaluator()
+        cold.run(f"[{items}] [dup * 0 +] map [{items}] [3 rem 0 = true and] filter")
+        assert evaluator.stack.items() == cold.stack.items()
+
+    def test_map_falls_back_for_other_types(self, evaluator):
+        evaluator.run("[1 2.5 3] [dup *] map")
+        assert repr(evaluator.stack.peek()) == "[1 6.25 9]"
@@ -6,7 +6,7 @@ import pytest
 
 from pyjoy.errors import JoySetMemberError, JoySyntaxError
 from pyjoy.parser import parse
-from pyjoy.types import JoyQuotation, JoyType
+from pyjoy.types import EMPTY_QUOTATION, JoyQuotation, JoyType
 
 
 class TestParser:
@@ -144,3 +144,18 @@ class TestParser:
 
         # Symbol: map
         assert prog.terms[2] == "map"
+
+    def test_repeated_quotations_shared(self):
+        prog = parse("[dup *] [[dup *]] [dup *] [[dup *]]")
+        assert prog.terms[0] is prog.terms[2]
+        assert prog.terms[1] is prog.terms[3]
+        assert prog.terms[1].terms[0] is prog.terms[0]
+
+    def test_empty_quotations_shared(self):
+        assert parse("[]").terms[0] is EMPTY_QUOTATION
+        assert parse("[[] 1]").terms[0].terms[0] is EMPTY_QUOTATION
+
+    def test_signed_zero_quotations_distinct(self):
+        prog = parse("[0.0] [-0.0]")
+        assert prog.terms[0] is not prog.terms[1]
+        assert str(prog.terms[1].terms[0].value) == "-0.0"
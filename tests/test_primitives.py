@@ -5,7 +5,7 @@ Tests for Phase 2 primitives.
 import pytest
 
 from pyjoy.errors import JoyDivisionByZero, JoyEmptyAggregate
-from pyjoy.types import JoyType
+from pyjoy.types import FALSE, TRUE, JoyType, JoyValue
 
 
 class TestStackOperations:
@@ -60,6 +60,25 @@ class TestStackOperations:
         assert evaluator.stack.peek(1).value == 1
         assert evaluator.stack.peek(2).value == 2
 
+    def test_rotated(self, evaluator):
+        evaluator.run("1 2 3 4 rotated")
+        # X Y Z W -> Z Y X W
+        assert [v.value for v in evaluator.stack.items()] == [3, 2, 1, 4]
+
+    def test_rollupd(self, evaluator):
+        evaluator.run("1 2 3 4 rollupd")
+        # X Y Z W -> Z X Y W
+        assert [v.value for v in evaluator.stack.items()] == [3, 1, 2, 4]
+
+    def test_rolldownd(self, evaluator):
+        evaluator.run("1 2 3 4 rolldownd")
+        # X Y Z W -> Y Z X W
+        assert [v.value for v in evaluator.stack.items()] == [2, 3, 1, 4]
+
+    def test_shuffle_leaves_lower_items(self, evaluator):
+        evaluator.run("0 1 2 3 rotate")
+        assert [v.value for v in evaluator.stack.items()] == [0, 3, 2, 1]
+
     def test_choice_true(self, evaluator):
         evaluator.run("true 10 20 choice")
         assert evaluator.stack.peek().value == 10
@@ -235,6 +254,15 @@ class TestBoolean:
         evaluator.run("false not")
         assert evaluator.stack.peek().value is True
 
+    def test_boolean_results_are_singletons(self, evaluator):
+        evaluator.run("true false and true false or false true xor true not")
+        assert evaluator.stack.items() == [FALSE, TRUE, TRUE, FALSE]
+        assert all(v is TRUE or v is FALSE for v in evaluator.stack.items())
+
+    def test_xor_booleans(self, evaluator):
+        evaluator.run("true true xor false false xor")
+        assert evaluator.stack.items() == [FALSE, FALSE]
+
     def test_and_with_integers(self, evaluator):
         evaluator.run("1 2 and")
         assert evaluator.stack.peek().value is True
@@ -341,6 +369,31 @@ class TestListOperations:
         assert result.value.terms[0].value == 3
         assert result.value.terms[2].value == 1
 
+    def test_string_reverse_concat_size(self, evaluator):
+        evaluator.run('"abc" reverse "de" concat dup size')
+        assert evaluator.stack.peek().value == 5
+        assert evaluator.stack.peek(1) == JoyValue.string("cbade")
+
+    def test_set_concat_size(self, evaluator):
+        evaluator.run("{1 2} {2 5} concat dup size")
+        assert evaluator.stack.peek().value == 3
+        assert evaluator.stack.peek(1) == JoyValue.joy_set(frozenset({1, 2, 5}))
+
+    def test_string_first_rest_at(self, evaluator):
+        evaluator.run('"hello" dup first swap rest dup 2 at')
+        assert evaluator.stack.peek() == JoyValue.char("l")
+        assert evaluator.stack.peek(1) == JoyValue.string("ello")
+        assert evaluator.stack.peek(2) == JoyValue.char("h")
+
+    def test_string_cons_uncons(self, evaluator):
+        evaluator.run('\'x "yz" cons uncons')
+        assert evaluator.stack.peek() == JoyValue.string("yz")
+        assert evaluator.stack.peek(1) == JoyValue.char("x")
+
+    def test_string_concat_list(self, evaluator):
+        evaluator.run("\"ab\" ['c'] concat")
+        assert evaluator.stack.peek() == JoyValue.string("abc")
+
     def test_at(self, evaluator):
         evaluator.run("[10 20 30] 1 at")
         assert evaluator.stack.peek().value == 20
@@ -387,6 +440,15 @@ class TestTypePredicates:
         evaluator.run("42 logical")
         assert evaluator.stack.peek().value is False
 
+    def test_predicates_share_results(self, evaluator):
+        """Predicates and typeof push shared values rather than new ones."""
+        evaluator.run("42 integer 'a set [] leaf 42 typeof 1.5 typeof")
+        items = evaluator.stack.items()
+        assert items[:3] == [TRUE, FALSE, FALSE]
+        assert all(v is TRUE or v is FALSE for v in items[:3])
+        assert items[3] is JoyValue.integer(6)
+        assert items[4] is JoyValue.integer(10)
+
 
 class TestComplexExpressions:
     """Tests for complex expressions combining multiple primitives."""
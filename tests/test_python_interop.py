@@ -124,6 +124,29 @@ class TestEvaluatorPythonInterop:
         # Variable is set in namespace
         assert ev.python_globals["x"] == 42
 
+    def test_compiled_code_is_shared_between_evaluators(self):
+        """Expressions keep their own namespace when compiled code is reused."""
+        first = Evaluator(strict=False)
+        second = Evaluator(strict=False)
+        first.run("!x = 1")
+        second.run("!x = 2")
+        first.run("`x * 10`")
+        second.run("`x * 10`")
+        assert first.stack.pop() == 10
+        assert second.stack.pop() == 20
+
+    def test_interop_terms_compile_to_steps(self):
+        """Interop terms are bound at compile time like primitives."""
+        from pyjoy.evaluator.core import OP_TERM
+
+        ev = Evaluator(strict=False)
+        program = Parser(python_interop=True).parse("`1 + 1` dup\n!y = 3")
+        ev.execute(program)
+        assert all(op != OP_TERM for op, _ in program._code)
+        assert ev.stack.pop() == 2
+        assert ev.stack.pop() == 2
+        assert ev.python_globals["y"] == 3
+
     def test_math_module_available(self):
         """Math module is pre-imported in pythonic mode."""
         ev = Evaluator(strict=False)
@@ -8,6 +8,8 @@ These tests verify the Phase 1 merger infrastructure:
 - OBJECT type in JoyType
 """
 
+import math
+
 import pytest
 
 from pyjoy.evaluator import Evaluator
@@ -103,6 +105,16 @@ class TestJoyStackProtocol:
         stack = JoyStack()
         assert isinstance(stack, StackProtocol)
 
+    def test_incomplete_stack_rejected(self):
+        """A subclass missing abstract methods cannot be instantiated."""
+
+        class PartialStack(StackProtocol):
+            def push(self, value):
+                pass
+
+        with pytest.raises(TypeError):
+            PartialStack()
+
 
 class TestExecutionContextModes:
     """Tests for ExecutionContext with different modes."""
@@ -179,10 +191,92 @@ class TestEvaluatorModes:
         ev = Evaluator(strict=False)
         ev.run("2 3 +")
         result = ev.ctx.stack.pop()
-        # In pythonic mode, the result is still a JoyValue
-        # because primitives return JoyValue
-        assert isinstance(result, JoyValue)
-        assert result.value == 5
+        # In pythonic mode, arithmetic pushes the raw number
+        assert result == 5
+        assert type(result) is int
+
+    def test_arithmetic_results_are_raw_pythonic(self):
+        """Float and mixed results are raw numbers in pythonic mode."""
+        ev = Evaluator(strict=False)
+        ev.run("7 2 / 1.5 * 10 rem neg abs")
+        assert ev.ctx.stack.pop() == 4.5
+        ev.run("'a 1 + 5 max")
+        assert ev.ctx.stack.pop() == 98
+
+    def test_integral_float_results_become_integers(self):
+        """Integral float results are ints in both modes."""
+        for strict in (True, False):
+            ev = Evaluator(strict=strict)
+            ev.run("2.5 2 * dup integer 3.0 1.5 -")
+            result = [v.value if strict else v for v in ev.ctx.stack.items()]
+            assert result == [5, True, 1.5]
+            assert type(result[0]) is int
+
+    def test_float_edge_results_match_strict(self):
+        """-0.0 becomes 0 while inf and nan stay floats, in both modes."""
+        for strict in (True, False):
+            ev = Evaluator(strict=strict)
+            ev.run("0.0 neg  1.0e308 10 *  1.0e308 -10 *  1.0e308 10 * dup -")
+            result = [v.value if strict else v for v in ev.ctx.stack.items()]
+            zero, inf, neg_inf, nan = result
+            assert zero == 0
+            assert type(zero) is int
+            assert inf == math.inf
+            assert neg_inf == -math.inf
+            assert math.isnan(nan)
+
+    @pytest.mark.parametrize(
+        "source, expected",
+        [
+            ("0 sin", [0.0]),
+            ("4 sqrt", [2.0]),
+            ("2 10 pow", [1024.0]),
+            ("1 0 atan2", [math.pi / 2]),
+            ("2.5 floor", [2.0]),
+            ("8 frexp", [0.5, 4]),
+            ("3 2 ldexp", [12.0]),
+            ("2.5 modf", [0.5, 2.0]),
+        ],
+    )
+    def test_math_results_are_raw_pythonic(self, source, expected):
+        """Math functions push raw floats in pythonic mode."""
+        ev = Evaluator(strict=False)
+        ev.run(source)
+        result = ev.ctx.stack.items()
+        assert result == expected
+        assert [type(v) for v in result] == [type(v) for v in expected]
+
+    def test_math_results_stay_boxed_strict(self):
+        """Math functions still push FLOAT JoyValues in strict mode."""
+        ev = Evaluator(strict=True)
+        ev.run("4 sqrt 2.5 floor")
+        assert ev.ctx.stack.items() == [JoyValue.floating(2.0)] * 2
+        assert all(v.type is JoyType.FLOAT for v in ev.ctx.stack.items())
+
+    def test_integer_comparisons_push_raw_bools_pythonic(self):
+        """Comparing boxed integers pushes raw bools in pythonic mode."""
+        ev = Evaluator(strict=False)
+        ev.run("maxint maxint <  [3] first [3] first !=  [3] first [3] first =")
+        ev.run("[2] first [3] first >=")
+        assert ev.ctx.stack.items() == [False, False, True, False]
+        assert all(type(v) is bool for v in ev.ctx.stack.items())
+
+    @pytest.mark.parametrize(
+        "source, expected",
+        [
+            ("[true] first [false] first and", False),
+            ("[true] first [false] first or", True),
+            ("[true] first [true] first xor", False),
+            ("[true] first not", False),
+        ],
+    )
+    def test_logic_on_boxed_booleans_pythonic(self, source, expected):
+        """Logic words push raw bools for boxed booleans in pythonic mode."""
+        ev = Evaluator(strict=False)
+        ev.run(source)
+        result = ev.ctx.stack.pop()
+        assert type(result) is bool
+        assert result is expected
 
 
 class TestObjectType:
@@ -227,3 +227,23 @@ class TestRecursionExamples:
         assert primrec_sum == 15
         assert linrec_sum == 15
         assert tailrec_sum == 15
+
+
+class TestTailCalls:
+    """Tests for tail calls between user definitions."""
+
+    def test_long_definition_chain(self, evaluator):
+        """A word ending in another word does not grow the Python stack."""
+        evaluator.run("DEFINE w0 == 42 .")
+        for i in range(1, 5000):
+            evaluator.run(f"DEFINE w{i} == w{i - 1} .")
+        evaluator.run("w4999")
+        assert evaluator.stack.peek().value == 42
+
+    def test_tail_call_to_undefined_word(self, evaluator):
+        """A tail call to an unknown word still pushes it as a symbol."""
+        evaluator.undeferror = False
+        evaluator.run("DEFINE t == 1 nowhere .")
+        evaluator.run("t")
+        assert evaluator.stack.peek().type == JoyType.SYMBOL
+        assert evaluator.stack.peek(1).value == 1
@@ -0,0 +1,110 @@
+"""
+Tests for pyjoy.repl line handling.
+"""
+
+import pytest
+
+from pyjoy.repl import REPL
+
+
+def feed(repl, *lines):
+    """Process each line as if typed at the prompt."""
+    for line in lines:
+        repl._process_line(line)
+
+
+class TestPythonBlocks:
+    """Tests for multi-line Python blocks in pythonic mode."""
+
+    def test_incomplete_def_waits_for_body(self, capsys):
+        repl = REPL(strict=False)
+        feed(repl, "def f(x):")
+        assert repl.pending_lines == ["def f(x):"]
+        assert capsys.readouterr().out == ""
+
+    def test_complete_def_runs(self, capsys):
+        repl = REPL(strict=False)
+        feed(repl, "def f(x):", "    return x + 1")
+        assert repl.pending_lines == []
+        assert capsys.readouterr().out == "  OK\n"
+        assert repl.evaluator.python_globals["f"](1) == 2
+
+    def test_if_block_runs_when_complete(self, capsys):
+        repl = REPL(strict=False)
+        feed(repl, "if True:", "    y = (1,")
+        assert repl.pending_lines == ["if True:", "    y = (1,"]
+        feed(repl, "         2)")
+        assert repl.pending_lines == []
+        assert capsys.readouterr().out == "  OK\n"
+        assert repl.evaluator.python_globals["y"] == (1, 2)
+
+    def test_blank_line_ends_pending_block(self, capsys):
+        repl = REPL(strict=False)
+        feed(repl, "if True:", "")
+        assert repl.pending_lines == []
+        assert capsys.readouterr().out.startswith("  Error:")
+
+    def test_syntax_error_in_block_is_reported(self, capsys):
+        repl = REPL(strict=False)
+        feed(repl, "def g():", "    return )")
+        assert repl.pending_lines == []
+        assert capsys.readouterr().out.startswith("  Error:")
+        assert "g" not in repl.evaluator.python_globals
+
+    def test_same_block_twice(self, capsys):
+        repl = REPL(strict=False)
+        feed(repl, "def f(x):", "    return x")
+        feed(repl, "def f(x):", "    return x * 2")
+        assert repl.evaluator.python_globals["f"](3) == 6
+
+
+class TestCompletion:
+    """Tests for Tab completion of words."""
+
+    def complete_all(self, repl, text):
+        words = []
+        while (word := repl._complete(text, len(words))) is not None:
+            words.append(word)
+        return words
+
+    def test_completes_primitives(self):
+        repl = REPL()
+        words = self.complete_all(repl, "dup")
+        assert "dup" in words
+        assert "dup2" in words
+        assert all(w.startswith("dup") for w in words)
+
+    def test_completes_definitions(self):
+        repl = REPL()
+        repl.evaluator.run("DEFINE dupsquare == dup * .")
+        assert "dupsquare" in self.complete_all(repl, "dups")
+        assert self.complete_all(repl, "nosuchword") == []
+
+
+class TestHistory:
+    """Tests for the opt-in history file."""
+
+    def run_session(self, monkeypatch, repl, tty):
+        def end_of_input(prompt):
+            raise EOFError
+
+        monkeypatch.setattr("builtins.input", end_of_input)
+        monkeypatch.setattr("sys.stdin.isatty", lambda: tty)
+        repl.run()
+
+    def test_no_history_by_default(self, monkeypatch, capsys):
+        repl = REPL()
+        assert repl.history_file is None
+        assert repl._history_path() is None
+        self.run_session(monkeypatch, repl, tty=True)
+
+    def test_history_skipped_without_tty(self, monkeypatch, capsys, tmp_path):
+        history = tmp_path / "history"
+        self.run_session(monkeypatch, REPL(history_file=str(history)), tty=False)
+        assert not history.exists()
+
+    def test_history_written_for_tty(self, monkeypatch, capsys, tmp_path):
+        pytest.importorskip("readline")
+        history = tmp_path / "history"
+        self.run_session(monkeypatch, REPL(history_file=str(history)), tty=True)
+        assert history.exists()
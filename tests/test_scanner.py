@@ -2,7 +2,7 @@
 Tests for pyjoy.scanner module.
 """
 
-from pyjoy.scanner import tokenize
+from pyjoy.scanner import Scanner, tokenize
 
 
 class TestScanner:
@@ -131,6 +131,19 @@ class TestScanner:
         assert tokens[0].column == 0
         assert tokens[1].column == 4
 
+    def test_lone_integer(self):
+        for source, value in (("7", 7), ("-12", -12)):
+            tokens = Scanner().scan(source)
+            assert [(t.type, t.value, t.line, t.column) for t in tokens] == [
+                ("INTEGER", value, 1, 0)
+            ]
+        assert [t.type for t in tokenize("-")] == ["SYMBOL"]
+        assert [t.type for t in tokenize("--5")] == ["SYMBOL", "INTEGER"]
+
+    def test_position_after_multiline_token(self):
+        tokens = list(tokenize('  "a\nbc"  x\n\n   y'))
+        assert [(t.line, t.column) for t in tokens] == [(1, 2), (2, 5), (4, 3)]
+
     def test_complex_expression(self):
         source = "[1 2 3] [dup *] map"
         tokens = list(tokenize(source))
@@ -147,3 +160,16 @@ class TestScanner:
             "RBRACKET",
             "SYMBOL",
         ]
+
+    def test_scan_returns_list(self):
+        source = "1 (* one *)\n[dup] # line\n."
+        tokens = Scanner().scan(source)
+        assert isinstance(tokens, list)
+        assert tokens == list(tokenize(source))
+        assert [(t.type, t.line) for t in tokens] == [
+            ("INTEGER", 1),
+            ("LBRACKET", 2),
+            ("SYMBOL", 2),
+            ("RBRACKET", 2),
+            ("PERIOD", 3),
+        ]
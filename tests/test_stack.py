@@ -64,6 +64,12 @@ class TestJoyStack:
         assert result[1].value == 2
         assert stack.depth == 1
 
+    def test_pop_n_all(self, stack):
+        stack.push_many(1, 2, 3)
+        result = stack.pop_n(3)
+        assert [v.value for v in result] == [3, 2, 1]
+        assert stack.is_empty()
+
     def test_pop_n_empty(self, stack):
         result = stack.pop_n(0)
         assert result == ()
@@ -73,6 +79,18 @@ class TestJoyStack:
         with pytest.raises(JoyStackUnderflow):
             stack.pop_n(2)
 
+    def test_pop2(self, stack):
+        stack.push_many(1, 2, 3)
+        b, a = stack.pop2()
+        assert (b.value, a.value) == (3, 2)
+        assert stack.depth == 1
+
+    def test_pop2_underflow(self, stack):
+        stack.push(1)
+        with pytest.raises(JoyStackUnderflow):
+            stack.pop2()
+        assert stack.depth == 1
+
     def test_push_many(self, stack):
         stack.push_many(1, 2, 3)
         assert stack.depth == 3
@@ -102,6 +120,11 @@ class TestJoyStack:
         assert items[0].value == 1  # Bottom
         assert items[1].value == 2  # Top
 
+    def test_iter_items(self, stack):
+        stack.push(1)
+        stack.push(2)
+        assert [v.value for v in stack.iter_items()] == [1, 2]
+
     def test_len(self, stack):
         assert len(stack) == 0
         stack.push(1)
@@ -126,6 +149,15 @@ class TestExecutionContext:
         assert ctx.stack.depth == 2
         assert ctx.stack.peek().value == 2
 
+    def test_restore_stack_twice(self, ctx):
+        ctx.stack.push(1)
+        state_id = ctx.save_stack()
+        ctx.restore_stack(state_id)
+        ctx.stack.push(2)
+        ctx.restore_stack(state_id)
+        assert ctx.stack.depth == 1
+        assert isinstance(ctx._saved_states[state_id], tuple)
+
     def test_pop_saved(self, ctx):
         ctx.stack.push(1)
         ctx.save_stack()
@@ -17,6 +17,16 @@ from pyjoy.types import (
 )
 
 
+class TestJoyType:
+    """Tests for JoyType."""
+
+    def test_hash_consistent_with_equality(self):
+        table = {t: t.name for t in JoyType}
+        for t in JoyType:
+            assert table[t] == t.name
+        assert len({JoyType.INTEGER, JoyType.INTEGER, JoyType.FLOAT}) == 2
+
+
 class TestJoyValue:
     """Tests for JoyValue creation and methods."""
 
@@ -26,6 +36,23 @@ class TestJoyValue:
         assert v.value == 42
         assert repr(v) == "42"
 
+    def test_small_integers_are_shared(self):
+        assert JoyValue.integer(7) is JoyValue.integer(7)
+        assert JoyValue.integer(-128) is JoyValue.integer(-128)
+        assert JoyValue.integer(256).value == 256
+        assert JoyValue.integer(10**20).value == 10**20
+
+    def test_values_are_frozen(self):
+        v = JoyValue(JoyType.STRING, "ab")
+        assert v == JoyValue.string("ab")
+        assert hash(v) == hash(JoyValue.string("ab"))
+        with pytest.raises(AttributeError):
+            v.value = "cd"
+
+    def test_booleans_are_shared(self):
+        assert JoyValue.boolean(True) is TRUE
+        assert JoyValue.boolean(False) is FALSE
+
     def test_negative_integer(self):
         v = JoyValue.integer(-17)
         assert v.type == JoyType.INTEGER
@@ -48,6 +75,12 @@ class TestJoyValue:
         assert v.value == "x"
         assert repr(v) == "'x'"
 
+    def test_char_ascii_shared(self):
+        assert JoyValue.char("x") is JoyValue.char("x")
+        v = JoyValue.char("é")
+        assert v.value == "é"
+        assert v == JoyValue.char("é")
+
     def test_char_invalid_length(self):
         with pytest.raises(ValueError):
             JoyValue.char("ab")
@@ -120,6 +153,19 @@ class TestJoyQuotation:
         q2 = JoyQuotation((JoyValue.integer(1),))
         assert q1 == q2
 
+    def test_quotation_terms_frozen(self):
+        q = JoyQuotation(["dup", "*"])
+        assert q.terms == ("dup", "*")
+        assert q == JoyQuotation(("dup", "*"))
+        assert hash(q) == hash(JoyQuotation(("dup", "*")))
+
+    def test_quotation_value_cached(self):
+        q = JoyQuotation(("dup", "*"))
+        v = JoyValue.quotation(q)
+        assert v.type == JoyType.QUOTATION
+        assert v.value is q
+        assert JoyValue.quotation(q) is v
+
 
 class TestPythonToJoy:
     """Tests for python_to_joy conversion."""